@@ -0,0 +1,59 @@
+"""Measure the time and memory it takes to import the library, and to start using some of its parts.
+
+Each case is measured in a new interpreter, so modules imported and models built by previous cases don't affect the
+results. The memory is the peak resident memory of the interpreter.
+
+Usage::
+
+    python -m benchmarks.import_time
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+HIGHSCORES_RESOURCE = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "resources", "highscores",
+                                   "highscores.txt")
+
+CASES = {
+    "import tibiapy": "import tibiapy",
+    "tibiapy.urls": "import tibiapy; tibiapy.urls.get_world_url('Antica')",
+    "tibiapy.models": "import tibiapy.models",
+    "CharacterParser": "from tibiapy.parsers import CharacterParser",
+    "Parse highscores": (f"from tibiapy.parsers import HighscoresParser; "
+                         f"HighscoresParser.from_content(open({HIGHSCORES_RESOURCE!r}).read())"),
+    "Build all models": ("import pydantic, tibiapy.models; [m.model_rebuild() for m in vars(tibiapy.models).values() "
+                         "if isinstance(m, type) and issubclass(m, pydantic.BaseModel)]"),
+    "tibiapy.Client": "import tibiapy; tibiapy.Client",
+    "All submodules": "import tibiapy; [getattr(tibiapy, n) for n in tibiapy.__all__]",
+}
+
+TIMER = """
+import resource, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(sys.modules), "aiohttp" in sys.modules)
+"""
+
+
+def measure(code: str) -> tuple[float, float, int, bool]:
+    """Run the code in new interpreters, getting the median seconds and KiB of peak memory, and the modules loaded."""
+    results = []
+    for _ in range(RUNS):
+        # The arguments are fixed, running this same interpreter with the code of the benchmark's own cases.
+        command = [sys.executable, "-c", TIMER.format(code=code)]
+        output = subprocess.run(command, capture_output=True, text=True, check=True).stdout.split()  # noqa: S603
+        results.append((float(output[0]), int(output[1]), int(output[2]), output[3] == "True"))
+
+    *_, modules, aiohttp_loaded = results[-1]
+    return (statistics.median(r[0] for r in results), statistics.median(r[1] for r in results), modules,
+            aiohttp_loaded)
+
+
+if __name__ == "__main__":
+    print(f"{'Case':<20}{'Time (ms)':>12}{'Memory (KiB)':>14}{'Modules':>10}{'aiohttp':>10}")
+    for name, code in CASES.items():
+        elapsed, memory, modules, aiohttp_loaded = measure(code)
+        print(f"{name:<20}{elapsed * 1000:>12.1f}{memory:>14.0f}{modules:>10}{aiohttp_loaded!s:>10}")
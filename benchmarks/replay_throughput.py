@@ -0,0 +1,91 @@
+"""Measure the throughput of the client when replaying recorded responses.
+
+An archive is recorded from the test resources, and then replayed concurrently, so the measurement only includes the
+client's overhead and parsing.
+
+Usage::
+
+    python -m benchmarks.replay_throughput [archive]
+
+If an archive created with :class:`tibiapy.RecordingTransport` is passed, its requests are replayed instead.
+"""
+import asyncio
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Optional
+
+from multidict import CIMultiDict
+
+from tibiapy import Client, RecordingTransport, ReplayTransport, Transport, TransportResponse
+from tibiapy.urls import get_highscores_url, get_kill_statistics_url, get_world_url
+
+RESOURCES_PATH = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "resources")
+RESOURCES = {
+    get_world_url("Gladera"): "world/worldOnline.txt",
+    get_highscores_url(): "highscores/highscores.txt",
+    get_kill_statistics_url("Gladera"): "killStatistics/killStatisticsWithResults.txt",
+}
+REQUESTS = 500
+CONCURRENCY = 50
+
+
+class ResourceTransport(Transport):
+    """Serves the test resources as responses."""
+
+    async def request(  # noqa: D102
+            self,
+            session: Any,  # noqa: ARG002
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]] = None,  # noqa: ARG002
+            headers: Optional[dict[str, Any]] = None,  # noqa: ARG002
+    ) -> TransportResponse:
+        with open(os.path.join(RESOURCES_PATH, RESOURCES[url]), encoding="utf-8") as f:
+            return TransportResponse(url, method=method, status=200, reason="OK", headers=CIMultiDict(),
+                                     content=f.read())
+
+
+async def record(path: str) -> None:
+    """Record the test resources into an archive."""
+    transport = RecordingTransport(path, ResourceTransport())
+    client = Client(transport=transport)
+    for url in RESOURCES:
+        await client._request("GET", url)
+
+    await client.session.close()
+    transport.save()
+
+
+async def replay(path: str) -> None:
+    """Replay the requests in the archive concurrently, printing the throughput."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        urls = [json.loads(line)["url"] for line in f]
+
+    client = Client(transport=ReplayTransport(path), max_concurrent_requests=CONCURRENCY)
+    await client._session_ready.wait()
+    start = time.perf_counter()
+    await asyncio.gather(*(client._request("GET", urls[i % len(urls)]) for i in range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    await client.session.close()
+    print(f"{REQUESTS} requests in {elapsed:.3f}s ({REQUESTS / elapsed:,.0f} requests/s, without parsing)")
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    if len(sys.argv) > 1:
+        await replay(sys.argv[1])
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "archive.jsonl.gz")
+        await record(path)
+        print(f"Archive size: {os.path.getsize(path):,} bytes")
+        await replay(path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,65 @@
+"""Measure the memory used per entry by full models and compact rows.
+
+Usage::
+
+    python -m benchmarks.rows_memory
+"""
+import datetime
+import tracemalloc
+from typing import Any, Callable
+
+from tibiapy.enums import Vocation
+from tibiapy.models import (
+    GuildMember,
+    GuildMemberRow,
+    HighscoresEntry,
+    HighscoresRow,
+    OnlineCharacter,
+    OnlineCharacterRow,
+    RaceEntry,
+    RaceRow,
+)
+
+COUNT = 100_000
+
+
+def measure(factory: Callable[[int], Any]) -> float:
+    """Get the average number of bytes allocated per object created by the factory."""
+    tracemalloc.start()
+    items = [factory(i) for i in range(COUNT)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size / COUNT
+
+
+CASES = {
+    "HighscoresEntry": (
+        lambda i: HighscoresEntry(rank=i, name=f"Character {i}", vocation=Vocation.KNIGHT, world="Antica",
+                                  level=i, value=i * 1000),
+        lambda i: HighscoresRow(i, f"Character {i}", Vocation.KNIGHT, "Antica", i, i * 1000),
+    ),
+    "OnlineCharacter": (
+        lambda i: OnlineCharacter(name=f"Character {i}", level=i, vocation=Vocation.KNIGHT),
+        lambda i: OnlineCharacterRow(f"Character {i}", i, Vocation.KNIGHT),
+    ),
+    "GuildMember": (
+        lambda i: GuildMember(name=f"Character {i}", rank="Member", title=None, level=i, vocation=Vocation.KNIGHT,
+                              joined_on=datetime.date(2024, 1, 1), is_online=False),
+        lambda i: GuildMemberRow(f"Character {i}", "Member", None, i, Vocation.KNIGHT, datetime.date(2024, 1, 1),
+                                 False),
+    ),
+    "RaceEntry": (
+        lambda i: RaceEntry(last_day_killed=i, last_day_players_killed=i, last_week_killed=i,
+                            last_week_players_killed=i),
+        lambda i: RaceRow(i, i, i, i),
+    ),
+}
+
+
+if __name__ == "__main__":
+    print(f"{'Model':<20}{'Model (bytes/row)':>20}{'Row (bytes/row)':>20}{'Ratio':>10}")
+    for name, (model_factory, row_factory) in CASES.items():
+        model_size = measure(model_factory)
+        row_size = measure(row_factory)
+        print(f"{name:<20}{model_size:>20.0f}{row_size:>20.0f}{model_size / row_size:>10.1f}")
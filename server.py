@@ -1,13 +1,34 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import datetime
+import hashlib
+import heapq
+import json
 import logging
+import os
+import time
+import urllib.parse
+import zlib
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Hashable
 from contextlib import asynccontextmanager
-from typing import Annotated, Optional, TypeVar
+from typing import Annotated, Any, Callable, Optional, TypeVar
 
 import uvicorn
-from fastapi import Depends, FastAPI, Path, Query, Response
+from fastapi import Body, Depends, FastAPI, HTTPException, Path, Query, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
 from starlette import status
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 import tibiapy
 from tibiapy.enums import (
@@ -35,6 +56,7 @@ from tibiapy.models import (
     Auction,
     AuctionFilters,
     BoostableBosses,
+    BoostedCreatures,
     BossEntry,
     Character,
     CharacterBazaar,
@@ -56,6 +78,7 @@ from tibiapy.models import (
     Leaderboard,
     News,
     NewsArchive,
+    Paginated,
     Spell,
     SpellsSection,
     TibiaResponse,
@@ -63,6 +86,11 @@ from tibiapy.models import (
     WorldOverview,
 )
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
 logging_formatter = logging.Formatter("[%(asctime)s][%(levelname)s] %(message)s")
 console_handler = logging.StreamHandler()
 console_handler.setFormatter(logging_formatter)
@@ -73,9 +101,20 @@ log.setLevel(logging.DEBUG)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.client = tibiapy.Client()
+    cache = create_cache_backend(CACHE_URL)
+    app.state.client = create_client(cache)
+    app.state.refresher = Refresher()
+    app.state.channels = {}
+    refresh_task = asyncio.create_task(app.state.refresher.run())
+    lag_task = asyncio.create_task(monitor_event_loop_lag())
     yield
+    refresh_task.cancel()
+    lag_task.cancel()
+    for channel in list(app.state.channels.values()):
+        channel.close()
+
     await app.state.client.session.close()
+    await cache.close()
 
 
 app = FastAPI(
@@ -88,18 +127,534 @@ T = TypeVar("T")
 
 
 def handle_response(response: Response, body: T) -> T:
-    """Change the status code to 404 if no data is returned in the response."""
+    """Change the status code to 404 if no data is returned in the response, and set its caching headers."""
     if isinstance(body, TibiaResponse) and body.data is None:
         response.status_code = status.HTTP_404_NOT_FOUND
 
+    return cache_response(response, body)
+
+
+def cache_response(response: Response, body: T) -> T:
+    """Set the caching headers of the response, or reply with a 304 status if the client already has its data.
+
+    The ETag is calculated from the data only, so it doesn't change when the same page is fetched again.
+    The max age and age are taken from Tibia.com's cache, so clients and proxies won't ask again before it expires.
+    """
+    if not isinstance(body, TibiaResponse):
+        return body
+
+    if not app.state.refresher.is_cached(body):
+        observe_parsing(body)
+
+    age = body.age + (datetime.datetime.now(datetime.timezone.utc) - body.timestamp).total_seconds()
+    etag = app.state.refresher.etag(body)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max(0, int(body.time_left.total_seconds()))}",
+        "Age": str(max(0, int(age))),
+    }
+    if_none_match = request_if_none_match.get()
+    if response.status_code in {None, status.HTTP_200_OK} and if_none_match and etag_matches(etag, if_none_match):
+        # Raised, so the body is not serialized for nothing.
+        raise HTTPException(status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return body
 
 
+def response_etag(body: TibiaResponse) -> str:
+    """Calculate the ETag of a response, from its data only."""
+    data = body.model_dump_json(include={"data"}, by_alias=True)
+    return f'"{hashlib.sha1(data.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check if an ETag is listed in an If-None-Match header.
+
+    The weak comparison is used, so tags only marked as weak (``W/``) by a proxy still match.
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+# The If-None-Match header of the request being handled.
+request_if_none_match: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "request_if_none_match", default=None,
+)
+
+
+@app.middleware("http")
+async def conditional_response(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """Make the If-None-Match header of the request available to :func:`cache_response`."""
+    token = request_if_none_match.set(request.headers.get("If-None-Match"))
+    try:
+        return await call_next(request)
+    finally:
+        request_if_none_match.reset(token)
+
+
+COMPRESSION_MINIMUM_SIZE = 1024
+COMPRESSION_GZIP_LEVEL = 6
+COMPRESSION_BROTLI_QUALITY = 5
+COMPRESSION_CACHE_SIZE = 256
+
+
+class CompressionMiddleware:
+    """Compress response bodies with brotli or gzip, depending on what the client accepts.
+
+    Bodies with a known length are compressed as a whole, unless they are smaller than ``minimum_size``. Their
+    compressed versions are kept in a LRU cache, indexed by the digest of the body and the encoding, so sending the same
+    body again doesn't compress it again. Streamed bodies are compressed chunk by chunk, flushing after every chunk.
+
+    The ETag of compressed responses is marked as weak, as their bytes differ from the uncompressed ones.
+
+    Brotli is only used if the ``brotli`` package is installed.
+    """
+
+    def __init__(
+            self,
+            app: ASGIApp,
+            *,
+            minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+            gzip_level: int = COMPRESSION_GZIP_LEVEL,
+            brotli_quality: int = COMPRESSION_BROTLI_QUALITY,
+            cache_size: int = COMPRESSION_CACHE_SIZE,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[bytes, str], bytes] = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle a request, compressing its response if possible."""
+        request_headers = Headers(scope=scope) if scope["type"] == "http" else None
+        encoding = self.negotiate(request_headers.get("Accept-Encoding", "")) if request_headers is not None else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Optional[Message] = None
+        buffer = bytearray()
+        compressor = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor
+            if message["type"] == "http.response.start":
+                start = message
+                if start["status"] == status.HTTP_304_NOT_MODIFIED:
+                    # Keep the tag the client has, which is weak if the body it got was compressed.
+                    headers = MutableHeaders(raw=start["headers"])
+                    etag = headers.get("ETag")
+                    if etag and f"W/{etag}" in request_headers.get("If-None-Match", ""):
+                        headers["ETag"] = f"W/{etag}"
+
+                return
+
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=start["headers"])
+            if compressor is None:
+                if "Content-Encoding" in headers:
+                    await send(start)
+                    await send(message)
+                    start = None
+                    return
+
+                # Bodies with a known length are complete, even if they are sent in several parts.
+                if not more_body or "Content-Length" in headers:
+                    buffer.extend(body)
+                    if more_body:
+                        return
+
+                    body = bytes(buffer)
+                    if len(body) >= self.minimum_size:
+                        body = self.compress(body, encoding)
+                        self._set_encoding(headers, encoding)
+                        headers["Content-Length"] = str(len(body))
+
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    start = None
+                    return
+
+                self._set_encoding(headers, encoding)
+                compressor = self._compressor(encoding)
+                await send(start)
+
+            await send({"type": "http.response.body", "body": compressor(body, more_body), "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+    def negotiate(self, accept_encoding: str) -> Optional[str]:
+        """Choose the best encoding supported by both the client and the server."""
+        accepted = {}
+        for item in accept_encoding.split(","):
+            name, _, params = item.strip().partition(";")
+            quality = 1.0
+            if params.strip().startswith("q="):
+                try:
+                    quality = float(params.strip()[2:])
+                except ValueError:
+                    continue
+
+            accepted[name.strip().lower()] = quality
+
+        supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+        candidates = [e for e in supported if accepted.get(e, accepted.get("*", 0)) > 0]
+        return max(candidates, key=lambda e: accepted.get(e, accepted.get("*", 0)), default=None)
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        """Compress a complete body, reusing a previous result if the same body was compressed before."""
+        key = (hashlib.sha1(body, usedforsecurity=False).digest(), encoding)
+        compressed = self._cache.get(key)
+        if compressed is not None:
+            self._cache.move_to_end(key)
+            return compressed
+
+        compressor = self._compressor(encoding)
+        compressed = compressor(body, False)
+        self._cache[key] = compressed
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return compressed
+
+    @staticmethod
+    def _set_encoding(headers: MutableHeaders, encoding: str) -> None:
+        headers["Content-Encoding"] = encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    def _compressor(self, encoding: str) -> Callable[[bytes, bool], bytes]:
+        if encoding == "br":
+            br = brotli.Compressor(quality=self.brotli_quality)
+            return lambda data, more: br.process(data) + (br.flush() if more else br.finish())
+
+        gz = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+        return lambda data, more: gz.compress(data) + gz.flush(zlib.Z_SYNC_FLUSH if more else zlib.Z_FINISH)
+
+
+app.add_middleware(CompressionMiddleware)
+
+
+# Where raw pages are cached, so multiple workers share them: memory://, sqlite:///path/to/file.db or redis://host/0.
+CACHE_URL = os.environ.get("TIBIAPY_CACHE_URL", "memory://")
+
+
+def create_cache_backend(url: str) -> tibiapy.CacheBackend:
+    """Create the cache backend described by a URL."""
+    scheme, _, location = url.partition("://")
+    if scheme == "memory":
+        return tibiapy.MemoryCache()
+
+    if scheme == "sqlite":
+        return tibiapy.SQLiteCache(location.removeprefix("/"))
+
+    if scheme in {"redis", "rediss"}:
+        return tibiapy.RedisCache.from_url(url)
+
+    raise ValueError(f"unsupported cache URL: {url}")
+
+
+def create_client(cache: tibiapy.CacheBackend) -> tibiapy.Client:
+    """Create the client used to fetch from Tibia.com, sharing the pages it fetches through the cache."""
+    return tibiapy.Client(transport=tibiapy.CachingTransport(cache, MetricsTransport()))
+
+
+REFRESH_TOP = 20
+REFRESH_BUDGET = 0.5
+REFRESH_MARGIN = 10.0
+REFRESH_INTERVAL = 1.0
+REFRESH_DECAY_PERIOD = 300.0
+REFRESH_MAX_ENTRIES = 1000
+
+
+class _RefreshEntry:
+    __slots__ = ("expires", "fetch", "fetched", "hits", "response")
+
+    def __init__(self, fetch: Callable[[], Awaitable[TibiaResponse]]):
+        self.fetch = fetch
+        self.response: Optional[TibiaResponse] = None
+        self.expires = 0.0
+        self.fetched = 0.0
+        self.hits = 0.0
+
+
+class Refresher:
+    """Cache the responses of the most requested resources, and fetch them again in the background before they expire.
+
+    Requests are counted per key, and the counts are halved every ``decay_period`` seconds, so the ranking follows the
+    recent traffic. Every ``interval`` seconds, the ``top`` keys whose response expires in less than ``margin`` seconds
+    are fetched again, as long as the ``budget`` of upstream requests per second allows it.
+
+    Responses are kept until Tibia.com's cache for them expires, along with their ETag, so it is only calculated once.
+    Concurrent requests for an expired key share a single upstream request.
+    """
+
+    def __init__(
+            self,
+            *,
+            top: int = REFRESH_TOP,
+            budget: float = REFRESH_BUDGET,
+            margin: float = REFRESH_MARGIN,
+            interval: float = REFRESH_INTERVAL,
+            decay_period: float = REFRESH_DECAY_PERIOD,
+            max_entries: int = REFRESH_MAX_ENTRIES,
+    ):
+        self.top = top
+        self.budget = budget
+        self.margin = margin
+        self.interval = interval
+        self.decay_period = decay_period
+        self.max_entries = max_entries
+        self._entries: dict[Hashable, _RefreshEntry] = {}
+        self._pending: dict[Hashable, asyncio.Future] = {}
+        self._etags: dict[int, str] = {}
+        self._tokens = 0.0
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[TibiaResponse[T]]]) -> TibiaResponse[T]:
+        """Get the response for a key, from the cache if it hasn't expired, or by fetching it otherwise."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._evict()
+            entry = self._entries[key] = _RefreshEntry(fetch)
+
+        entry.hits += 1
+        if entry.response is not None and entry.expires > time.monotonic():
+            CACHE_REQUESTS.labels("hit").inc()
+            return entry.response
+
+        CACHE_REQUESTS.labels("miss").inc()
+        task = self._pending.get(key) or self._start(key, entry)
+        return await asyncio.shield(task)
+
+    def is_cached(self, response: TibiaResponse) -> bool:
+        """Check whether a response is one of the responses stored in the cache."""
+        return id(response) in self._etags
+
+    def etag(self, response: TibiaResponse) -> str:
+        """Get the ETag of a response, which is only calculated once for the responses stored in the cache."""
+        etag = self._etags.get(id(response))
+        return etag if etag is not None else response_etag(response)
+
+    def hot_keys(self) -> list[Hashable]:
+        """Get the most requested keys, in descending order."""
+        return heapq.nlargest(self.top, self._entries, key=lambda k: self._entries[k].hits)
+
+    async def run(self) -> None:
+        """Refresh the most requested keys before they expire, until cancelled."""
+        last_update = last_decay = time.monotonic()
+        while True:
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - last_update) * self.budget, max(1.0, self.budget))
+            last_update = now
+            if now - last_decay >= self.decay_period:
+                last_decay = now
+                for entry in self._entries.values():
+                    entry.hits /= 2
+
+            for key in self.hot_keys():
+                if self._tokens < 1:
+                    break
+
+                entry = self._entries[key]
+                if (entry.response is None or key in self._pending or entry.expires - now > self.margin
+                        or now - entry.fetched < self.margin):
+                    continue
+
+                self._tokens -= 1
+                # The shared cache would return the same response that is about to expire, so it's requested again.
+                with tibiapy.CachingTransport.refreshing():
+                    self._start(key, entry)
+
+    def _start(self, key: Hashable, entry: _RefreshEntry) -> asyncio.Future:
+        task = self._pending[key] = asyncio.ensure_future(self._fetch(key, entry))
+        task.add_done_callback(self._log_failure)
+        return task
+
+    async def _fetch(self, key: Hashable, entry: _RefreshEntry) -> TibiaResponse:
+        try:
+            response = await entry.fetch()
+        finally:
+            self._pending.pop(key, None)
+
+        observe_parsing(response)
+        self._replace(entry, response)
+        entry.fetched = time.monotonic()
+        entry.expires = entry.fetched + max(0.0, response.time_left.total_seconds())
+        return response
+
+    def _evict(self) -> None:
+        if len(self._entries) < self.max_entries:
+            return
+
+        key = min((k for k in self._entries if k not in self._pending), key=lambda k: self._entries[k].hits,
+                  default=None)
+        if key is not None:
+            self._replace(self._entries.pop(key), None)
+
+    def _replace(self, entry: _RefreshEntry, response: Optional[TibiaResponse]) -> None:
+        if entry.response is not None:
+            self._etags.pop(id(entry.response), None)
+
+        if response is not None:
+            self._etags[id(response)] = response_etag(response)
+
+        entry.response = response
+
+    @staticmethod
+    def _log_failure(task: asyncio.Future) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            log.warning("Failed to refresh response: %s", task.exception())
+
+
+EVENT_LOOP_LAG_INTERVAL = 0.5
+
+REQUESTS = Counter("tibiapy_requests_total", "Requests handled, by route.", ["route", "method", "status"])
+REQUEST_DURATION = Histogram("tibiapy_request_duration_seconds", "Time taken to handle requests, by route.", ["route"])
+CACHE_REQUESTS = Counter("tibiapy_cache_requests_total", "Lookups in the response cache, by result.", ["result"])
+UPSTREAM_IN_FLIGHT = Gauge("tibiapy_upstream_requests_in_flight", "Requests to Tibia.com waiting for a response.")
+UPSTREAM_REQUESTS = Counter("tibiapy_upstream_requests_total", "Requests to Tibia.com, by result.", ["result"])
+UPSTREAM_FETCHING_TIME = Histogram("tibiapy_upstream_fetching_seconds", "Time taken by Tibia.com to respond.")
+UPSTREAM_PARSING_TIME = Histogram(
+    "tibiapy_upstream_parsing_seconds", "Time taken to parse Tibia.com's responses, by data type.", ["data_type"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "tibiapy_event_loop_lag_seconds", "Delay of the event loop in resuming tasks.",
+    buckets=(.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1, 2.5, float("inf")),
+)
+
+
+class MetricsTransport(tibiapy.LiveTransport):
+    """A live transport that records the number, results and duration of the requests to Tibia.com."""
+
+    async def request(self, *args: Any, **kwargs: Any) -> tibiapy.TransportResponse:  # noqa: D102
+        return await self._observe(super().request(*args, **kwargs))
+
+    async def stream(self, *args: Any, **kwargs: Any) -> tibiapy.TransportResponse:  # noqa: D102
+        return await self._observe(super().stream(*args, **kwargs))
+
+    @staticmethod
+    async def _observe(request: Awaitable[tibiapy.TransportResponse]) -> tibiapy.TransportResponse:
+        start = time.perf_counter()
+        UPSTREAM_IN_FLIGHT.inc()
+        try:
+            response = await request
+        except Exception:
+            UPSTREAM_REQUESTS.labels("error").inc()
+            raise
+        finally:
+            UPSTREAM_IN_FLIGHT.dec()
+
+        UPSTREAM_FETCHING_TIME.observe(time.perf_counter() - start)
+        if "maintenance.tibia.com" in response.url:
+            UPSTREAM_REQUESTS.labels("maintenance").inc()
+        elif response.status == status.HTTP_403_FORBIDDEN:
+            UPSTREAM_REQUESTS.labels("forbidden").inc()
+        else:
+            UPSTREAM_REQUESTS.labels(str(response.status)).inc()
+
+        return response
+
+
+def observe_parsing(body: TibiaResponse) -> None:
+    """Record the time it took to parse a response fetched from Tibia.com."""
+    if body.parsing_time is not None:
+        UPSTREAM_PARSING_TIME.labels(type(body.data).__name__).observe(body.parsing_time)
+
+
+async def monitor_event_loop_lag(interval: float = EVENT_LOOP_LAG_INTERVAL) -> None:
+    """Record how late the event loop wakes up a task that sleeps for a fixed interval, until cancelled."""
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, time.perf_counter() - start - interval))
+
+
+@app.middleware("http")
+async def record_metrics(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """Record the number of requests and the time taken to handle them, by route."""
+    start = time.perf_counter()
+    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        response_status = response.status_code
+    finally:
+        route = request.scope.get("route")
+        path = getattr(route, "path", "unmatched")
+        REQUESTS.labels(path, request.method, str(response_status)).inc()
+        REQUEST_DURATION.labels(path).observe(time.perf_counter() - start)
+
+    return response
+
+
+NDJSON_RESPONSES = {200: {"content": {"application/x-ndjson": {}}, "description": "One JSON entry per line."}}
+
+
+async def stream_pages(
+        fetch: Callable[[int], Awaitable[TibiaResponse[Optional[Paginated]]]],
+) -> Response:
+    """Stream the entries of every page of a paginated resource, as newline-delimited JSON.
+
+    The first page is fetched before responding, so a 404 can be returned if it doesn't exist. Each following page is
+    fetched while the entries of the previous one are being sent, keeping at most two pages in memory.
+    """
+    first_response = await fetch(1)
+    observe_parsing(first_response)
+    if first_response.data is None:
+        return JSONResponse({"detail": "Not Found"}, status_code=status.HTTP_404_NOT_FOUND)
+
+    async def entries() -> AsyncIterator[bytes]:
+        response = first_response
+        next_page = None
+        page = 1
+        try:
+            while True:
+                # The requested page is used, so a page showing the wrong number can't make it fetch the same one again.
+                if page < response.data.total_pages:
+                    page += 1
+                    next_page = asyncio.ensure_future(fetch(page))
+
+                for entry in response.data.entries:
+                    yield entry.model_dump_json(by_alias=True).encode() + b"\n"
+
+                if next_page is None:
+                    break
+
+                response = await next_page
+                next_page = None
+                observe_parsing(response)
+                if response.data is None:
+                    break
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    return StreamingResponse(entries(), media_type="application/x-ndjson")
+
+
 @app.get("/healthcheck", tags=["General"])
 async def healthcheck() -> bool:
     return True
 
 
+@app.get("/metrics", tags=["General"], response_class=Response, responses={200: {"content": {CONTENT_TYPE_LATEST: {}}}})
+async def get_metrics() -> Response:
+    """Get the server's metrics, in Prometheus' text format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 # region News
 
 FROM_DESCRIPTION = "Only show articles published on this date or after."
@@ -152,18 +707,19 @@ async def get_news_archive_by_days(
 
 
 @app.get("/events/", tags=["News"])
-async def get_current_events_schedule() -> TibiaResponse[EventSchedule]:
+async def get_current_events_schedule(response: Response) -> TibiaResponse[EventSchedule]:
     """Get the event calendar for the current month."""
-    return await app.state.client.fetch_event_schedule()
+    return cache_response(response, await app.state.client.fetch_event_schedule())
 
 
 @app.get("/events/{year}/{month}", tags=["News"])
 async def get_events_schedule(
+        response: Response,
         year: int = Path(...),
         month: int = Path(..., ge=1, le=12),
 ) -> TibiaResponse[EventSchedule]:
     """Get the event calendar for a specific year and month."""
-    return await app.state.client.fetch_event_schedule(month, year)
+    return cache_response(response, await app.state.client.fetch_event_schedule(month, year))
 
 
 # endregion
@@ -171,28 +727,32 @@ async def get_events_schedule(
 # region Library
 
 @app.get("/creatures/boosted", tags=["Library"])
-async def get_boosted_creature() -> TibiaResponse[CreatureEntry]:
-    return await app.state.client.fetch_boosted_creature()
+async def get_boosted_creature(response: Response) -> TibiaResponse[CreatureEntry]:
+    return cache_response(response, await app.state.refresher.get(
+        ("boosted_creature",), app.state.client.fetch_boosted_creature,
+    ))
 
 
 @app.get("/bosses/boosted", tags=["Library"])
-async def get_boosted_boss() -> TibiaResponse[BossEntry]:
-    return await app.state.client.fetch_boosted_boss()
+async def get_boosted_boss(response: Response) -> TibiaResponse[BossEntry]:
+    return cache_response(response, await app.state.refresher.get(
+        ("boosted_boss",), app.state.client.fetch_boosted_boss,
+    ))
 
 
 @app.get("/library/creatures", tags=["Library"])
-async def get_creatures() -> TibiaResponse[CreaturesSection]:
-    return await app.state.client.fetch_creatures()
+async def get_creatures(response: Response) -> TibiaResponse[CreaturesSection]:
+    return cache_response(response, await app.state.client.fetch_creatures())
 
 
 @app.get("/library/creatures/{identifier}", tags=["Library"])
-async def get_creature(identifier: str = Path(...)) -> TibiaResponse[Optional[Creature]]:
-    return await app.state.client.fetch_creature(identifier)
+async def get_creature(response: Response, identifier: str = Path(...)) -> TibiaResponse[Optional[Creature]]:
+    return cache_response(response, await app.state.client.fetch_creature(identifier))
 
 
 @app.get("/library/bosses", tags=["Library"])
-async def get_bosses() -> TibiaResponse[BoostableBosses]:
-    return await app.state.client.fetch_boostable_bosses()
+async def get_bosses(response: Response) -> TibiaResponse[BoostableBosses]:
+    return cache_response(response, await app.state.client.fetch_boostable_bosses())
 
 
 @app.get("/library/spells", tags=["Library"])
@@ -237,14 +797,17 @@ async def get_spell(
 
 @app.get("/characters/{name}", tags=["Community"])
 async def get_character(
+        response: Response,
         name: str = Path(...),
 ) -> TibiaResponse[Optional[Character]]:
-    return await app.state.client.fetch_character(name)
+    return cache_response(response, await app.state.client.fetch_character(name))
 
 
 @app.get("/worlds", tags=["Community"])
 async def get_worlds(response: Response) -> TibiaResponse[WorldOverview]:
-    return handle_response(response, await app.state.client.fetch_world_overview())
+    return handle_response(response, await app.state.refresher.get(
+        ("worlds",), app.state.client.fetch_world_overview,
+    ))
 
 
 @app.get("/worlds/{name}", tags=["Community"])
@@ -252,32 +815,38 @@ async def get_world(
         response: Response,
         name: str = Path(..., description="The name of the world."),
 ) -> TibiaResponse[Optional[World]]:
-    return handle_response(response, await app.state.client.fetch_world(name))
+    return handle_response(response, await app.state.refresher.get(
+        ("world", name.lower()), lambda: app.state.client.fetch_world(name),
+    ))
 
 
 @app.get("/guilds/{name}", tags=["Community"])
 async def get_guild(
+        response: Response,
         name: str = Path(...),
 ) -> TibiaResponse[Optional[Guild]]:
-    return await app.state.client.fetch_guild(name)
+    return cache_response(response, await app.state.client.fetch_guild(name))
 
 
 @app.get("/guilds/{name}/wars", tags=["Community"])
 async def get_guild_wars(
+        response: Response,
         name: str = Path(...),
 ) -> TibiaResponse[Optional[GuildWars]]:
-    return await app.state.client.fetch_guild_wars(name)
+    return cache_response(response, await app.state.client.fetch_guild_wars(name))
 
 
 @app.get("/worlds/{world}/guilds", tags=["Community"])
 async def get_world_guilds(
+        response: Response,
         world: str = Path(...),
 ) -> TibiaResponse[Optional[GuildsSection]]:
-    return await app.state.client.fetch_world_guilds(world)
+    return cache_response(response, await app.state.client.fetch_world_guilds(world))
 
 
 @app.get("/highscores/{world}", tags=["Community"])
 async def get_highscores(
+        response: Response,
         world: str = Path(...),
         page: int = Query(1),
         category: HighscoresCategory = Query(HighscoresCategory.EXPERIENCE),
@@ -288,9 +857,30 @@ async def get_highscores(
     if world.lower() in {"global", "all"}:
         world = None
 
-    return await app.state.client.fetch_highscores_page(world, category, page=page, vocation=vocation,
-                                                        battleye_type=battleye,
-                                                        pvp_types=pvp_types)
+    return cache_response(response, await app.state.refresher.get(
+        ("highscores", world and world.lower(), page, category, vocation, battleye, tuple(sorted(pvp_types))),
+        lambda: app.state.client.fetch_highscores_page(
+            world, category, page=page, vocation=vocation, battleye_type=battleye, pvp_types=pvp_types,
+        ),
+    ))
+
+
+@app.get("/highscores/{world}/stream", tags=["Community"], response_class=StreamingResponse,
+         responses=NDJSON_RESPONSES)
+async def stream_highscores(
+        world: str = Path(...),
+        category: HighscoresCategory = Query(HighscoresCategory.EXPERIENCE),
+        vocation: HighscoresProfession = Query(HighscoresProfession.ALL),
+        battleye: HighscoresBattlEyeType = Query(None),
+        pvp_types: list[PvpTypeFilter] = Query([], alias="pvp"),
+) -> Response:
+    """Stream the entries of every page of the highscores, as newline-delimited JSON."""
+    if world.lower() in {"global", "all"}:
+        world = None
+
+    return await stream_pages(lambda page: app.state.client.fetch_highscores_page(
+        world, category, page=page, vocation=vocation, battleye_type=battleye, pvp_types=pvp_types,
+    ))
 
 
 @app.get("/houses/{world}/{houseId:int}", tags=["Community"])
@@ -304,21 +894,25 @@ async def get_house(
 
 @app.get("/houses/{world}/{town}", tags=["Community"])
 async def get_houses_section(
+        response: Response,
         world: str = Path(..., description="The world to search in."),
         town: str = Path(..., description="The game town to search in."),
         status: HouseStatus = Query(None, description="The house status to filter houses by. Empty will show any."),
         order: HouseOrder = Query(None, description="The field or value to order results by."),
         house_type: HouseType = Query(None, alias="type", description="The type of house to show."),
 ) -> TibiaResponse[Optional[HousesSection]]:
-    return await app.state.client.fetch_houses_section(world, town, status=status, order=order, house_type=house_type)
+    return cache_response(response, await app.state.client.fetch_houses_section(
+        world, town, status=status, order=order, house_type=house_type,
+    ))
 
 
 @app.get("/killStatistics/{world}", tags=["Community"])
 @app.get("/killstatistics/{world}", tags=["Community"])
 async def get_kill_statistics(
+        response: Response,
         world: str = Path(...),
 ) -> TibiaResponse[Optional[KillStatistics]]:
-    return await app.state.client.fetch_kill_statistics(world)
+    return cache_response(response, await app.state.client.fetch_kill_statistics(world))
 
 
 @app.get("/leaderboards/{world}", tags=["Community"])
@@ -353,47 +947,59 @@ async def get_fansites(
 # region Forums
 
 @app.get("/forums/world", tags=["Forums"])
-async def get_world_boards() -> TibiaResponse[ForumSection]:
-    return await app.state.client.fetch_forum_world_boards()
+async def get_world_boards(response: Response) -> TibiaResponse[ForumSection]:
+    return cache_response(response, await app.state.client.fetch_forum_world_boards())
 
 
 @app.get("/forums/trade", tags=["Forums"])
-async def get_trade_boards() -> TibiaResponse[ForumSection]:
-    return await app.state.client.fetch_forum_trade_boards()
+async def get_trade_boards(response: Response) -> TibiaResponse[ForumSection]:
+    return cache_response(response, await app.state.client.fetch_forum_trade_boards())
 
 
 @app.get("/forums/community", tags=["Forums"])
-async def get_community_boards() -> TibiaResponse[ForumSection]:
-    return await app.state.client.fetch_forum_community_boards()
+async def get_community_boards(response: Response) -> TibiaResponse[ForumSection]:
+    return cache_response(response, await app.state.client.fetch_forum_community_boards())
 
 
 @app.get("/forums/support", tags=["Forums"])
-async def get_support_boards() -> TibiaResponse[ForumSection]:
-    return await app.state.client.fetch_forum_support_boards()
+async def get_support_boards(response: Response) -> TibiaResponse[ForumSection]:
+    return cache_response(response, await app.state.client.fetch_forum_support_boards())
 
 
 @app.get("/forums/sections/{section_id}", tags=["Forums"])
 async def get_forum_section(
+        response: Response,
         section_id: int = Path(...),
 ) -> TibiaResponse[Optional[ForumSection]]:
-    return await app.state.client.fetch_forum_section(section_id)
+    return cache_response(response, await app.state.client.fetch_forum_section(section_id))
 
 
 @app.get("/forums/boards/{board_id}", tags=["Forums"])
 async def get_forum_board(
+        response: Response,
         board_id: int = Path(...),
         page: int = Query(1),
         age: int = Query(30),
 ) -> TibiaResponse[Optional[ForumBoard]]:
-    return await app.state.client.fetch_forum_board(board_id=board_id, page=page, age=age)
+    return cache_response(response, await app.state.client.fetch_forum_board(board_id=board_id, page=page, age=age))
 
 
 @app.get("/forums/threads/{thread_id}", tags=["Forums"])
 async def get_forum_thread(
+        response: Response,
         thread_id: int = Path(...),
         page: int = Query(1),
 ) -> TibiaResponse[Optional[ForumThread]]:
-    return await app.state.client.fetch_forum_thread(thread_id=thread_id, page=page)
+    return cache_response(response, await app.state.client.fetch_forum_thread(thread_id=thread_id, page=page))
+
+
+@app.get("/forums/threads/{thread_id}/stream", tags=["Forums"], response_class=StreamingResponse,
+         responses=NDJSON_RESPONSES)
+async def stream_forum_thread(
+        thread_id: int = Path(...),
+) -> Response:
+    """Stream the posts of every page of a thread, as newline-delimited JSON."""
+    return await stream_pages(lambda page: app.state.client.fetch_forum_thread(thread_id=thread_id, page=page))
 
 
 # endregion
@@ -441,25 +1047,37 @@ def auction_filter_parameters(
 
 @app.get("/auctions/", tags=["Char Bazaar"])
 async def get_current_auctions(
+        response: Response,
         page: int = Query(1),
         filters: Annotated[AuctionFilters, Depends(auction_filter_parameters)] = None,
 ) -> TibiaResponse[CharacterBazaar]:
-    return await app.state.client.fetch_current_auctions(
+    return cache_response(response, await app.state.client.fetch_current_auctions(
         page,
         filters,
-    )
+    ))
 
 
 @app.get("/auctions/history/", tags=["Char Bazaar"])
 async def get_auctions_history(
+        response: Response,
         page: int = Query(1),
         filters: Annotated[AuctionFilters, Depends(auction_filter_parameters)] = None,
 ) -> TibiaResponse[CharacterBazaar]:
-    return await app.state.client.fetch_auction_history(page, filters)
+    return cache_response(response, await app.state.client.fetch_auction_history(page, filters))
+
+
+@app.get("/auctions/history/stream", tags=["Char Bazaar"], response_class=StreamingResponse,
+         responses=NDJSON_RESPONSES)
+async def stream_auctions_history(
+        filters: Annotated[AuctionFilters, Depends(auction_filter_parameters)] = None,
+) -> Response:
+    """Stream the auctions of every page of the auction history, as newline-delimited JSON."""
+    return await stream_pages(lambda page: app.state.client.fetch_auction_history(page, filters))
 
 
 @app.get("/auctions/{auction_id}", tags=["Char Bazaar"])
 async def get_auction(
+        response: Response,
         auction_id: int = Path(...),
         skip_details: bool = Query(
             False,
@@ -470,9 +1088,311 @@ async def get_auction(
         fetch_outfits: bool = Query(False, description="Whether to fetch additional outfits pages (if available)."),
         fetch_familiars: bool = Query(False, description="Whether to fetch additional familiars pages (if available)."),
 ) -> TibiaResponse[Optional[Auction]]:
-    return await app.state.client.fetch_auction(auction_id, skip_details=skip_details, fetch_items=fetch_items,
-                                                fetch_mounts=fetch_mounts, fetch_outfits=fetch_outfits,
-                                                fetch_familiars=fetch_familiars)
+    return cache_response(response, await app.state.client.fetch_auction(
+        auction_id, skip_details=skip_details, fetch_items=fetch_items, fetch_mounts=fetch_mounts,
+        fetch_outfits=fetch_outfits, fetch_familiars=fetch_familiars,
+    ))
+
+
+# endregion
+
+# region Push
+
+PUSH_WORLD_INTERVAL = 30.0
+PUSH_BOOSTED_INTERVAL = 300.0
+PUSH_KEEPALIVE_INTERVAL = 15.0
+PUSH_MAX_PENDING_EVENTS = 100
+
+SSE_RESPONSES = {200: {"content": {"text/event-stream": {}}, "description": "A stream of server-sent events."}}
+
+
+class Channel:
+    """Poll a resource while it has subscribers, and send the changes found to all of them.
+
+    A single task polls the resource, no matter the number of subscribers. It is started with the first subscriber, and
+    stopped after the last one leaves. New subscribers first get a snapshot of the latest state.
+
+    Subscribers that fall more than :data:`PUSH_MAX_PENDING_EVENTS` events behind are disconnected, instead of letting
+    their events pile up.
+    """
+
+    def __init__(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Awaitable[TibiaResponse[T]]],
+            diff: Callable[[Optional[T], T], list[tuple[str, dict]]],
+            snapshot: Callable[[T], dict],
+            interval: float,
+    ):
+        self.key = key
+        self.fetch = fetch
+        self.diff = diff
+        self.snapshot = snapshot
+        self.interval = interval
+        self.latest: Optional[T] = None
+        self._subscribers: set[asyncio.Queue] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Get a queue that receives the events of the channel, starting with a snapshot of the latest state, if known.
+
+        :obj:`None` is put in the queue when the subscriber is disconnected.
+        """
+        queue = asyncio.Queue()
+        if self.latest is not None:
+            queue.put_nowait(("snapshot", self.snapshot(self.latest)))
+
+        self._subscribers.add(queue)
+        if self._task is None:
+            self._task = asyncio.create_task(self._poll())
+
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """Stop sending events to a queue, closing the channel if it was the last subscriber."""
+        self._subscribers.discard(queue)
+        if not self._subscribers:
+            self.close()
+
+    def close(self) -> None:
+        """Stop polling and disconnect every subscriber."""
+        if app.state.channels.get(self.key) is self:
+            del app.state.channels[self.key]
+
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+        self._subscribers.clear()
+
+    def _publish(self, event: tuple[str, dict]) -> None:
+        for queue in list(self._subscribers):
+            if queue.qsize() >= PUSH_MAX_PENDING_EVENTS:
+                self._subscribers.discard(queue)
+                queue.put_nowait(None)
+            else:
+                queue.put_nowait(event)
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                response = await self.fetch()
+                if response.data is not None:
+                    events = (self.diff(self.latest, response.data) if self.latest is not None
+                              else [("snapshot", self.snapshot(response.data))])
+                    self.latest = response.data
+                    for event in events:
+                        self._publish(event)
+            except tibiapy.TibiapyError as e:
+                log.warning("Failed to poll %r: %s", self.key, e)
+            except Exception:
+                # Anything else would fail again on every poll, so the subscribers are disconnected instead.
+                log.exception("Failed to poll %r, closing the channel", self.key)
+                self.close()
+                return
+
+            await asyncio.sleep(self.interval)
+
+
+def get_channel(
+        key: Hashable,
+        fetch: Callable[[], Awaitable[TibiaResponse[T]]],
+        diff: Callable[[Optional[T], T], list[tuple[str, dict]]],
+        snapshot: Callable[[T], dict],
+        interval: float,
+) -> Channel:
+    """Get the channel of a resource, creating it if it has no subscribers yet."""
+    channel = app.state.channels.get(key)
+    if channel is None:
+        channel = app.state.channels[key] = Channel(key, fetch, diff, snapshot, interval)
+
+    return channel
+
+
+def event_stream(channel: Channel) -> StreamingResponse:
+    """Send the events of a channel as server-sent events, with a comment every few seconds to keep it alive."""
+    async def events() -> AsyncIterator[str]:
+        queue = channel.subscribe()
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), PUSH_KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    break
+
+                event_type, data = event
+                yield f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+        finally:
+            channel.unsubscribe(queue)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+def world_snapshot(world: World) -> dict:
+    return {
+        "world": world.name,
+        "online_count": world.online_count,
+        "online_players": [p.model_dump(mode="json", by_alias=True) for p in world.online_players],
+    }
+
+
+def world_changes(previous: World, current: World) -> list[tuple[str, dict]]:
+    previous_names = {p.name for p in previous.online_players}
+    current_names = {p.name for p in current.online_players}
+    logins = [p.model_dump(mode="json", by_alias=True) for p in current.online_players if p.name not in previous_names]
+    logouts = [p.name for p in previous.online_players if p.name not in current_names]
+    if not logins and not logouts:
+        return []
+
+    return [("online", {"world": current.name, "online_count": current.online_count, "logins": logins,
+                        "logouts": logouts})]
+
+
+async def fetch_boosted_creatures() -> TibiaResponse[BoostedCreatures]:
+    """Get the boosted creature and boss, from the same cache entries used by their routes."""
+    creature, boss = await asyncio.gather(
+        app.state.refresher.get(("boosted_creature",), app.state.client.fetch_boosted_creature),
+        app.state.refresher.get(("boosted_boss",), app.state.client.fetch_boosted_boss),
+    )
+    return creature.model_copy(update={"data": BoostedCreatures(creature=creature.data, boss=boss.data)})
+
+
+def boosted_snapshot(boosted: BoostedCreatures) -> dict:
+    return boosted.model_dump(mode="json", by_alias=True)
+
+
+def boosted_changes(previous: BoostedCreatures, current: BoostedCreatures) -> list[tuple[str, dict]]:
+    if previous.creature.name == current.creature.name and previous.boss.name == current.boss.name:
+        return []
+
+    return [("boosted", boosted_snapshot(current))]
+
+
+@app.get("/worlds/{name}/events", tags=["Community"], response_class=StreamingResponse, responses=SSE_RESPONSES)
+async def get_world_events(
+        name: str = Path(..., description="The name of the world."),
+) -> StreamingResponse:
+    """Get the characters that log in and out of a world, as server-sent events.
+
+    The first event is a ``snapshot`` with every online character, followed by ``online`` events with the characters
+    that logged in and the names of those that logged out since the previous poll.
+    The world is polled once for every subscriber.
+    """
+    return event_stream(get_channel(
+        ("world", name.lower()),
+        lambda: app.state.refresher.get(("world", name.lower()), lambda: app.state.client.fetch_world(name)),
+        world_changes,
+        world_snapshot,
+        PUSH_WORLD_INTERVAL,
+    ))
+
+
+@app.get("/boosted/events", tags=["Library"], response_class=StreamingResponse, responses=SSE_RESPONSES)
+async def get_boosted_events() -> StreamingResponse:
+    """Get the boosted creature and boss, as server-sent events.
+
+    The first event is a ``snapshot`` with the current boosted creature and boss, followed by a ``boosted`` event
+    every time either of them changes.
+    The boosted creatures are polled once for every subscriber.
+    """
+    return event_stream(get_channel(
+        ("boosted",),
+        fetch_boosted_creatures,
+        boosted_changes,
+        boosted_snapshot,
+        PUSH_BOOSTED_INTERVAL,
+    ))
+
+
+# endregion
+
+# region Batch
+
+BATCH_MAX_PATHS = 100
+BATCH_CONCURRENCY = 10
+
+
+async def dispatch_internal(path: str) -> tuple[int, bytes]:
+    """Perform a GET request to one of the app's routes without going through the network.
+
+    Returns the status code and the JSON body of the response. Bodies that are not JSON are returned as a JSON string.
+    """
+    url = urllib.parse.urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": urllib.parse.unquote(url.path),
+        "raw_path": url.path.encode(),
+        "query_string": url.query.encode(),
+        "root_path": "",
+        "headers": [(b"host", b"internal")],
+        "client": None,
+        "server": None,
+    }
+    response_status = status.HTTP_500_INTERNAL_SERVER_ERROR
+    is_json = False
+    body = bytearray()
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        nonlocal response_status, is_json
+        if message["type"] == "http.response.start":
+            response_status = message["status"]
+            is_json = any(k.lower() == b"content-type" and v.startswith(b"application/json")
+                          for k, v in message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        log.exception("Batch request to %s failed", path)
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, json.dumps({"detail": "Internal Server Error"}).encode()
+
+    if not is_json:
+        return response_status, json.dumps(body.decode(errors="replace")).encode()
+
+    return response_status, bytes(body)
+
+
+@app.post("/batch", tags=["General"], response_class=Response, responses={200: {"content": {"application/json": {}}}})
+async def get_batch_resources(
+        paths: list[str] = Body(..., embed=True, max_length=BATCH_MAX_PATHS,
+                                description="The paths of the resources to get, e.g. ``/characters/Galarzaa``."),
+) -> Response:
+    """Get multiple resources in a single request.
+
+    The results are keyed by path, each containing its status code and body. Repeated paths are only fetched once.
+    """
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def fetch(path: str) -> tuple[int, bytes]:
+        if not path.startswith("/") or urllib.parse.urlsplit(path).path.rstrip("/") == "/batch":
+            return status.HTTP_400_BAD_REQUEST, json.dumps({"detail": "Invalid path"}).encode()
+
+        async with semaphore:
+            return await dispatch_internal(path)
+
+    unique_paths = list(dict.fromkeys(paths))
+    results = await asyncio.gather(*(fetch(path) for path in unique_paths))
+    # The bodies are already JSON, so they are embedded as they are instead of being decoded and encoded again.
+    items = (
+        b'%s:{"status":%d,"body":%s}' % (json.dumps(path).encode(), item_status, body or b"null")
+        for path, (item_status, body) in zip(unique_paths, results)
+    )
+    return Response(b"{" + b",".join(items) + b"}", media_type="application/json")
 
 
 # endregion
@@ -1,9 +1,11 @@
 import datetime
+import pickle
 
 from tests.tests_tibiapy import TestCommons
 from tibiapy.enums import AuctionBattlEyeFilter, AuctionOrderBy, AuctionOrderDirection, AuctionSearchType, \
     AuctionSkillFilter, \
     AuctionStatus, AuctionVocationFilter, BidType, PvpTypeFilter, Sex, Vocation
+from tibiapy.models import LazyAuctionDetails
 from tibiapy.parsers import AuctionParser, CharacterBazaarParser
 from tibiapy import InvalidContentError
 
@@ -71,6 +73,16 @@ class TestBazaar(TestCommons):
 
         self.assertIsNotNone(bazaar.filters)
 
+    def test_character_bazaar_parser_from_content_lxml_matches_html5lib(self):
+        for resource in [FILE_BAZAAR_CURRENT, FILE_BAZAAR_CURRENT_ALL_FILTERS, FILE_BAZAAR_HISTORY,
+                         FILE_BAZAAR_CURRENT_EMPTY]:
+            with self.subTest(resource=resource):
+                content = self.load_resource(resource)
+                bazaar = CharacterBazaarParser.from_content(content, builder="lxml")
+                html5lib_bazaar = CharacterBazaarParser.from_content(content, builder="html5lib")
+
+                self.assertEqual(html5lib_bazaar.model_dump(), bazaar.model_dump())
+
     def test_character_bazaar_parser_from_content_unrelated(self):
         """Testing parsing an unrelated tibia.com section"""
         content = self.load_resource(self.FILE_UNRELATED_SECTION)
@@ -192,6 +204,55 @@ class TestBazaar(TestCommons):
         self.assertEqual("Unfriendly Sanchez", auction.name)
         self.assertIsNone(auction.details)
 
+    def test_auction_parser_from_content_finished_lazy_details(self):
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        auction = AuctionParser.from_content(content, lazy_details=True)
+
+        self.assertIsInstance(auction.details, LazyAuctionDetails)
+        self.assertFalse(auction.details.is_materialized)
+        self.assertEqual(5_385, auction.details.hit_points)
+        self.assertIn("mana", auction.details.__dict__)
+        self.assertNotIn("items", auction.details.__dict__)
+        self.assertSizeEquals(auction.details.bosstiary_progress, 85)
+        self.assertFalse(auction.details.is_materialized)
+
+        eager_auction = AuctionParser.from_content(content)
+        self.assertEqual(eager_auction.model_dump(), auction.model_dump())
+        self.assertTrue(auction.details.is_materialized)
+
+    def test_auction_parser_from_content_lazy_details_equality(self):
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        eager_auction = AuctionParser.from_content(content)
+
+        self.assertEqual(eager_auction.details, AuctionParser.from_content(content, lazy_details=True).details)
+        self.assertEqual(AuctionParser.from_content(content, lazy_details=True).details, eager_auction.details)
+        self.assertEqual(eager_auction, AuctionParser.from_content(content, lazy_details=True))
+        lazy_auction = AuctionParser.from_content(content, lazy_details=True)
+        lazy_auction.details.materialize().hit_points = 1
+        self.assertNotEqual(eager_auction, lazy_auction)
+        self.assertNotEqual(eager_auction.details, eager_auction)
+
+    def test_auction_parser_from_content_lazy_details_pickle(self):
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        auction = AuctionParser.from_content(content, lazy_details=True)
+
+        unpickled = pickle.loads(pickle.dumps(auction))
+
+        self.assertTrue(auction.details.is_materialized)
+        self.assertIsInstance(unpickled.details, LazyAuctionDetails)
+        self.assertTrue(unpickled.details.is_materialized)
+        self.assertEqual(AuctionParser.from_content(content), unpickled)
+
+    def test_auction_parser_from_content_lxml_matches_html5lib(self):
+        for resource in [FILE_AUCTION_FINISHED, FILE_AUCTION_UPGRADED_ITEMS, FILE_AUCTION_FRAGMENT_PROGRESS,
+                         FILE_AUCTION_NOT_FOUND]:
+            with self.subTest(resource=resource):
+                content = self.load_resource(resource)
+                auction = AuctionParser.from_content(content, builder="lxml")
+                html5lib_auction = AuctionParser.from_content(content, builder="html5lib")
+
+                self.assertEqual(html5lib_auction and html5lib_auction.model_dump(), auction and auction.model_dump())
+
     def test_auction_parser_from_content_with_upgraded_items(self):
         auction = AuctionParser.from_content(self.load_resource(FILE_AUCTION_UPGRADED_ITEMS))
 
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import time
+import unittest
+
+from tibiapy.cache import MemoryCache, RedisCache, SQLiteCache
+
+
+class FakeRedis:
+    """A stand-in for a Redis client, implementing only the commands used by the cache."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        value, expires = self.values.get(key, (None, 0))
+        return value if expires > time.time() else None
+
+    async def set(self, key, value, px, nx=False):
+        if nx and await self.get(key) is not None:
+            return None
+
+        self.values[key] = (value, time.time() + px / 1000)
+        return True
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def aclose(self):
+        pass
+
+
+class TestCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    async def _test_backend(self, cache):
+        self.assertIsNone(await cache.get("key"))
+
+        await cache.set("key", b"value", 60)
+        self.assertEqual(b"value", await cache.get("key"))
+        self.assertFalse(await cache.add("key", b"other", 60))
+        self.assertEqual(b"value", await cache.get("key"))
+
+        await cache.delete("key")
+        self.assertTrue(await cache.add("key", b"other", 60))
+        self.assertEqual(b"other", await cache.get("key"))
+
+        await cache.set("expired", b"value", -1)
+        self.assertIsNone(await cache.get("expired"))
+        self.assertTrue(await cache.add("expired", b"value", 60))
+        await cache.close()
+
+    async def test_memory_cache(self):
+        """Testing storing values in memory"""
+        await self._test_backend(MemoryCache())
+
+    async def test_sqlite_cache(self):
+        """Testing storing values in a SQLite database shared by two instances"""
+        await self._test_backend(SQLiteCache(self.path))
+
+        first, second = SQLiteCache(self.path), SQLiteCache(self.path)
+        self.assertTrue(await first.add("lock", b"1", 60))
+        self.assertFalse(await second.add("lock", b"1", 60))
+        await first.close()
+        await second.close()
+
+    async def test_redis_cache(self):
+        """Testing storing values in Redis, using a stand-in client"""
+        client = FakeRedis()
+        await self._test_backend(RedisCache(client, prefix="test:"))
+
+        self.assertIn("test:key", client.values)
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import sys
 import unittest.mock
@@ -17,7 +18,7 @@ from tests.tests_leaderboards import FILE_LEADERBOARD_CURRENT
 from tests.tests_news import FILE_NEWS_ARCHIVE_RESULTS_FILTERED, FILE_NEWS_ARTICLE
 from tests.tests_tibiapy import TestCommons
 from tests.tests_world import FILE_WORLD_ONLINE, FILE_WORLD_OVERVIEW_ONLINE
-from tibiapy import ForbiddenError, NetworkError
+from tibiapy import ForbiddenError, InvalidContentError, NetworkError
 from tibiapy.client import Client
 from tibiapy.enums import BazaarType, HouseType
 from tibiapy.models import Auction, CMPostArchive, Character, CharacterBazaar, ForumBoard, ForumSection, Guild, \
@@ -25,6 +26,7 @@ from tibiapy.models import Auction, CMPostArchive, Character, CharacterBazaar, F
     KillStatistics, Leaderboard, News, NewsArchive, NewsEntry, World, WorldOverview
 from tibiapy.models.creature import CreatureEntry
 from tibiapy.models.event import EventSchedule
+from tibiapy.parsers import CharacterParser
 from tibiapy.urls import get_auction_url, get_bazaar_url, get_character_url, get_cm_post_archive_url, \
     get_community_boards_url, get_event_schedule_url, get_forum_board_url, get_guild_url, get_highscores_url, \
     get_house_url, get_houses_section_url, get_kill_statistics_url, get_leaderboards_url, get_news_archive_url, \
@@ -88,6 +90,17 @@ class TestClient(unittest.IsolatedAsyncioTestCase, TestCommons):
 
         self.assertIsNone(character.data)
 
+    @aioresponses()
+    async def test_client_fetch_character_page(self, mock):
+        """Testing fetching the page of a character without parsing it"""
+        name = "Tschas"
+        content = self.load_resource(FILE_CHARACTER_RESOURCE)
+        mock.get(get_character_url(name), status=200, body=content)
+        page = await self.client.fetch_character_page(name)
+
+        self.assertEqual(content, page.data.decode() if isinstance(page.data, bytes) else page.data)
+        self.assertEqual(CharacterParser.from_content(content), CharacterParser.from_content(page.data))
+
     @aioresponses()
     async def test_client_fetch_guild(self, mock):
         """Testing fetching a guild"""
@@ -191,6 +204,41 @@ class TestClient(unittest.IsolatedAsyncioTestCase, TestCommons):
 
         self.assertIsInstance(world.data, World)
 
+    @aioresponses()
+    async def test_client_fetch_world_stream(self, mock):
+        """Testing fetching a world while parsing it as it is downloaded"""
+        name = "Antica"
+        content = self.load_resource(FILE_WORLD_ONLINE)
+        mock.get(get_world_url(name), status=200, body=content)
+        mock.get(get_world_url(name), status=200, body=content)
+        mock.get(get_world_url(name), status=403, body=self.load_resource(self.FILE_UNRELATED_SECTION))
+        mock.get(get_world_url(name), status=200, body=self.load_resource(self.FILE_UNRELATED_SECTION))
+        self.client.transport.chunk_size = 1024
+
+        world = await self.client.fetch_world(name, stream=True)
+
+        self.assertIsInstance(world.data, World)
+        self.assertEqual((await self.client.fetch_world(name)).data, world.data)
+        with self.assertRaises(ForbiddenError):
+            await self.client.fetch_world(name, stream=True)
+        with self.assertRaises(InvalidContentError):
+            await self.client.fetch_world(name, stream=True)
+
+    @aioresponses()
+    async def test_client_request_consumer_error(self, mock):
+        """Testing that errors raised by a consumer are raised after checking the response's status"""
+        url = get_world_url("Antica")
+        mock.get(url, status=403, body="Forbidden")
+        mock.get(url, status=200, body="Unexpected")
+
+        def consumer(_: str) -> None:
+            raise KeyError("unexpected content")
+
+        with self.assertRaises(ForbiddenError):
+            await self.client._request("GET", url, consumer=consumer)
+        with self.assertRaises(KeyError):
+            await self.client._request("GET", url, consumer=consumer)
+
     @aioresponses()
     async def test_client_fetch_world_list(self, mock):
         """Testing fetching the world list"""
@@ -273,6 +321,60 @@ class TestClient(unittest.IsolatedAsyncioTestCase, TestCommons):
         with self.assertRaises(ValueError):
             await self.client.fetch_auction(-1)
 
+    @aioresponses()
+    async def test_client_fetch_auctions(self, mock):
+        """Testing fetching multiple auctions"""
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        mock.get(get_auction_url(134), status=200, body=content)
+        mock.get(get_auction_url(135), status=403)
+        mock.get(get_auction_url(136), status=200, body=content)
+        client = Client(max_concurrent_requests=1)
+
+        results = {auction_id: result async for auction_id, result in client.fetch_auctions([134, 135, 136, -1])}
+        await client.session.close()
+
+        self.assertSizeEquals(results, 4)
+        self.assertIsInstance(results[134].data, Auction)
+        self.assertIsInstance(results[135], ForbiddenError)
+        self.assertIsInstance(results[136].data, Auction)
+        self.assertIsInstance(results[-1], ValueError)
+
+    @aioresponses()
+    async def test_client_fetch_auctions_bounded(self, mock):
+        """Testing that fetching multiple auctions doesn't fetch too far ahead of the consumer"""
+        content = self.load_resource(FILE_AUCTION_FINISHED)
+        for auction_id in range(1, 21):
+            mock.get(get_auction_url(auction_id), status=200, body=content)
+        taken = []
+
+        def auction_ids():
+            for auction_id in range(1, 21):
+                taken.append(auction_id)
+                yield auction_id
+
+        results = self.client.fetch_auctions(auction_ids(), concurrency=2)
+        await results.__anext__()
+        await asyncio.sleep(0.1)
+        await results.aclose()
+
+        self.assertLessEqual(len(taken), 5)
+
+    async def test_client_fetch_auctions_ids_error(self):
+        """Testing fetching multiple auctions when iterating the IDs fails"""
+        def auction_ids():
+            yield from ()
+            raise RuntimeError("ids are unavailable")
+
+        with self.assertRaises(RuntimeError):
+            async for _ in self.client.fetch_auctions(auction_ids()):
+                pass
+
+    async def test_client_fetch_auctions_invalid_concurrency(self):
+        """Testing fetching multiple auctions with an invalid concurrency"""
+        with self.assertRaises(ValueError):
+            async for _ in self.client.fetch_auctions([134], concurrency=0):
+                pass
+
     @aioresponses()
     async def test_client_fetch_event_calendar(self, mock):
         """Testing fetching the auction history"""
@@ -3,7 +3,7 @@ import datetime
 from tests.tests_tibiapy import TestCommons
 from tibiapy import InvalidContentError
 from tibiapy.builders import GuildBuilder
-from tibiapy.models import Guild, GuildHouse, GuildWars
+from tibiapy.models import Guild, GuildHouse, GuildMember, GuildMemberRow, GuildWars
 from tibiapy.parsers import GuildParser, GuildWarsParser, GuildsSectionParser
 from tibiapy.urls import get_guild_url, get_guild_wars_url, get_world_guilds_url
 
@@ -60,6 +60,19 @@ class TestsGuild(TestCommons):
         self.assertIsInstance(guild.guildhall, GuildHouse)
         self.assertIsInstance(guild.guildhall.paid_until, datetime.date)
 
+    def test_guild_parser_from_content_compact(self):
+        """Testing parsing a guild with the members as compact rows"""
+        content = self.load_resource(FILE_GUILD_FULL)
+        guild = GuildParser.from_content(content)
+        compact_guild = GuildParser.from_content(content, compact=True)
+
+        self.assertSizeEquals(compact_guild.members, len(guild.members))
+        self.assertForAll(compact_guild.members, lambda m: self.assertIsInstance(m, GuildMemberRow))
+        self.assertEqual(guild.online_count, compact_guild.online_count)
+        self.assertEqual(guild.ranks, compact_guild.ranks)
+        self.assertIsInstance(compact_guild.leader.to_model(), GuildMember)
+        self.assertEqual(guild.leader.model_dump(), compact_guild.leader.to_model().model_dump())
+
     def test_guild_parser_from_content_not_found(self):
         """Testing parsing a non existent guild"""
         content = self.load_resource(FILE_GUILD_NOT_FOUND)
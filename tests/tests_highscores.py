@@ -1,7 +1,7 @@
 from tests.tests_tibiapy import TestCommons
 from tibiapy import InvalidContentError
 from tibiapy.enums import HighscoresBattlEyeType, HighscoresCategory, HighscoresProfession, Vocation
-from tibiapy.models import Highscores, HighscoresEntry, LoyaltyHighscoresEntry
+from tibiapy.models import Highscores, HighscoresEntry, HighscoresRow, LoyaltyHighscoresEntry
 from tibiapy.parsers import HighscoresParser
 
 FILE_HIGHSCORES_FULL = "highscores/highscores.txt"
@@ -71,6 +71,29 @@ class TestHighscores(TestCommons):
 
         self.assertForAll(highscores.entries, lambda e: self.assertIsInstance(e, LoyaltyHighscoresEntry))
 
+    def test_highscores_parser_from_content_compact(self):
+        """Testing parsing highscores into compact rows"""
+        content = self.load_resource(FILE_HIGHSCORES_FULL)
+        highscores = HighscoresParser.from_content(content)
+        compact_highscores = HighscoresParser.from_content(content, compact=True)
+
+        self.assertEqual(highscores.results_count, compact_highscores.results_count)
+        self.assertSizeEquals(compact_highscores.entries, len(highscores.entries))
+        self.assertForAll(compact_highscores.entries, lambda e: self.assertIsInstance(e, HighscoresRow))
+        self.assertForAll(compact_highscores.entries, lambda e: self.assertIsInstance(e.vocation, Vocation))
+        self.assertEqual(highscores.entries, [e.to_model() for e in compact_highscores.entries])
+        self.assertEqual(highscores.entries[0].model_dump(), compact_highscores.entries[0].to_model().model_dump())
+        self.assertEqual(compact_highscores.entries[0], HighscoresRow.from_model(highscores.entries[0]))
+        self.assertEqual(compact_highscores, Highscores.model_validate_json(compact_highscores.model_dump_json()))
+
+    def test_highscores_parser_from_content_loyalty_compact(self):
+        """Testing parsing loyalty highscores into compact rows"""
+        content = self.load_resource(FILE_HIGHSCORES_LOYALTY)
+        highscores = HighscoresParser.from_content(content, compact=True)
+
+        self.assertForAll(highscores.entries, lambda e: self.assertIsNotNone(e.title))
+        self.assertForAll(highscores.entries, lambda e: self.assertIsInstance(e.to_model(), LoyaltyHighscoresEntry))
+
 
     def test_highscores_parser_from_content_battleye_and_pvp_filters(self):
         """Testing parsing Highscores"""
@@ -97,6 +120,27 @@ class TestHighscores(TestCommons):
             self.assertIsInstance(entry.value, int)
             self.assertIsInstance(entry.level, int)
 
+    def test_highscores_parser_from_content_patterns_match_tree(self):
+        """Testing that parsing highscores with patterns gives the same results as parsing the document tree"""
+        for resource in [FILE_HIGHSCORES_FULL, FILE_HIGHSCORES_GLOBAL, FILE_HIGHSCORES_EXPERIENCE,
+                         FILE_HIGHSCORES_LOYALTY, FILE_HIGHSCORES_BATTLEYE_PVP_FILTER, FILE_HIGHSCORES_NO_RESULTS]:
+            with self.subTest(resource=resource):
+                content = self.load_resource(resource)
+                highscores = HighscoresParser._parse_with_patterns(content)
+                tree_highscores = HighscoresParser._parse_with_tree(content)
+
+                self.assertIsNotNone(highscores)
+                self.assertEqual(tree_highscores.model_dump(exclude={"last_updated"}),
+                                 highscores.model_dump(exclude={"last_updated"}))
+
+    def test_highscores_parser_from_content_patterns_fallback(self):
+        """Testing that pages with an unexpected structure are not parsed with patterns"""
+        content = self.load_resource(FILE_HIGHSCORES_FULL)
+
+        self.assertIsNone(HighscoresParser._parse_with_patterns(self.load_resource(FILE_HIGHSCORES_NOT_FOUND)))
+        self.assertIsNone(HighscoresParser._parse_with_patterns(content.replace('class="TableContent"', "")))
+        self.assertIsNotNone(HighscoresParser.from_content(content.replace('class="TableContent"', "")))
+
     def test_highscores_parser_from_content_not_found(self):
         """Testing parsing highscores when empty (world doesn't exist)"""
         content = self.load_resource(FILE_HIGHSCORES_NOT_FOUND)
@@ -0,0 +1,81 @@
+import datetime
+import os
+import tempfile
+
+from tests.tests_highscores import FILE_HIGHSCORES_EXPERIENCE, FILE_HIGHSCORES_FULL
+from tests.tests_kill_statistics import FILE_KILL_STATISTICS_FULL
+from tests.tests_tibiapy import TestCommons
+from tibiapy.enums import HighscoresChangeType
+from tibiapy.history import KillStatisticsHistory, compare_highscores
+from tibiapy.models import RaceRow
+from tibiapy.parsers import HighscoresParser, KillStatisticsParser
+
+
+class TestKillStatisticsHistory(TestCommons):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_kill_statistics_history_append_and_load(self):
+        """Testing storing kill statistics and querying them after loading the history again"""
+        kill_statistics = KillStatisticsParser.from_content(self.load_resource(FILE_KILL_STATISTICS_FULL))
+        compact = KillStatisticsParser.from_content(self.load_resource(FILE_KILL_STATISTICS_FULL), compact=True)
+        compact.entries["demons"] = compact.entries["demons"]._replace(last_day_killed=100)
+        start = datetime.date(2024, 1, 1)
+        history = KillStatisticsHistory(self.path)
+
+        history.append(kill_statistics, start)
+        history.append(compact, start + datetime.timedelta(days=1))
+        with self.assertRaises(ValueError):
+            history.append(kill_statistics, start)
+
+        history = KillStatisticsHistory(self.path)
+
+        self.assertEqual(["Gladera"], history.worlds)
+        self.assertSizeEquals(history.races, 1175)
+        self.assertEqual([start, start + datetime.timedelta(days=1)], history.dates("Gladera"))
+        demons = history.get_race("Gladera", "demons")
+        self.assertEqual(RaceRow(2299, 0, 24878, 3), demons[start])
+        self.assertEqual(100, demons[start + datetime.timedelta(days=1)].last_day_killed)
+        self.assertEqual({start: RaceRow.from_model(kill_statistics.total)},
+                         history.get_race("Gladera", KillStatisticsHistory.TOTAL, end=start))
+        self.assertSizeEquals(history.get_race("Gladera", "demons", start=start + datetime.timedelta(days=1)), 1)
+        self.assertEqual({}, history.get_race("Gladera", "unknown"))
+        self.assertEqual({}, history.get_race("Antica", "demons"))
+
+
+class TestCompareHighscores(TestCommons):
+    def test_compare_highscores(self):
+        """Testing comparing two refreshes of the highscores"""
+        previous = HighscoresParser.from_content(self.load_resource(FILE_HIGHSCORES_FULL), compact=True)
+        current = previous.model_copy(deep=True)
+        first, second, *rest = current.entries
+        current.entries = [first._replace(value=first.value + 10), second._replace(rank=1),
+                           *rest[:-1], rest[-1]._replace(name="Newcomer")]
+
+        self.assertIsEmpty(compare_highscores(previous, previous))
+        changes = compare_highscores([previous], current)
+
+        self.assertEqual([HighscoresChangeType.CHANGED, HighscoresChangeType.CHANGED, HighscoresChangeType.ADDED,
+                          HighscoresChangeType.DROPPED], [c.type for c in changes])
+        self.assertEqual(10, changes[0].value_change)
+        self.assertEqual(0, changes[0].rank_change)
+        self.assertEqual(second.rank - 1, changes[1].rank_change)
+        self.assertEqual("Newcomer", changes[2].name)
+        self.assertIsNone(changes[2].value_change)
+        self.assertEqual(rest[-1].name, changes[3].name)
+        self.assertEqual(previous.category, changes[3].category)
+
+    def test_compare_highscores_different_category(self):
+        previous = HighscoresParser.from_content(self.load_resource(FILE_HIGHSCORES_FULL))
+        current = HighscoresParser.from_content(self.load_resource(FILE_HIGHSCORES_EXPERIENCE))
+
+        with self.assertRaises(ValueError):
+            compare_highscores(previous, current)
+        with self.assertRaises(ValueError):
+            compare_highscores([], current)
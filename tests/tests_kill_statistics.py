@@ -1,5 +1,6 @@
 from tests.tests_tibiapy import TestCommons
 from tibiapy import InvalidContentError
+from tibiapy.models import RaceEntry, RaceRow
 from tibiapy.parsers import KillStatisticsParser
 
 FILE_KILL_STATISTICS_FULL = "killStatistics/killStatisticsWithResults.txt"
@@ -33,6 +34,20 @@ class TestHighscores(TestCommons):
         self.assertEqual(24878, demons_entry.last_week_killed)
         self.assertEqual(3, demons_entry.last_week_players_killed)
 
+    def test_kill_statistics_from_parser_content_compact(self):
+        """Testing parsing kill statistics into compact rows"""
+        content = self.load_resource(FILE_KILL_STATISTICS_FULL)
+        kill_statistics = KillStatisticsParser.from_content(content, compact=True)
+
+        self.assertSizeEquals(kill_statistics.entries, 1175)
+        self.assertIsInstance(kill_statistics.total, RaceEntry)
+        self.assertForAll(kill_statistics.entries.values(), lambda e: self.assertIsInstance(e, RaceRow))
+
+        demons_entry = kill_statistics.entries["demons"]
+        self.assertEqual(2299, demons_entry.last_day_killed)
+        self.assertEqual(24878, demons_entry.last_week_killed)
+        self.assertEqual(2299, demons_entry.to_model().last_day_killed)
+
     def test_kill_statistics_from_parser_content_empty(self):
         content = self.load_resource(FILE_KILL_STATISTICS_EMPTY)
 
@@ -0,0 +1,426 @@
+import asyncio
+import datetime
+import gzip
+import json
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+from multidict import CIMultiDict
+
+from tests.tests_character import FILE_CHARACTER_RESOURCE
+from tests.tests_forums import FILE_THREAD_GOLDEN_FRAME, FILE_THREAD_NOT_FOUND
+from tests.tests_news import FILE_NEWS_ARCHIVE_INITIAL
+from tests.tests_tibiapy import TestCommons
+from tests.tests_world import FILE_WORLD_ONLINE
+from tibiapy.client import Client
+from tibiapy.errors import NetworkError
+from tibiapy.models.tibia_response import CACHE_LIMIT, TibiaResponse
+from tibiapy.transport import LiveTransport, ReplayTransport, TransportResponse, _refreshing, _request_key
+from tibiapy.urls import get_character_url, get_forum_thread_url, get_news_archive_url, get_world_url
+
+try:
+    from prometheus_client import REGISTRY
+    from starlette.testclient import TestClient
+
+    import server
+except ImportError:  # pragma: no cover
+    server = None
+
+# The samples that should increase when a world is requested.
+METRICS_SAMPLES = [
+    ("tibiapy_requests_total", {"route": "/worlds/{name}", "method": "GET", "status": "200"}),
+    ("tibiapy_request_duration_seconds_count", {"route": "/worlds/{name}"}),
+    ("tibiapy_cache_requests_total", {"result": "miss"}),
+    ("tibiapy_cache_requests_total", {"result": "hit"}),
+    ("tibiapy_upstream_parsing_seconds_count", {"data_type": "World"}),
+]
+
+
+@unittest.skipIf(server is None, "the server's dependencies are not installed")
+class TestServer(TestCommons):
+    def setUp(self):
+        fd, self.archive_path = tempfile.mkstemp(suffix=".jsonl.gz")
+        os.close(fd)
+        self.addCleanup(os.remove, self.archive_path)
+        self.records = []
+
+    def record(self, url, content, *, status=200, headers=None):
+        """Add a response to the archive served to the server's client."""
+        self.records.append({"key": _request_key("GET", url, None), "url": url, "method": "GET", "status": status,
+                             "reason": "OK", "headers": list((headers or {}).items()), "content": content})
+
+    def start(self):
+        """Start the server, with a client that replays the recorded responses."""
+        with gzip.open(self.archive_path, "wt", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in self.records)
+
+        patcher = unittest.mock.patch.object(server, "create_client",
+                                             lambda _: Client(transport=ReplayTransport(self.archive_path)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        client = TestClient(server.app)
+        client.__enter__()
+        self.addCleanup(client.__exit__, None, None, None)
+        return client
+
+    def test_batch(self):
+        """Testing getting multiple resources in a single request"""
+        self.record(get_character_url("Tschas"), self.load_resource(FILE_CHARACTER_RESOURCE))
+        client = self.start()
+
+        response = client.post("/batch", json={"paths": ["/characters/Tschas", "/characters/Tschas",
+                                                         "/healthcheck", "/batch"]})
+        results = response.json()
+
+        self.assertEqual(200, response.status_code)
+        self.assertSizeEquals(results, 3)
+        self.assertEqual(200, results["/characters/Tschas"]["status"])
+        self.assertEqual("Tschas", results["/characters/Tschas"]["body"]["data"]["name"])
+        self.assertEqual({"status": 200, "body": True}, results["/healthcheck"])
+        self.assertEqual(400, results["/batch"]["status"])
+
+    def test_batch_encoded_path(self):
+        """Testing getting a resource whose path contains an encoded space in a batch"""
+        self.record(get_character_url("Tschas Alt"), self.load_resource(FILE_CHARACTER_RESOURCE))
+        client = self.start()
+
+        results = client.post("/batch", json={"paths": ["/characters/Tschas%20Alt"]}).json()
+
+        self.assertEqual(200, results["/characters/Tschas%20Alt"]["status"])
+        self.assertEqual(client.get("/characters/Tschas%20Alt").json()["data"],
+                         results["/characters/Tschas%20Alt"]["body"]["data"])
+
+    def test_stream_forum_thread(self):
+        """Testing streaming the posts of every page of a thread"""
+        for page in (1, 2):
+            self.record(get_forum_thread_url(4230743, page), self.load_resource(FILE_THREAD_GOLDEN_FRAME))
+
+        client = self.start()
+
+        with client.stream("GET", "/forums/threads/4230743/stream") as response:
+            lines = list(response.iter_lines())
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual("application/x-ndjson", response.headers["Content-Type"])
+        self.assertSizeEquals(lines, 40)
+        posts = [json.loads(line) for line in lines]
+        self.assertEqual(posts[:20], posts[20:])
+        self.assertForAll(posts, lambda post: self.assertIn("postId", post))
+
+    def test_stream_forum_thread_not_found(self):
+        """Testing streaming a thread that doesn't exist"""
+        self.record(get_forum_thread_url(1), self.load_resource(FILE_THREAD_NOT_FOUND))
+        client = self.start()
+
+        response = client.get("/forums/threads/1/stream")
+
+        self.assertEqual(404, response.status_code)
+
+    def test_stream_forum_thread_failed_page(self):
+        """Testing a stream ending early when a page can't be fetched"""
+        self.record(get_forum_thread_url(4230743, 1), self.load_resource(FILE_THREAD_GOLDEN_FRAME))
+        client = self.start()
+
+        with self.assertRaises(NetworkError), client.stream("GET", "/forums/threads/4230743/stream") as response:
+            list(response.iter_lines())
+
+    def test_conditional_response(self):
+        """Testing replying with a 304 when the client already has the current version of a resource"""
+        self.record(get_character_url("Tschas"), self.load_resource(FILE_CHARACTER_RESOURCE))
+        client = self.start()
+        client.headers["Accept-Encoding"] = "identity"
+
+        response = client.get("/characters/Tschas")
+        etag = response.headers["ETag"]
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn("max-age=", response.headers["Cache-Control"])
+        self.assertIn("Age", response.headers)
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+            with self.subTest(if_none_match=if_none_match):
+                not_modified = client.get("/characters/Tschas", headers={"If-None-Match": if_none_match})
+
+                self.assertEqual(304, not_modified.status_code)
+                self.assertEqual(b"", not_modified.content)
+                self.assertEqual(etag, not_modified.headers["ETag"])
+
+        self.assertEqual(200, client.get("/characters/Tschas", headers={"If-None-Match": '"other"'}).status_code)
+
+    def test_conditional_response_cached(self):
+        """Testing calculating the ETag of a cached response only once"""
+        self.record(get_world_url("Premia"), self.load_resource(FILE_WORLD_ONLINE))
+        client = self.start()
+
+        with unittest.mock.patch.object(server, "response_etag", wraps=server.response_etag) as response_etag:
+            etag = client.get("/worlds/Premia").headers["ETag"]
+            not_modified = client.get("/worlds/Premia", headers={"If-None-Match": etag})
+            response = client.get("/worlds/Premia")
+
+        self.assertEqual(304, not_modified.status_code)
+        self.assertEqual(etag, not_modified.headers["ETag"])
+        self.assertIn("max-age=", not_modified.headers["Cache-Control"])
+        self.assertEqual(etag, response.headers["ETag"])
+        self.assertEqual(1, response_etag.call_count)
+
+    def test_compression(self):
+        """Testing compressing responses with the encodings accepted by the client"""
+        self.record(get_character_url("Tschas"), self.load_resource(FILE_CHARACTER_RESOURCE))
+        client = self.start()
+        uncompressed = client.get("/characters/Tschas", headers={"Accept-Encoding": "identity"})
+
+        self.assertNotIn("Content-Encoding", uncompressed.headers)
+        for encoding in ("gzip", "br"):
+            with self.subTest(encoding=encoding):
+                response = client.get("/characters/Tschas", headers={"Accept-Encoding": f"{encoding}, identity;q=0.5"})
+                etag = response.headers["ETag"]
+
+                self.assertEqual(encoding, response.headers["Content-Encoding"])
+                self.assertIn("Accept-Encoding", response.headers["Vary"])
+                self.assertEqual(uncompressed.json()["data"], response.json()["data"])
+                self.assertEqual(f"W/{uncompressed.headers['ETag']}", etag)
+
+                not_modified = client.get("/characters/Tschas",
+                                          headers={"Accept-Encoding": encoding, "If-None-Match": etag})
+
+                self.assertEqual(304, not_modified.status_code)
+                self.assertEqual(etag, not_modified.headers["ETag"])
+
+        self.assertNotIn("Content-Encoding", client.get("/healthcheck", headers={"Accept-Encoding": "gzip"}).headers)
+
+    def test_compression_cache(self):
+        """Testing reusing the compressed version of a body sent before"""
+        middleware = server.CompressionMiddleware(server.app, cache_size=1)
+        body = b"[]" * 1024
+
+        compressed = middleware.compress(body, "gzip")
+
+        self.assertEqual(body, gzip.decompress(compressed))
+        self.assertIs(compressed, middleware.compress(body, "gzip"))
+        middleware.compress(b"{}" * 1024, "gzip")
+        self.assertIsNot(compressed, middleware.compress(body, "gzip"))
+
+    def test_boosted_creatures(self):
+        """Testing polling the boosted creature and boss through the cache entries of their routes"""
+        self.record(get_news_archive_url(), self.load_resource(FILE_NEWS_ARCHIVE_INITIAL))
+        client = self.start()
+
+        response = client.portal.call(server.fetch_boosted_creatures)
+
+        self.assertEqual("Vampire", response.data.creature.name)
+        self.assertEqual("Sir Nictros", response.data.boss.name)
+        self.assertEqual([("boosted_boss",), ("boosted_creature",)], sorted(server.app.state.refresher.hot_keys()))
+
+    def test_metrics(self):
+        """Testing recording the requests handled and the lookups in the response cache"""
+        self.record(get_world_url("Premia"), self.load_resource(FILE_WORLD_ONLINE))
+        client = self.start()
+        before = [REGISTRY.get_sample_value(name, labels) or 0 for name, labels in METRICS_SAMPLES]
+
+        for _ in range(3):
+            client.get("/worlds/Premia")
+
+        after = [REGISTRY.get_sample_value(name, labels) for name, labels in METRICS_SAMPLES]
+        response = client.get("/metrics")
+
+        self.assertEqual(200, response.status_code)
+        self.assertIn("tibiapy_requests_total", response.text)
+        self.assertIn("tibiapy_event_loop_lag_seconds", response.text)
+        self.assertEqual([3, 3, 1, 2, 1], [a - b for a, b in zip(after, before)])
+
+
+@unittest.skipIf(server is None, "the server's dependencies are not installed")
+class TestMetricsTransport(unittest.IsolatedAsyncioTestCase):
+    async def test_metrics_transport(self):
+        """Testing recording the results of the requests to Tibia.com"""
+        responses = [
+            TransportResponse("https://www.tibia.com/", method="GET", status=200, reason="OK", headers=CIMultiDict()),
+            TransportResponse("https://www.tibia.com/", method="GET", status=403, reason="Forbidden",
+                              headers=CIMultiDict()),
+            TransportResponse("https://maintenance.tibia.com/", method="GET", status=200, reason="OK",
+                              headers=CIMultiDict()),
+            ConnectionError(),
+        ]
+        results = ["200", "forbidden", "maintenance", "error"]
+        before = [REGISTRY.get_sample_value("tibiapy_upstream_requests_total", {"result": r}) or 0 for r in results]
+
+        with unittest.mock.patch.object(LiveTransport, "request", side_effect=responses):
+            transport = server.MetricsTransport()
+            for _ in range(3):
+                await transport.request(None, "GET", "https://www.tibia.com/")
+
+            with self.assertRaises(ConnectionError):
+                await transport.request(None, "GET", "https://www.tibia.com/")
+
+        after = [REGISTRY.get_sample_value("tibiapy_upstream_requests_total", {"result": r}) for r in results]
+        self.assertEqual([1, 1, 1, 1], [a - b for a, b in zip(after, before)])
+        self.assertEqual(0, REGISTRY.get_sample_value("tibiapy_upstream_requests_in_flight"))
+
+
+def tibia_response(data, expires_in):
+    """Create a response whose cache expires in the given number of seconds."""
+    timestamp = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=CACHE_LIMIT - expires_in)
+    return TibiaResponse(timestamp=timestamp, cached=False, age=0, fetching_time=0, parsing_time=0, data=data)
+
+
+@unittest.skipIf(server is None, "the server's dependencies are not installed")
+class TestRefresher(unittest.IsolatedAsyncioTestCase, TestCommons):
+    def fetcher(self, data, expires_in=60):
+        """Get a fetch function counting its calls, and whether they were made while refreshing."""
+        calls = []
+
+        async def fetch():
+            calls.append(_refreshing.get())
+            await asyncio.sleep(0)
+            return tibia_response(data, expires_in)
+
+        return fetch, calls
+
+    async def test_refresher_get(self):
+        """Testing sharing a fetch between concurrent requests and caching its response"""
+        refresher = server.Refresher()
+        fetch, calls = self.fetcher("world")
+
+        first, second = await asyncio.gather(refresher.get("key", fetch), refresher.get("key", fetch))
+        third = await refresher.get("key", fetch)
+
+        self.assertEqual([False], calls)
+        self.assertIs(first, second)
+        self.assertIs(first, third)
+        self.assertTrue(refresher.is_cached(first))
+        self.assertEqual(["key"], refresher.hot_keys())
+
+    async def test_refresher_get_expired(self):
+        """Testing fetching a response again after it expired"""
+        refresher = server.Refresher()
+        fetch, calls = self.fetcher("world", expires_in=0)
+
+        first = await refresher.get("key", fetch)
+        second = await refresher.get("key", fetch)
+
+        self.assertSizeEquals(calls, 2)
+        self.assertIsNot(first, second)
+        self.assertFalse(refresher.is_cached(first))
+        self.assertTrue(refresher.is_cached(second))
+
+    async def test_refresher_run(self):
+        """Testing refreshing a requested key in the background before it expires"""
+        refresher = server.Refresher(interval=0.01, margin=0.2, budget=100)
+        fetch, calls = self.fetcher("world", expires_in=0.5)
+        response = await refresher.get("key", fetch)
+        task = asyncio.create_task(refresher.run())
+        self.addCleanup(task.cancel)
+
+        async def refreshed():
+            while len(calls) < 2:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(refreshed(), 2)
+        await asyncio.sleep(0.01)
+        self.assertEqual([False, True], calls)
+        self.assertIsNot(response, await refresher.get("key", fetch))
+        self.assertSizeEquals(calls, 2)
+
+    async def test_refresher_run_budget(self):
+        """Testing not refreshing keys when there is no budget for upstream requests"""
+        refresher = server.Refresher(interval=0.01, margin=0.2, budget=0)
+        fetch, calls = self.fetcher("world", expires_in=0.3)
+        await refresher.get("key", fetch)
+        task = asyncio.create_task(refresher.run())
+        self.addCleanup(task.cancel)
+
+        await asyncio.sleep(0.4)
+
+        self.assertSizeEquals(calls, 1)
+
+    async def test_refresher_evict(self):
+        """Testing evicting the least requested key when the cache is full"""
+        refresher = server.Refresher(max_entries=2)
+        fetch, _ = self.fetcher("world")
+        first = await refresher.get("a", fetch)
+        await refresher.get("a", fetch)
+        second = await refresher.get("b", fetch)
+
+        await refresher.get("c", fetch)
+
+        self.assertEqual(["a", "c"], sorted(refresher.hot_keys()))
+        self.assertTrue(refresher.is_cached(first))
+        self.assertFalse(refresher.is_cached(second))
+
+
+@unittest.skipIf(server is None, "the server's dependencies are not installed")
+class TestChannel(unittest.IsolatedAsyncioTestCase, TestCommons):
+    def setUp(self):
+        patcher = unittest.mock.patch.object(server.app.state, "channels", {}, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def channel(self, *results, diff=None):
+        """Get a channel polling the given results, one per poll and then the last one, publishing the changes."""
+        results = list(results)
+
+        async def fetch():
+            result = results.pop(0) if len(results) > 1 else results[0]
+            if isinstance(result, Exception):
+                raise result
+
+            return tibia_response(result, 60)
+
+        def changes(previous, current):
+            return [("change", {"previous": previous, "current": current})] if previous != current else []
+
+        return server.get_channel("key", fetch, diff or changes, lambda data: {"value": data}, 0.01)
+
+    async def test_channel(self):
+        """Testing sending a snapshot and the changes found to every subscriber"""
+        channel = self.channel(1, 1, 2)
+
+        first = channel.subscribe()
+        self.assertEqual(("snapshot", {"value": 1}), await first.get())
+        self.assertEqual(("change", {"previous": 1, "current": 2}), await first.get())
+        second = channel.subscribe()
+        self.assertEqual(("snapshot", {"value": 2}), await second.get())
+
+        channel.unsubscribe(first)
+        self.assertIs(channel, server.app.state.channels["key"])
+        channel.unsubscribe(second)
+
+        self.assertEqual({}, server.app.state.channels)
+        self.assertIsNone(channel._task)
+
+    async def test_channel_fetch_error(self):
+        """Testing polling again after failing to fetch the resource"""
+        channel = self.channel(NetworkError("Request error"), 1)
+
+        queue = channel.subscribe()
+
+        self.assertEqual(("snapshot", {"value": 1}), await queue.get())
+        channel.close()
+
+    async def test_channel_diff_error(self):
+        """Testing closing the channel when the changes can't be found"""
+        def diff(previous, current):
+            raise ValueError(current)
+
+        channel = self.channel(1, 2, diff=diff)
+
+        queue = channel.subscribe()
+
+        with self.assertLogs("tibiapy", "ERROR"):
+            self.assertEqual(("snapshot", {"value": 1}), await queue.get())
+            self.assertIsNone(await queue.get())
+
+        self.assertEqual({}, server.app.state.channels)
+
+    async def test_event_stream(self):
+        """Testing sending the events of a channel as server-sent events"""
+        channel = self.channel({"name": "Galarzaa"})
+        response = server.event_stream(channel)
+
+        self.assertEqual("text/event-stream", response.media_type)
+        self.assertEqual('event: snapshot\ndata: {"value":{"name":"Galarzaa"}}\n\n',
+                         await response.body_iterator.__anext__())
+        channel.close()
+        with self.assertRaises(StopAsyncIteration):
+            await response.body_iterator.__anext__()
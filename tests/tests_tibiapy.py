@@ -54,3 +54,19 @@ class TestCommons(unittest.TestCase):
     def load_parsed_resource(resource):
         content = TestCommons.load_resource(resource)
         return tibiapy.utils.parse_tibiacom_content(content)
+
+
+class TestPackage(unittest.TestCase):
+    def test_lazy_attributes(self):
+        """Testing that the lazily imported attributes match the public API of their modules"""
+        for name in tibiapy.__all__:
+            self.assertIsNotNone(getattr(tibiapy, name))
+
+        modules = (tibiapy.cache, tibiapy.client, tibiapy.history, tibiapy.transport, tibiapy.watchers)
+        exported = {name for module in modules for name in module.__all__}
+        self.assertEqual(exported, set(tibiapy._LAZY_ATTRIBUTES))
+        errors = {name for name, value in vars(tibiapy.errors).items() if isinstance(value, type)
+                  and issubclass(value, Exception)}
+        self.assertEqual({*errors, *tibiapy._SUBMODULES, *exported}, set(tibiapy.__all__))
+        with self.assertRaises(AttributeError):
+            tibiapy.Unknown
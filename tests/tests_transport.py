@@ -0,0 +1,130 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from aioresponses import aioresponses
+from multidict import CIMultiDict
+
+from tests.tests_highscores import FILE_HIGHSCORES_FULL
+from tests.tests_tibiapy import TestCommons
+from tests.tests_world import FILE_WORLD_ONLINE
+from tibiapy import NetworkError
+from tibiapy.cache import MemoryCache
+from tibiapy.client import Client
+from tibiapy.enums import HighscoresCategory
+from tibiapy.models import Highscores, World
+from tibiapy.transport import CachingTransport, RecordingTransport, ReplayTransport, Transport, TransportResponse
+from tibiapy.urls import get_highscores_url, get_world_url
+
+
+class CountingTransport(Transport):
+    """A transport that counts the requests it performs, and how many of them were performed at the same time."""
+
+    def __init__(self, status: int, latency: float = 0.05):
+        self.status = status
+        self.latency = latency
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def request(self, session, method, url, data=None, headers=None):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        return TransportResponse(url, method=method, status=self.status, reason="", headers=CIMultiDict(),
+                                 content=str(self.calls))
+
+
+class TestTransport(unittest.IsolatedAsyncioTestCase, TestCommons):
+    def setUp(self):
+        fd, self.archive_path = tempfile.mkstemp(suffix=".jsonl.gz")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.archive_path)
+
+    @aioresponses()
+    async def test_transport_record_and_replay(self, mock):
+        """Testing recording responses and replaying them"""
+        mock.get(get_world_url("Gladera"), status=200, body=self.load_resource(FILE_WORLD_ONLINE),
+                 headers={"Age": "15"})
+        mock.get(get_highscores_url("Gladera", HighscoresCategory.MAGIC_LEVEL), status=200, body=self.load_resource(FILE_HIGHSCORES_FULL))
+        transport = RecordingTransport(self.archive_path)
+        client = Client(transport=transport)
+        live_world = await client.fetch_world("Gladera", stream=True)
+        live_highscores = await client.fetch_highscores_page("Gladera", HighscoresCategory.MAGIC_LEVEL)
+        await client.session.close()
+        transport.save()
+
+        self.assertEqual(2, transport.recorded_count)
+
+        client = Client(transport=ReplayTransport(self.archive_path, latency=0.001))
+        world = await client.fetch_world("Gladera")
+        streamed_world = await client.fetch_world("Gladera", stream=True)
+        highscores = await client.fetch_highscores_page("Gladera", HighscoresCategory.MAGIC_LEVEL)
+
+        self.assertIsInstance(world.data, World)
+        self.assertIsInstance(highscores.data, Highscores)
+        self.assertEqual(live_world.data, world.data)
+        self.assertEqual(world.data, streamed_world.data)
+        self.assertEqual(15, world.age)
+        self.assertEqual(live_highscores.data.entries, highscores.data.entries)
+
+        with self.assertRaises(NetworkError):
+            await client.fetch_world("Antica")
+
+        await client.session.close()
+
+    @aioresponses()
+    async def test_caching_transport(self, mock):
+        """Testing sharing responses between clients through a cache"""
+        mock.get(get_world_url("Gladera"), status=200, body=self.load_resource(FILE_WORLD_ONLINE),
+                 headers={"Age": "15"})
+        cache = MemoryCache()
+        first_client = Client(transport=CachingTransport(cache))
+        second_client = Client(transport=CachingTransport(cache))
+
+        first, second, streamed = await asyncio.gather(
+            first_client.fetch_world("Gladera"),
+            second_client.fetch_world("Gladera"),
+            second_client.fetch_world("Gladera", stream=True),
+        )
+        await first_client.session.close()
+        await second_client.session.close()
+
+        self.assertIsInstance(first.data, World)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first.data, streamed.data)
+        self.assertGreaterEqual(second.age, 15)
+        self.assertEqual(1, sum(len(calls) for calls in mock.requests.values()))
+
+    async def test_caching_transport_uncacheable(self):
+        """Testing that clients waiting for a response that can't be cached request it at the same time"""
+        counting = CountingTransport(500)
+        transport = CachingTransport(MemoryCache(), counting, poll_interval=0.01)
+
+        responses = await asyncio.gather(*(transport.request(None, "GET", "https://www.tibia.com") for _ in range(5)))
+
+        self.assertForAll(responses, lambda r: self.assertEqual(500, r.status))
+        self.assertEqual(5, counting.calls)
+        self.assertEqual(4, counting.max_in_flight)
+
+    async def test_caching_transport_refreshing(self):
+        """Testing requesting a cached response again"""
+        counting = CountingTransport(200, latency=0)
+        transport = CachingTransport(MemoryCache(), counting)
+
+        first = await transport.request(None, "GET", "https://www.tibia.com")
+        cached = await transport.request(None, "GET", "https://www.tibia.com")
+        with CachingTransport.refreshing():
+            refreshed = await asyncio.ensure_future(transport.request(None, "GET", "https://www.tibia.com"))
+        cached_refresh = await transport.request(None, "GET", "https://www.tibia.com")
+
+        self.assertEqual("1", first.content)
+        self.assertEqual("1", cached.content)
+        self.assertEqual("2", refreshed.content)
+        self.assertEqual("2", cached_refresh.content)
+        self.assertEqual(2, counting.calls)
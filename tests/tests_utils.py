@@ -124,6 +124,39 @@ class TestUtils(TestCommons):
         self.assertEqual("https://www.tibia.com/community/?subtopic=character&name=Fn%F6",
                          get_tibia_url("community", "character", name="Fnö"))
 
+    def test_parse_popups(self):
+        popups = [
+            "ActivateHelperDiv($(this), 'Gold Event', '<div>Gold:</div><div>&#8226; More gold</div>', '');",
+            "ActivateHelperDiv($(this), 'Broken', '<div><b>Unclosed</div>', '');",
+            "ActivateHelperDiv($(this), 'Silver', '<p>A &amp; B</p>', '');",
+        ]
+        parsed = utils.parse_popups(popups)
+
+        self.assertSizeEquals(parsed, 3)
+        for popup, (title, content) in zip(popups, parsed):
+            expected_title, expected_content = utils.parse_popup(popup)
+            self.assertEqual(expected_title, title)
+            self.assertEqual(expected_content.text, content.text)
+            self.assertEqual((expected_title, expected_content.text), utils.parse_popup_text(popup))
+
+        self.assertEqual(["Gold:", "• More gold"], [d.text for d in parsed[0][1].select("div")])
+        self.assertEqual([], utils.parse_popups([]))
+
+    def test_repair_self_closing_tags(self):
+        content = '<div class="A" /><div><br/><img src="a.gif" /><span title="1/2"/></div>'
+        self.assertEqual('<div class="A"><div><br/><img src="a.gif" /><span title="1/2"></div>',
+                         utils.repair_self_closing_tags(content))
+
+    def test_parse_tibiacom_content_bytes(self):
+        content = ('<html><head><meta charset="ISO-8859-1"></head>'
+                   '<body><div class="BoxContent">Fnö</div><div>Other</div></body></html>')
+
+        parsed_content = utils.parse_tibiacom_content(content)
+        parsed_bytes = utils.parse_tibiacom_content(content.encode())
+
+        self.assertEqual("Fnö", parsed_content.text)
+        self.assertEqual(parsed_content.text, parsed_bytes.text)
+
     def test_parse_pagination_collapsed_first_page(self):
         """Parsing with current page 1 out of 915"""
         content = """<td class="PageNavigation"><small><div style="float: left;"><b>» <span class="PageLink 
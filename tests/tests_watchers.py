@@ -0,0 +1,248 @@
+import asyncio
+import unittest
+
+from aioresponses import aioresponses
+
+from tests.tests_bazaar import FILE_BAZAAR_CURRENT, FILE_BAZAAR_CURRENT_EMPTY
+from tests.tests_character import FILE_CHARACTER_DEATHS_COMPLEX
+from tests.tests_tibiapy import TestCommons
+from tests.tests_world import FILE_WORLD_ONLINE
+from tibiapy.client import Client
+from tibiapy.enums import AuctionChangeType, AuctionStatus, BazaarType, CharacterActivity, CharacterChangeType
+from tibiapy.parsers import CharacterBazaarParser, CharacterParser, WorldParser
+from tibiapy.urls import get_bazaar_url, get_character_url, get_world_url
+from tibiapy.watchers import BazaarWatcher, CharacterScheduler, CharacterWatcher
+
+
+class TestBazaarWatcher(unittest.IsolatedAsyncioTestCase, TestCommons):
+    def setUp(self):
+        self.client = Client()
+        self.watcher = BazaarWatcher(self.client)
+
+    async def asyncTearDown(self):
+        await self.client.session.close()
+
+    def test_bazaar_watcher_process(self):
+        auctions = CharacterBazaarParser.from_content(self.load_resource(FILE_BAZAAR_CURRENT)).entries
+
+        changes = self.watcher.process(auctions)
+
+        self.assertSizeEquals(changes, len(auctions))
+        self.assertForAll(changes, lambda c: self.assertEqual(AuctionChangeType.ADDED, c.type))
+        self.assertEqual(len(auctions), self.watcher.tracked_count)
+        self.assertEqual([a.auction_id for a in auctions], self.watcher.queued_ids)
+
+        self.watcher._queue.clear()
+        self.assertIsEmpty(self.watcher.process(auctions))
+
+        outbid = auctions[0].model_copy(update={"bid": auctions[0].bid + 100})
+        changes = self.watcher.process([outbid, *auctions[1:-1]])
+
+        self.assertSizeEquals(changes, 1)
+        self.assertEqual(AuctionChangeType.CHANGED, changes[0].type)
+        self.assertEqual(auctions[0].bid, changes[0].previous_bid)
+        self.assertEqual(outbid, changes[0].auction)
+        self.assertEqual(len(auctions), self.watcher.tracked_count)
+
+        changes = self.watcher.process([outbid, *auctions[1:-1]])
+
+        self.assertSizeEquals(changes, 1)
+        self.assertEqual(AuctionChangeType.ENDED, changes[0].type)
+        self.assertEqual(auctions[-1].auction_id, changes[0].auction_id)
+        self.assertEqual(AuctionStatus.IN_PROGRESS, changes[0].previous_status)
+        self.assertIsNone(changes[0].auction)
+        self.assertEqual([auctions[0].auction_id, auctions[-1].auction_id], self.watcher.queued_ids)
+        self.assertEqual(len(auctions) - 1, self.watcher.tracked_count)
+
+    def test_bazaar_watcher_process_shifted(self):
+        """Testing that an auction missing from a single check is not considered ended"""
+        auctions = CharacterBazaarParser.from_content(self.load_resource(FILE_BAZAAR_CURRENT)).entries
+        self.watcher.process(auctions)
+
+        self.assertIsEmpty(self.watcher.process(auctions[1:]))
+        self.assertIsEmpty(self.watcher.process(auctions))
+        self.assertIsEmpty(self.watcher.process(auctions[1:]))
+        self.assertEqual(len(auctions), self.watcher.tracked_count)
+
+    def test_bazaar_watcher_process_incomplete(self):
+        auctions = CharacterBazaarParser.from_content(self.load_resource(FILE_BAZAAR_CURRENT)).entries
+        self.watcher.process(auctions)
+
+        self.assertIsEmpty(self.watcher.process(auctions[:1], complete=False))
+        self.assertEqual(len(auctions), self.watcher.tracked_count)
+
+    @aioresponses()
+    async def test_bazaar_watcher_check(self, mock):
+        content = self.load_resource(FILE_BAZAAR_CURRENT)
+        bazaar = CharacterBazaarParser.from_content(content)
+        mock.get(get_bazaar_url(BazaarType.CURRENT, 1), status=200, body=content)
+        mock.get(get_bazaar_url(BazaarType.CURRENT, 2), status=200, body=self.load_resource(FILE_BAZAAR_CURRENT_EMPTY))
+
+        changes = await self.watcher.check()
+
+        self.assertSizeEquals(changes, len(bazaar.entries))
+        self.assertSizeEquals(self.watcher.queued_ids, len(bazaar.entries))
+
+
+class TestCharacterWatcher(unittest.IsolatedAsyncioTestCase, TestCommons):
+    def setUp(self):
+        self.client = Client()
+        self.watcher = CharacterWatcher(self.client, ["Mercillezz"], interval=0.01)
+
+    async def asyncTearDown(self):
+        await self.client.session.close()
+
+    def test_character_watcher_process(self):
+        character = CharacterParser.from_content(self.load_resource(FILE_CHARACTER_DEATHS_COMPLEX))
+        previous = character.model_copy(update={"deaths": character.deaths[1:], "guild_membership": None})
+
+        self.assertIsEmpty(self.watcher.process(previous))
+        changes = self.watcher.process(character)
+
+        self.assertEqual([CharacterChangeType.DEATH, CharacterChangeType.GUILD], [c.type for c in changes])
+        self.assertEqual(character.deaths[0], changes[0].death)
+        self.assertIsNone(changes[1].previous_guild)
+        self.assertIsEmpty(self.watcher.process(character))
+
+    def test_character_watcher_process_world(self):
+        world = WorldParser.from_content(self.load_resource(FILE_WORLD_ONLINE), compact=True)
+        online_name = world.online_players[0].name
+        self.watcher.add(online_name.upper())
+
+        self.assertEqual(1, self.watcher.process_world(world))
+        self.assertEqual([online_name.upper()], self.watcher.online_names)
+        self.assertEqual([online_name.upper(), "Mercillezz"], self.watcher.schedule())
+
+        self.watcher.remove(online_name)
+        self.assertEqual(["Mercillezz"], self.watcher.names)
+        self.watcher.add(online_name)
+        self.assertIsEmpty(self.watcher.online_names)
+
+    @aioresponses()
+    async def test_character_watcher_watch(self, mock):
+        content = self.load_resource(FILE_CHARACTER_DEATHS_COMPLEX)
+        leveled = content.replace("Level:</td><td>804<", "Level:</td><td>805<")
+        mock.get(get_character_url("Mercillezz"), status=200, body=content)
+        mock.get(get_character_url("Mercillezz"), status=200, body=content)
+        mock.get(get_character_url("Mercillezz"), status=200, body=leveled)
+
+        self.assertNotEqual(CharacterParser.fingerprint(content), CharacterParser.fingerprint(leveled))
+        self.assertIsEmpty(await self.watcher.check("Mercillezz"))
+        changes = [c async for c in self.watcher.watch(rounds=2, track_online=False)]
+
+        self.assertSizeEquals(changes, 1)
+        self.assertEqual(CharacterChangeType.LEVEL, changes[0].type)
+        self.assertEqual(804, changes[0].previous_level)
+        self.assertEqual(805, changes[0].character.level)
+
+
+class TestCharacterScheduler(unittest.IsolatedAsyncioTestCase, TestCommons):
+    def setUp(self):
+        self.client = Client()
+
+    async def asyncTearDown(self):
+        await self.client.session.close()
+
+    async def test_character_scheduler_priorities(self):
+        world = WorldParser.from_content(self.load_resource(FILE_WORLD_ONLINE), compact=True)
+        online_name = world.online_players[0].name
+        scheduler = CharacterScheduler(self.client, ["Mercillezz", online_name],
+                                       intervals={CharacterActivity.ONLINE: 0.01})
+
+        self.assertEqual(2, scheduler.queue_depth)
+        self.assertEqual({"Mercillezz", online_name}, set(scheduler.pop()))
+        self.assertEqual(0, scheduler.queue_depth)
+        self.assertEqual(CharacterActivity.OFFLINE, scheduler.activity(online_name))
+
+        self.assertEqual(1, scheduler.process_world(world))
+        self.assertEqual(CharacterActivity.ONLINE, scheduler.activity(online_name))
+        self.assertEqual([world.name], scheduler.worlds)
+        await asyncio.sleep(0.02)
+        self.assertEqual([online_name], scheduler.pop())
+
+        scheduler.process_world(world.model_copy(update={"online_players": []}))
+        self.assertEqual(CharacterActivity.RECENTLY_ONLINE, scheduler.activity(online_name))
+
+        allocation = scheduler.allocation
+        self.assertEqual((1 / 120, 1 / 120), allocation[CharacterActivity.RECENTLY_ONLINE])
+        self.assertEqual((1 / 1800, 1 / 1800), allocation[CharacterActivity.OFFLINE])
+        self.assertEqual((0, 0), allocation[CharacterActivity.ONLINE])
+
+        scheduler.process_world(world)
+        scheduler.remove(online_name)
+        self.assertEqual(["Mercillezz"], scheduler.names)
+        scheduler.add(online_name)
+        self.assertEqual(CharacterActivity.OFFLINE, scheduler.activity(online_name))
+
+    @aioresponses()
+    async def test_character_scheduler_run(self, mock):
+        content = self.load_resource(FILE_WORLD_ONLINE)
+        world = WorldParser.from_content(content)
+        mock.get(get_world_url(world.name), status=200, body=content, repeat=True)
+        mock.get(get_character_url("Mercillezz"), status=200, body=self.load_resource(FILE_CHARACTER_DEATHS_COMPLEX),
+                 repeat=True)
+        scheduler = CharacterScheduler(self.client, ["Mercillezz"], worlds=[world.name], budget=100)
+
+        iterator = scheduler.run()
+        name, response = await iterator.__anext__()
+        await iterator.aclose()
+
+        self.assertEqual("Mercillezz", name)
+        self.assertEqual("Mercillezz", response.data.name)
+        self.assertIn(response.data.world, scheduler.worlds)
+
+    @aioresponses()
+    async def test_character_scheduler_run_watcher(self, mock):
+        """Testing that the scheduler learns the worlds of the characters checked by a watcher"""
+        content = self.load_resource(FILE_CHARACTER_DEATHS_COMPLEX)
+        character = CharacterParser.from_content(content)
+        mock.get(get_character_url("Mercillezz"), status=200, body=content, repeat=True)
+        mock.get(get_world_url(character.world), status=200, body=self.load_resource(FILE_WORLD_ONLINE), repeat=True)
+        watcher = CharacterWatcher(self.client, ["Mercillezz"])
+        scheduler = CharacterScheduler(self.client, ["Mercillezz"], budget=100)
+
+        iterator = scheduler.run(watcher=watcher)
+        name, changes = await iterator.__anext__()
+        await iterator.aclose()
+
+        self.assertEqual("Mercillezz", name)
+        self.assertIsEmpty(changes)
+        self.assertEqual(character.world, watcher.last_world(name))
+        self.assertEqual([character.world], scheduler.worlds)
+
+    async def test_character_scheduler_run_check_error(self):
+        """Testing that errors raised by the check are yielded instead of stopping the run"""
+        async def check(name):
+            raise KeyError(name)
+
+        scheduler = CharacterScheduler(self.client, ["Mercillezz"], budget=100)
+
+        iterator = scheduler.run(check)
+        name, error = await iterator.__anext__()
+        await iterator.aclose()
+
+        self.assertEqual("Mercillezz", name)
+        self.assertIsInstance(error, KeyError)
+
+    def test_character_scheduler_invalid_budget(self):
+        for budget in (0, -1):
+            with self.subTest(budget=budget), self.assertRaises(ValueError):
+                CharacterScheduler(self.client, budget=budget)
+
+    async def test_character_scheduler_run_world_error(self):
+        """Testing that errors processing a world are logged instead of stopping the run"""
+        async def fetch_world(world, **kwargs):
+            raise ValueError(world)
+
+        async def check(name):
+            return name
+
+        self.client.fetch_world = fetch_world
+        scheduler = CharacterScheduler(self.client, ["Mercillezz"], worlds=["Premia"], budget=100)
+
+        with self.assertLogs("tibiapy", "ERROR"):
+            iterator = scheduler.run(check)
+            result = await iterator.__anext__()
+            await iterator.aclose()
+
+        self.assertEqual(("Mercillezz", "Mercillezz"), result)
@@ -2,9 +2,9 @@ import datetime
 
 from tests.tests_tibiapy import TestCommons
 from tibiapy import InvalidContentError
-from tibiapy.enums import BattlEyeType, PvpType, TransferType, WorldLocation
-from tibiapy.models import World, WorldEntry, WorldOverview
-from tibiapy.parsers import WorldOverviewParser, WorldParser
+from tibiapy.enums import BattlEyeType, PvpType, TransferType, Vocation, WorldLocation
+from tibiapy.models import OnlineCharacter, OnlineCharacterRow, World, WorldEntry, WorldOverview
+from tibiapy.parsers import WorldOverviewParser, WorldParser, WorldStreamParser
 from tibiapy.urls import get_world_url
 
 FILE_WORLD_ONLINE = "world/worldOnline.txt"
@@ -34,6 +34,21 @@ class TestWorld(TestCommons):
         self.assertSizeEquals(world.online_players, world.online_count)
         self.assertEqual(get_world_url(world.name), world.url)
 
+    def test_world_parser_from_content_online_compact(self):
+        """Testing parsing a world with the online list as compact rows"""
+        content = self.load_resource(FILE_WORLD_ONLINE)
+
+        world = WorldParser.from_content(content, compact=True)
+
+        self.assertIsInstance(world, World)
+        self.assertSizeEquals(world.online_players, world.online_count)
+        self.assertForAll(world.online_players, lambda p: self.assertIsInstance(p, OnlineCharacterRow))
+        self.assertForAll(world.online_players, lambda p: self.assertIsInstance(p.vocation, Vocation))
+        self.assertIsInstance(world.online_players[0].to_model(), OnlineCharacter)
+        self.assertEqual(WorldParser.from_content(content).online_players,
+                         [p.to_model() for p in world.online_players])
+        self.assertEqual(world, World.model_validate_json(world.model_dump_json()))
+
     def test_world_parser_from_content_yellow_battleye(self):
         """Testing parsing a world with yellow BattlEye."""
         content = self.load_resource(FILE_WORLD_YELLOW_BE)
@@ -125,6 +140,45 @@ class TestWorld(TestCommons):
 
     # endregion
 
+    # region WorldStreamParser Tests
+    def test_world_stream_parser_feed(self):
+        """Testing parsing worlds in chunks gives the same results as parsing them whole"""
+        for resource in [FILE_WORLD_ONLINE, FILE_WORLD_YELLOW_BE, FILE_WORLD_UNPROTECTED, FILE_WORLD_NO_TITLES,
+                         FILE_WORLD_OFFLINE, FILE_WORLD_NEVER_ONLINE, FILE_WORLD_NOT_FOUND]:
+            with self.subTest(resource=resource):
+                content = self.load_resource(resource)
+                parser = WorldStreamParser()
+
+                players = []
+                for i in range(0, len(content), 1000):
+                    players.extend(parser.feed(content[i:i + 1000]))
+
+                players.extend(parser.close())
+
+                self.assertEqual(WorldParser.from_content(content), parser.world)
+                if parser.world:
+                    self.assertEqual(parser.world.online_players, players)
+
+    def test_world_stream_parser_iter_online_players(self):
+        """Testing iterating the online players of a world"""
+        content = self.load_resource(FILE_WORLD_ONLINE)
+
+        players = list(WorldStreamParser.iter_online_players(content, chunk_size=512))
+        rows = list(WorldStreamParser.iter_online_players(content, compact=True))
+
+        self.assertEqual(WorldParser.from_content(content).online_players, players)
+        self.assertEqual(WorldParser.from_content(content, compact=True).online_players, rows)
+        self.assertForAll(rows, lambda p: self.assertIsInstance(p, OnlineCharacterRow))
+
+    def test_world_stream_parser_unrelated_section(self):
+        """Testing parsing a world in chunks using an unrelated section"""
+        content = self.load_resource(self.FILE_UNRELATED_SECTION)
+
+        with self.assertRaises(InvalidContentError):
+            list(WorldStreamParser.iter_online_players(content))
+
+    # endregion
+
     # region WorldOverview Tests
     def test_world_overview_from_content(self):
         """Testing parsing world overview"""
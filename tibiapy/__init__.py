@@ -3,12 +3,118 @@ __version__ = "6.3.0"
 __author__ = "Allan Galarza"
 __license__ = "Apache-2.0 License"
 
+import importlib
 import logging
 from logging import NullHandler
+from typing import TYPE_CHECKING, Any
 
-from tibiapy.errors import *
-from tibiapy import models, enums, client, utils, parsers, urls
-from tibiapy.client import *
+from tibiapy.errors import (
+    EnumValueError,
+    Forbidden,
+    ForbiddenError,
+    InvalidContent,
+    InvalidContentError,
+    NetworkError,
+    SiteMaintenanceError,
+    TibiapyError,
+    TibiapyException,
+)
+
+if TYPE_CHECKING:
+    from tibiapy import builders, cache, client, enums, history, models, parsers, transport, urls, utils, watchers
+    from tibiapy.cache import CacheBackend, MemoryCache, RedisCache, SQLiteCache
+    from tibiapy.client import Client
+    from tibiapy.history import HighscoresChange, KillStatisticsHistory, compare_highscores
+    from tibiapy.transport import (
+        CachingTransport,
+        LiveTransport,
+        RecordingTransport,
+        ReplayTransport,
+        Transport,
+        TransportResponse,
+    )
+    from tibiapy.watchers import BazaarWatcher, CharacterScheduler, CharacterWatcher
+
+# Submodules and their classes are imported on first access, so using a single parser doesn't require importing
+# every model, parser and the HTTP client's dependencies.
+_SUBMODULES = {
+    "builders", "cache", "client", "enums", "history", "models", "parsers", "transport", "urls", "utils", "watchers",
+}
+_LAZY_ATTRIBUTES = {
+    "CacheBackend": "cache",
+    "MemoryCache": "cache",
+    "RedisCache": "cache",
+    "SQLiteCache": "cache",
+    "Client": "client",
+    "HighscoresChange": "history",
+    "KillStatisticsHistory": "history",
+    "compare_highscores": "history",
+    "LiveTransport": "transport",
+    "RecordingTransport": "transport",
+    "ReplayTransport": "transport",
+    "CachingTransport": "transport",
+    "Transport": "transport",
+    "TransportResponse": "transport",
+    "BazaarWatcher": "watchers",
+    "CharacterScheduler": "watchers",
+    "CharacterWatcher": "watchers",
+}
+
+__all__ = (
+    "BazaarWatcher",
+    "CacheBackend",
+    "CachingTransport",
+    "CharacterScheduler",
+    "CharacterWatcher",
+    "Client",
+    "EnumValueError",
+    "Forbidden",
+    "ForbiddenError",
+    "HighscoresChange",
+    "InvalidContent",
+    "InvalidContentError",
+    "KillStatisticsHistory",
+    "LiveTransport",
+    "MemoryCache",
+    "NetworkError",
+    "RecordingTransport",
+    "RedisCache",
+    "ReplayTransport",
+    "SQLiteCache",
+    "SiteMaintenanceError",
+    "TibiapyError",
+    "TibiapyException",
+    "Transport",
+    "TransportResponse",
+    "builders",
+    "cache",
+    "client",
+    "compare_highscores",
+    "enums",
+    "history",
+    "models",
+    "parsers",
+    "transport",
+    "urls",
+    "utils",
+    "watchers",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_ATTRIBUTES[name]}"), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES, *_LAZY_ATTRIBUTES})
 
 
 logging.getLogger(__name__).addHandler(NullHandler())
@@ -0,0 +1,270 @@
+"""Cache backends used to share responses between clients, e.g. between the workers of a server.
+
+.. versionadded:: 6.4.0
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+__all__ = (
+    "CacheBackend",
+    "MemoryCache",
+    "RedisCache",
+    "SQLiteCache",
+)
+
+# Number of writes between purges of expired entries.
+_PURGE_INTERVAL = 100
+
+
+class CacheBackend(ABC):
+    """Base class for all cache backends.
+
+    Values are stored as bytes, and expire after a number of seconds.
+
+    The following implement this class:
+
+    - :class:`.MemoryCache`
+    - :class:`.SQLiteCache`
+    - :class:`.RedisCache`
+
+    .. versionadded:: 6.4.0
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key:
+            The key of the value.
+
+        Returns
+        -------
+            The value, or :obj:`None` if it is not stored or it has expired.
+
+        """
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value in the cache, replacing any previous value.
+
+        Parameters
+        ----------
+        key:
+            The key of the value.
+        value:
+            The value to store.
+        ttl:
+            The number of seconds the value is kept for.
+
+        """
+        ...
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Store a value in the cache, only if the key is not stored already.
+
+        This is atomic, so it can be used as a lock between processes sharing the same cache.
+
+        Parameters
+        ----------
+        key:
+            The key of the value.
+        value:
+            The value to store.
+        ttl:
+            The number of seconds the value is kept for.
+
+        Returns
+        -------
+            Whether the value was stored.
+
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a value from the cache, if it is stored.
+
+        Parameters
+        ----------
+        key:
+            The key of the value.
+
+        """
+        ...
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the resources used by the backend."""
+
+
+class MemoryCache(CacheBackend):
+    """A cache stored in the memory of the current process.
+
+    .. versionadded:: 6.4.0
+    """
+
+    def __init__(self):
+        self._values: dict[str, tuple[bytes, float]] = {}
+        self._writes = 0
+
+    async def get(self, key: str) -> Optional[bytes]:  # noqa: D102
+        value, expires = self._values.get(key, (None, 0.0))
+        if value is not None and expires <= time.time():
+            del self._values[key]
+            return None
+
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:  # noqa: D102
+        self._write(key, value, ttl)
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:  # noqa: D102
+        if await self.get(key) is not None:
+            return False
+
+        self._write(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        self._values.pop(key, None)
+
+    def _write(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        self._values[key] = (value, now + ttl)
+        self._writes += 1
+        if self._writes % _PURGE_INTERVAL == 0:
+            self._values = {k: v for k, v in self._values.items() if v[1] > now}
+
+
+class SQLiteCache(CacheBackend):
+    """A cache stored in a SQLite database, which can be shared by multiple processes in the same host.
+
+    Queries are performed synchronously, as they only touch a local file and take a fraction of a millisecond.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The path to the database file.
+
+    """
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self.path = path
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False, timeout=10)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._execute("PRAGMA journal_mode=WAL")
+        self._execute("PRAGMA synchronous=NORMAL")
+        self._execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                      "expires REAL NOT NULL)")
+
+    async def get(self, key: str) -> Optional[bytes]:  # noqa: D102
+        row = self._execute("SELECT value FROM cache WHERE key = ? AND expires > ?", key, time.time()).fetchone()
+        return row[0] if row else None
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:  # noqa: D102
+        self._execute("INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)", key, value,
+                      time.time() + ttl)
+        self._purge()
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:  # noqa: D102
+        now = time.time()
+        cursor = self._execute(
+            "INSERT INTO cache (key, value, expires) VALUES (?, ?, ?) ON CONFLICT (key) "
+            "DO UPDATE SET value = excluded.value, expires = excluded.expires WHERE cache.expires <= ?",
+            key, value, now + ttl, now,
+        )
+        self._purge()
+        return cursor.rowcount == 1
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        self._execute("DELETE FROM cache WHERE key = ?", key)
+
+    async def close(self) -> None:  # noqa: D102
+        self._connection.close()
+
+    def _execute(self, query: str, *parameters: Any) -> sqlite3.Cursor:
+        with self._lock:
+            return self._connection.execute(query, parameters)
+
+    def _purge(self) -> None:
+        self._writes += 1
+        if self._writes % _PURGE_INTERVAL == 0:
+            self._execute("DELETE FROM cache WHERE expires <= ?", time.time())
+
+
+class RedisCache(CacheBackend):
+    """A cache stored in a Redis server, which can be shared by multiple hosts.
+
+    Any client with the same interface as :class:`redis.asyncio.Redis` can be used.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    client:
+        The asynchronous Redis client.
+    prefix: :class:`str`
+        A prefix added to every key.
+
+    """
+
+    def __init__(self, client: Any, *, prefix: str = "tibiapy:"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, *, prefix: str = "tibiapy:") -> Self:
+        """Create a cache connected to a Redis server.
+
+        This requires the ``redis`` package to be installed.
+
+        Parameters
+        ----------
+        url:
+            The URL of the server, e.g. ``redis://localhost:6379/0``.
+        prefix:
+            A prefix added to every key.
+
+        Returns
+        -------
+            The cache, using a client connected to the server.
+
+        """
+        # redis is an optional dependency, only needed when this backend is used.
+        import redis.asyncio  # noqa: PLC0415
+
+        return cls(redis.asyncio.Redis.from_url(url), prefix=prefix)
+
+    async def get(self, key: str) -> Optional[bytes]:  # noqa: D102
+        return await self.client.get(self.prefix + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:  # noqa: D102
+        if ttl <= 0:
+            await self.delete(key)
+            return
+
+        await self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:  # noqa: D102
+        return bool(await self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)), nx=True))
+
+    async def delete(self, key: str) -> None:  # noqa: D102
+        await self.client.delete(self.prefix + key)
+
+    async def close(self) -> None:  # noqa: D102
+        await self.client.aclose()
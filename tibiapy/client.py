@@ -2,14 +2,13 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import datetime
 import json
 import logging
 import time
-from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
-
-import aiohttp
-import aiohttp_socks
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union
 
 import tibiapy
 from tibiapy.enums import (
@@ -59,7 +58,9 @@ from tibiapy.parsers import (
     SpellsSectionParser,
     WorldOverviewParser,
     WorldParser,
+    WorldStreamParser,
 )
+from tibiapy.transport import LiveTransport
 from tibiapy.urls import (
     get_auction_url,
     get_bazaar_url,
@@ -96,6 +97,9 @@ from tibiapy.urls import (
 )
 
 if TYPE_CHECKING:
+    import aiohttp
+
+    from tibiapy.transport import Transport, TransportResponse
     from tibiapy.models import (
         AjaxPaginator,
         Auction,
@@ -141,22 +145,35 @@ log = logging.getLogger("tibiapy")
 
 
 class _RawResponse:
-    def __init__(self, response: aiohttp.ClientResponse, fetching_time: float):
+    def __init__(self, response: TransportResponse, fetching_time: float):
         self.timestamp = datetime.datetime.now(datetime.timezone.utc)
         self.fetching_time = fetching_time
         self.url = response.url
         self.cached = response.headers.get("CF-Cache-Status") == "HIT"
         age = response.headers.get("Age")
         self.age = int(age) if age is not None and age.isnumeric() else 0
-        self.content = None
+        self._response = response
+
+    @property
+    def content(self) -> str:
+        return self._response.content
+
+    @property
+    def markup(self) -> Union[str, bytes]:
+        """The body as it should be passed to parsers that accept bytes, avoiding decoding it beforehand."""
+        body = self._response.body
+        if body is not None and codecs.lookup(self._response.encoding).name == "utf-8":
+            return body
+
+        return self.content
 
     def __repr__(self):
         return (f"<{self.__class__.__name__} timestamp={self.timestamp!r} fetching_time={self.fetching_time!r} "
                 f"cached={self.cached!r} age={self.age!r}>")
 
-    def parse(self, parser: Callable[[str], T]) -> TibiaResponse[T]:
+    def parse(self, parser: Callable[[Union[str, bytes]], T], *, raw: bool = False) -> TibiaResponse[T]:
         start_time = time.perf_counter()
-        data = parser(self.content)
+        data = parser(self.markup if raw else self.content)
         parsing_time = time.perf_counter() - start_time
         log.info("%s | PARSE | %dms", self.url, int(parsing_time * 1000))
         return TibiaResponse.from_raw(self, data, parsing_time)
@@ -184,6 +201,15 @@ class Client:
     proxy_url: :class:`str`
         The URL of the SOCKS proxy to use for requests.
         Note that if a session is passed, the SOCKS proxy won't be used and must be applied when creating the session.
+    max_concurrent_requests: :class:`int`
+        The maximum number of requests to Tibia.com that can be performed at the same time.
+        By default, there is no limit.
+
+        .. versionadded:: 6.4.0
+    transport: :class:`Transport`
+        The transport used to perform the requests. By default, requests are made to Tibia.com using the session.
+
+        .. versionadded:: 6.4.0
 
     """
 
@@ -193,10 +219,18 @@ class Client:
             session: aiohttp.ClientSession = None,
             *,
             proxy_url: str = None,
+            max_concurrent_requests: Optional[int] = None,
+            transport: Optional[Transport] = None,
     ):
+        if max_concurrent_requests is not None and max_concurrent_requests < 1:
+            raise ValueError("max_concurrent_requests must be 1 or greater.")
+
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
         self._session_ready = asyncio.Event()
         self.proxy_url = proxy_url
+        self.max_concurrent_requests = max_concurrent_requests
+        self._limiter = asyncio.Semaphore(max_concurrent_requests) if max_concurrent_requests else None
+        self.transport: Transport = transport or LiveTransport()
         if session is not None:
             self.session: aiohttp.ClientSession = session
             self._session_ready.set()
@@ -211,7 +245,15 @@ class Client:
             "User-Agent": f"Tibia.py/{tibiapy.__version__} (+https://github.com/Galarzaa90/tibia.py)",
             "Accept-Encoding": "deflate, gzip",
         }
-        connector = aiohttp_socks.SocksConnector.from_url(proxy_url) if proxy_url else None
+        # aiohttp is only imported once a session is needed, so parsing doesn't pay for importing it.
+        import aiohttp  # noqa: PLC0415
+
+        connector = None
+        if proxy_url:
+            import aiohttp_socks  # noqa: PLC0415
+
+            connector = aiohttp_socks.SocksConnector.from_url(proxy_url)
+
         self.session: aiohttp.ClientSession = aiohttp.ClientSession(
             loop=self.loop,
             headers=headers,
@@ -238,6 +280,7 @@ class Client:
             headers: dict[str, Any] = None,
             *,
             test: bool = False,
+            consumer: Optional[Callable[[str], Any]] = None,
     ):
         """Perform the HTTP request, handling possible error statuses.
 
@@ -253,6 +296,12 @@ class Client:
             A mapping representing the headers to send as part of the request.
         test:
             Whether to request the test website instead.
+        consumer:
+            If set, the body is passed to this callable in chunks while it is being downloaded.
+
+            Errors raised by the consumer stop the body from being passed to it, but they are only raised once the
+            response's status has been checked, as they are usually caused by an error page. They are raised as they
+            are, without being wrapped.
 
         Returns
         -------
@@ -272,19 +321,43 @@ class Client:
         if test:
             url = url.replace("www.tibia.com", "www.test.tibia.com")
 
+        if self._limiter is None:
+            return await self._perform_request(method, url, data, headers, consumer)
+
+        async with self._limiter:
+            return await self._perform_request(method, url, data, headers, consumer)
+
+    async def _perform_request(
+            self,
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]],
+            headers: Optional[dict[str, Any]],
+            consumer: Optional[Callable[[str], Any]] = None,
+    ) -> _RawResponse:
+        """Perform the HTTP request, without waiting for the client's limiter."""
+        # Already imported when the session was created, these are only needed for the exception types.
+        import aiohttp  # noqa: PLC0415
+        import aiohttp_socks  # noqa: PLC0415
+
         init_time = time.perf_counter()
+        consumer_errors = []
+
+        def feed(chunk: str) -> None:
+            if consumer_errors:
+                return
+
+            try:
+                consumer(chunk)
+            except Exception as e:
+                consumer_errors.append(e)
+
         try:
-            async with self.session.request(method, url, data=data, headers=headers) as resp:
-                diff_time = time.perf_counter() - init_time
-                if "maintenance.tibia.com" in str(resp.url):
-                    log.info("%s | %s | %s %s | maintenance.tibia.com", url, resp.method, resp.status, resp.reason)
-                    raise SiteMaintenanceError("Tibia.com is down for maintenance.")
-
-                log.info("%s | %s | %s %s | %dms", url, resp.method, resp.status, resp.reason, int(diff_time * 1000))
-                self._handle_status(resp.status, diff_time)
-                response = _RawResponse(resp, diff_time)
-                response.content = await resp.text()
-                return response
+            if consumer is None:
+                resp = await self.transport.request(self.session, method, url, data, headers)
+            else:
+                resp = await self.transport.stream(self.session, method, url, consumer=feed, data=data,
+                                                   headers=headers)
         except aiohttp.ClientError as e:
             raise NetworkError(f"aiohttp.ClientError: {e}", e, time.perf_counter() - init_time) from e
         except aiohttp_socks.SocksConnectionError as e:
@@ -292,6 +365,18 @@ class Client:
         except UnicodeDecodeError as e:
             raise NetworkError(f"UnicodeDecodeError: {e}", e, time.perf_counter() - init_time) from e
 
+        diff_time = time.perf_counter() - init_time
+        if "maintenance.tibia.com" in resp.url:
+            log.info("%s | %s | %s %s | maintenance.tibia.com", url, resp.method, resp.status, resp.reason)
+            raise SiteMaintenanceError("Tibia.com is down for maintenance.")
+
+        log.info("%s | %s | %s %s | %dms", url, resp.method, resp.status, resp.reason, int(diff_time * 1000))
+        self._handle_status(resp.status, diff_time)
+        if consumer_errors:
+            raise consumer_errors[0]
+
+        return _RawResponse(resp, diff_time)
+
     async def _fetch_all_pages(self, auction_id: int, paginator: AjaxPaginator, item_type: int, *, test: bool = False):
         """Fetch all the pages of an auction paginator.
 
@@ -388,7 +473,7 @@ class Client:
 
         """
         response = await self._request("GET", get_news_archive_url(), test=test)
-        return response.parse(CreaturesSectionParser.boosted_creature_from_header)
+        return response.parse(CreaturesSectionParser.boosted_creature_from_header, raw=True)
 
     async def fetch_boosted_creature_and_boss(self, *, test: bool = False) -> TibiaResponse[BoostedCreatures]:
         """Fetch today's boosted creature and boss.
@@ -415,7 +500,7 @@ class Client:
 
         """
         response = await self._request("GET", get_news_archive_url(), test=test)
-        return response.parse(BoostedCreaturesParser.from_header)
+        return response.parse(BoostedCreaturesParser.from_header, raw=True)
 
     # region Bosses
     async def fetch_boosted_boss(self, *, test: bool = False) -> TibiaResponse[BossEntry]:
@@ -443,7 +528,7 @@ class Client:
 
         """
         response = await self._request("GET", get_news_archive_url(), test=test)
-        return response.parse(BoostableBossesParser.boosted_boss_from_header)
+        return response.parse(BoostableBossesParser.boosted_boss_from_header, raw=True)
 
     # endregion
 
@@ -497,7 +582,7 @@ class Client:
 
         form_data = NewsArchiveParser.get_form_data(from_date, to_date, categories, types)
         response = await self._request("POST", get_news_archive_url(), form_data, test=test)
-        return response.parse(NewsArchiveParser.from_content)
+        return response.parse(NewsArchiveParser.from_content, raw=True)
 
     async def fetch_news_archive_by_days(
             self,
@@ -573,7 +658,7 @@ class Client:
 
         """
         response = await self._request("GET", get_news_url(news_id), test=test)
-        return response.parse(lambda r: NewsParser.from_content(r, news_id))
+        return response.parse(lambda r: NewsParser.from_content(r, news_id), raw=True)
 
     async def fetch_event_schedule(
             self,
@@ -615,7 +700,7 @@ class Client:
             raise ValueError("both year and month must be defined or neither must be defined.")
 
         response = await self._request("GET", get_event_schedule_url(month, year), test=test)
-        return response.parse(EventScheduleParser.from_content)
+        return response.parse(EventScheduleParser.from_content, raw=True)
 
     # endregion
 
@@ -646,7 +731,7 @@ class Client:
 
         """
         response = await self._request("GET", get_creatures_section_url(), test=test)
-        return response.parse(CreaturesSectionParser.from_content)
+        return response.parse(CreaturesSectionParser.from_content, raw=True)
 
     async def fetch_creature(self, identifier: str, *, test: bool = False) -> TibiaResponse[Optional[Creature]]:
         """Fetch a creature's information from the Tibia.com library.
@@ -675,7 +760,7 @@ class Client:
 
         """
         response = await self._request("GET", get_creature_url(identifier), test=test)
-        return response.parse(CreatureParser.from_content)
+        return response.parse(CreatureParser.from_content, raw=True)
 
     async def fetch_boostable_bosses(self, *, test: bool = False) -> TibiaResponse[BoostableBosses]:
         """Fetch the boostable bosses from the library section.
@@ -702,7 +787,7 @@ class Client:
 
         """
         response = await self._request("GET", get_boostable_bosses_url(), test=test)
-        return response.parse(BoostableBossesParser.from_content)
+        return response.parse(BoostableBossesParser.from_content, raw=True)
 
     async def fetch_spells(self, *,
                            vocation: Optional[SpellVocationFilter] = None,
@@ -745,7 +830,7 @@ class Client:
         response = await self._request("GET", get_spells_section_url(vocation=vocation, group=group,
                                                                      spell_type=spell_type, is_premium=is_premium,
                                                                      sort=sort), test=test)
-        return response.parse(SpellsSectionParser.from_content)
+        return response.parse(SpellsSectionParser.from_content, raw=True)
 
     async def fetch_spell(self, identifier: str, *, test: bool = False) -> TibiaResponse[Optional[Spell]]:
         """Fetch a spell by its identifier.
@@ -772,7 +857,7 @@ class Client:
 
         """
         response = await self._request("GET", get_spell_url(identifier), test=test)
-        return response.parse(SpellParser.from_content)
+        return response.parse(SpellParser.from_content, raw=True)
 
     # endregion
 
@@ -803,7 +888,39 @@ class Client:
 
         """
         response = await self._request("GET", get_character_url(name.strip()), test=test)
-        return response.parse(CharacterParser.from_content)
+        return response.parse(CharacterParser.from_content, raw=True)
+
+    async def fetch_character_page(self, name: str, *, test: bool = False) -> TibiaResponse[Union[str, bytes]]:
+        """Fetch the page of a character from Tibia.com, without parsing it.
+
+        This allows checking the page, e.g. with :meth:`CharacterParser.fingerprint`, before deciding to parse it with
+        :meth:`CharacterParser.from_content`.
+
+        .. versionadded:: 6.4.0
+
+        Parameters
+        ----------
+        name:
+            The name of the character.
+        test:
+            Whether to request the test website instead.
+
+        Returns
+        -------
+        TibiaResponse[Union[str, bytes]]
+            A response containing the content of the page, as bytes if it can be passed to parsers without decoding it.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+
+        """
+        response = await self._request("GET", get_character_url(name.strip()), test=test)
+        return response.parse(lambda markup: markup, raw=True)
 
     async def fetch_world_overview(self, *, test: bool = False) -> TibiaResponse[WorldOverview]:
         """Fetch the world overview information from Tibia.com.
@@ -828,15 +945,30 @@ class Client:
 
         """
         response = await self._request("GET", get_world_overview_url(), test=test)
-        return response.parse(WorldOverviewParser.from_content)
+        return response.parse(WorldOverviewParser.from_content, raw=True)
 
-    async def fetch_world(self, name: str, *, test: bool = False) -> TibiaResponse[Optional[World]]:
+    async def fetch_world(
+            self,
+            name: str,
+            *,
+            compact: bool = False,
+            stream: bool = False,
+            test: bool = False,
+    ) -> TibiaResponse[Optional[World]]:
         """Fetch a world from Tibia.com.
 
         Parameters
         ----------
         name: :class:`str`
             The name of the world.
+        compact:
+            Whether to store the online players as :class:`OnlineCharacterRow` instead of full models.
+
+            .. versionadded:: 6.4.0
+        stream:
+            Whether to parse the page using :class:`WorldStreamParser` while it is being downloaded.
+
+            .. versionadded:: 6.4.0
         test:
             Whether to request the test website instead.
 
@@ -854,8 +986,18 @@ class Client:
             If there's any connection errors during the request.
 
         """
-        response = await self._request("GET", get_world_url(name), test=test)
-        return response.parse(WorldParser.from_content)
+        if not stream:
+            response = await self._request("GET", get_world_url(name), test=test)
+            return response.parse(lambda c: WorldParser.from_content(c, compact=compact), raw=True)
+
+        parser = WorldStreamParser(compact=compact)
+
+        def finish(_: str) -> Optional[World]:
+            parser.close()
+            return parser.world
+
+        response = await self._request("GET", get_world_url(name), test=test, consumer=parser.feed)
+        return response.parse(finish)
 
     async def fetch_highscores_page(
             self,
@@ -866,6 +1008,7 @@ class Client:
             battleye_type: Optional[HighscoresBattlEyeType] = None,
             pvp_types: set[PvpTypeFilter] = None,
             *,
+            compact: bool = False,
             test: bool = False,
     ) -> TibiaResponse[Optional[Highscores]]:
         """Fetch a single highscores page from Tibia.com.
@@ -888,6 +1031,10 @@ class Client:
             The type of BattlEye protection to display results from.
         pvp_types:
             The list of PvP types to filter the results for.
+        compact:
+            Whether to store the entries as :class:`HighscoresRow` instead of full models.
+
+            .. versionadded:: 6.4.0
         test:
             Whether to request the test website instead.
 
@@ -917,7 +1064,7 @@ class Client:
         response = await self._request("GET", get_highscores_url(world, category,
                                                                  vocation, page, battleye_type,
                                                                  pvp_types), test=test)
-        return response.parse(HighscoresParser.from_content)
+        return response.parse(lambda c: HighscoresParser.from_content(c, compact=compact))
 
     async def fetch_leaderboard(
             self,
@@ -956,12 +1103,13 @@ class Client:
 
         """
         response = await self._request("GET", get_leaderboards_url(world, rotation, page), test=test)
-        return response.parse(LeaderboardParser.from_content)
+        return response.parse(LeaderboardParser.from_content, raw=True)
 
     async def fetch_kill_statistics(
             self,
             world: str,
             *,
+            compact: bool = False,
             test: bool = False,
     ) -> TibiaResponse[Optional[KillStatistics]]:
         """Fetch the kill statistics of a world from Tibia.com.
@@ -970,6 +1118,10 @@ class Client:
         ----------
         world:
             The name of the world.
+        compact:
+            Whether to store the entries as :class:`RaceRow` instead of full models.
+
+            .. versionadded:: 6.4.0
         test:
             Whether to request the test website instead.
 
@@ -988,7 +1140,7 @@ class Client:
 
         """
         response = await self._request("GET", get_kill_statistics_url(world), test=test)
-        return response.parse(KillStatisticsParser.from_content)
+        return response.parse(lambda c: KillStatisticsParser.from_content(c, compact=compact), raw=True)
 
     async def fetch_houses_section(
             self,
@@ -1036,7 +1188,7 @@ class Client:
         """
         response = await self._request("GET", get_houses_section_url(world=world, town=town, house_type=house_type,
                                                                      status=status, order=order), test=test)
-        return response.parse(HousesSectionParser.from_content)
+        return response.parse(HousesSectionParser.from_content, raw=True)
 
     async def fetch_house(self, house_id: int, world: str, *, test: bool = False) -> TibiaResponse[Optional[House]]:
         """Fetch a house in a specific world by its id.
@@ -1065,7 +1217,7 @@ class Client:
 
         """
         response = await self._request("GET", get_house_url(world, house_id), test=test)
-        return response.parse(HouseParser.from_content)
+        return response.parse(HouseParser.from_content, raw=True)
 
     async def fetch_world_guilds(self, world: str, *, test: bool = False) -> TibiaResponse[GuildsSection]:
         """Fetch the list of guilds in a world from Tibia.com.
@@ -1098,15 +1250,25 @@ class Client:
 
         """
         response = await self._request("GET", get_world_guilds_url(world), test=test)
-        return response.parse(GuildsSectionParser.from_content)
+        return response.parse(GuildsSectionParser.from_content, raw=True)
 
-    async def fetch_guild(self, name: str, *, test: bool = False) -> TibiaResponse[Optional[Guild]]:
+    async def fetch_guild(
+            self,
+            name: str,
+            *,
+            compact: bool = False,
+            test: bool = False,
+    ) -> TibiaResponse[Optional[Guild]]:
         """Fetch a guild by its name from Tibia.com.
 
         Parameters
         ----------
         name:
             The name of the guild. The case must match exactly.
+        compact:
+            Whether to store the members as :class:`GuildMemberRow` instead of full models.
+
+            .. versionadded:: 6.4.0
         test:
             Whether to request the test website instead.
 
@@ -1125,7 +1287,7 @@ class Client:
 
         """
         response = await self._request("GET", get_guild_url(name), test=test)
-        return response.parse(GuildParser.from_content)
+        return response.parse(lambda c: GuildParser.from_content(c, compact=compact), raw=True)
 
     async def fetch_guild_wars(self, name: str, *, test: bool = False) -> TibiaResponse[Optional[GuildWars]]:
         """Fetch a guild's wars by its name from Tibia.com.
@@ -1157,7 +1319,7 @@ class Client:
 
         """
         response = await self._request("GET", get_guild_wars_url(name), test=test)
-        return response.parse(GuildWarsParser.from_content)
+        return response.parse(GuildWarsParser.from_content, raw=True)
 
     async def fetch_fansites_section(self, *, test: bool = False) -> TibiaResponse[FansitesSection]:
         """Fetch the fansites section from Tibia.com.
@@ -1184,7 +1346,7 @@ class Client:
 
         """
         response = await self._request("GET", get_fansites_url(), test=test)
-        return response.parse(FansitesSectionParser.from_content)
+        return response.parse(FansitesSectionParser.from_content, raw=True)
 
     # endregion
 
@@ -1219,7 +1381,7 @@ class Client:
 
         """
         response = await self._request("GET", get_forum_section_url(section_id), test=test)
-        return response.parse(ForumSectionParser.from_content)
+        return response.parse(ForumSectionParser.from_content, raw=True)
 
     async def fetch_forum_world_boards(self, *, test: bool = False) -> TibiaResponse[Optional[ForumSection]]:
         """Fetch the forum's world boards.
@@ -1246,7 +1408,7 @@ class Client:
 
         """
         response = await self._request("GET", get_world_boards_url(), test=test)
-        return response.parse(ForumSectionParser.from_content)
+        return response.parse(ForumSectionParser.from_content, raw=True)
 
     async def fetch_forum_trade_boards(self, *, test: bool = False) -> TibiaResponse[Optional[ForumSection]]:
         """Fetch the forum's trade boards.
@@ -1273,7 +1435,7 @@ class Client:
 
         """
         response = await self._request("GET", get_trade_boards_url(), test=test)
-        return response.parse(ForumSectionParser.from_content)
+        return response.parse(ForumSectionParser.from_content, raw=True)
 
     async def fetch_forum_community_boards(self, *, test: bool = False) -> TibiaResponse[Optional[ForumSection]]:
         """Fetch the forum's community boards.
@@ -1300,7 +1462,7 @@ class Client:
 
         """
         response = await self._request("GET", get_community_boards_url(), test=test)
-        return response.parse(ForumSectionParser.from_content)
+        return response.parse(ForumSectionParser.from_content, raw=True)
 
     async def fetch_forum_support_boards(self, *, test: bool = False) -> TibiaResponse[Optional[ForumSection]]:
         """Fetch the forum's community boards.
@@ -1327,7 +1489,7 @@ class Client:
 
         """
         response = await self._request("GET", get_support_boards_url(), test=test)
-        return response.parse(ForumSectionParser.from_content)
+        return response.parse(ForumSectionParser.from_content, raw=True)
 
     async def fetch_forum_board(self, board_id: int, page: int = 1, age: int = None, *,
                                 test: bool = False) -> TibiaResponse[Optional[ForumBoard]]:
@@ -1363,7 +1525,7 @@ class Client:
 
         """
         response = await self._request("GET", get_forum_board_url(board_id, page, age), test=test)
-        return response.parse(ForumBoardParser.from_content)
+        return response.parse(ForumBoardParser.from_content, raw=True)
 
     async def fetch_forum_thread(self, thread_id: int, page: int = 1, *,
                                  test: bool = False) -> TibiaResponse[Optional[ForumThread]]:
@@ -1395,7 +1557,7 @@ class Client:
 
         """
         response = await self._request("GET", get_forum_thread_url(thread_id, page), test=test)
-        return response.parse(ForumThreadParser.from_content)
+        return response.parse(ForumThreadParser.from_content, raw=True)
 
     async def fetch_forum_post(self, post_id: int, *, test: bool = False) -> TibiaResponse[Optional[ForumThread]]:
         """Fetch a forum post with a given id.
@@ -1429,7 +1591,7 @@ class Client:
 
         """
         response = await self._request("GET", get_forum_post_url(post_id), test=test)
-        built_response = response.parse(ForumThreadParser.from_content)
+        built_response = response.parse(ForumThreadParser.from_content, raw=True)
         if built_response.data is None:
             return built_response
 
@@ -1468,7 +1630,7 @@ class Client:
 
         """
         response = await self._request("GET", get_forum_announcement_url(announcement_id), test=test)
-        return response.parse(lambda c: ForumAnnouncementParser.from_content(c, announcement_id))
+        return response.parse(lambda c: ForumAnnouncementParser.from_content(c, announcement_id), raw=True)
 
     async def fetch_cm_post_archive(
             self,
@@ -1516,7 +1678,7 @@ class Client:
             raise ValueError("page cannot be lower than 1.")
 
         response = await self._request("GET", get_cm_post_archive_url(start_date, end_date, page), test=test)
-        return response.parse(CMPostArchiveParser.from_content)
+        return response.parse(CMPostArchiveParser.from_content, raw=True)
 
     # endregion
 
@@ -1609,6 +1771,7 @@ class Client:
             fetch_outfits: bool = False,
             fetch_familiars: bool = False,
             skip_details: bool = False,
+            lazy_details: bool = False,
             test: bool = False,
     ) -> TibiaResponse[Optional[Auction]]:
         """Fetch an auction by its ID.
@@ -1632,6 +1795,10 @@ class Client:
 
             This allows fetching basic information like name, level, vocation, world, bid and status, shaving off some
             parsing time.
+        lazy_details:
+            Whether to parse each section of the auction's details only when it is first accessed.
+
+            .. versionadded:: 6.4.0
         test:
             Whether to request the test website instead.
 
@@ -1655,7 +1822,9 @@ class Client:
             raise ValueError("auction_id must be 1 or greater.")
 
         response = await self._request("GET", get_auction_url(auction_id), test=test)
-        tibia_response = response.parse(lambda c: AuctionParser.from_content(c, auction_id, skip_details))
+        tibia_response = response.parse(
+            lambda c: AuctionParser.from_content(c, auction_id, skip_details, lazy_details=lazy_details),
+        )
         if tibia_response.data is None:
             return tibia_response
 
@@ -1678,4 +1847,111 @@ class Client:
 
         return tibia_response
 
+    async def fetch_auctions(
+            self,
+            auction_ids: Iterable[int],
+            *,
+            fetch_items: bool = False,
+            fetch_mounts: bool = False,
+            fetch_outfits: bool = False,
+            fetch_familiars: bool = False,
+            skip_details: bool = False,
+            lazy_details: bool = False,
+            concurrency: int = 5,
+            test: bool = False,
+    ) -> AsyncIterator[tuple[int, Union[TibiaResponse[Optional[Auction]], Exception]]]:
+        """Fetch multiple auctions by their IDs, concurrently.
+
+        Results are yielded as soon as each auction is fetched, so they may not be in the same order as the IDs.
+
+        Errors are yielded instead of raised, so a single failed auction does not interrupt the rest.
+        Errors raised while iterating the IDs are raised instead, as no more auctions can be fetched.
+
+        At most ``concurrency`` results are fetched ahead of the consumer, so IDs are only taken as results are
+        consumed.
+
+        If the client has a limit of concurrent requests, it is also respected.
+
+        .. versionadded:: 6.4.0
+
+        Parameters
+        ----------
+        auction_ids:
+            The IDs of the auctions to fetch.
+        fetch_items:
+            Whether to fetch all the character's items. By default, only the first page is fetched.
+        fetch_mounts:
+            Whether to fetch all the character's mounts. By default, only the first page is fetched.
+        fetch_outfits:
+            Whether to fetch all the character's outfits. By default, only the first page is fetched.
+        fetch_familiars:
+            Whether to fetch all the character's outfits. By default, only the first page is fetched.
+        skip_details:
+            Whether to skip parsing the entire auction and only parse the information shown in lists. False by default.
+        lazy_details:
+            Whether to parse each section of the auction's details only when it is first accessed.
+        concurrency:
+            The maximum number of auctions to fetch at the same time.
+        test:
+            Whether to request the test website instead.
+
+        Yields
+        ------
+        tuple[int, TibiaResponse[Optional[Auction]] | Exception]
+            The ID of the auction, and either the response or the exception raised while fetching it.
+
+        Raises
+        ------
+        ValueError
+            If the concurrency is not 1 or greater.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be 1 or greater.")
+
+        pending_ids = iter(auction_ids)
+        results: asyncio.Queue[Union[tuple[int, Any], Exception, None]] = asyncio.Queue(maxsize=concurrency)
+
+        async def worker() -> None:
+            try:
+                for auction_id in pending_ids:
+                    try:
+                        result = await self.fetch_auction(
+                            auction_id,
+                            fetch_items=fetch_items,
+                            fetch_mounts=fetch_mounts,
+                            fetch_outfits=fetch_outfits,
+                            fetch_familiars=fetch_familiars,
+                            skip_details=skip_details,
+                            lazy_details=lazy_details,
+                            test=test,
+                        )
+                    except Exception as e:
+                        result = e
+
+                    await results.put((auction_id, result))
+            except Exception as e:
+                # The IDs can't be iterated anymore, so the error is passed to the consumer to be raised.
+                await results.put(e)
+                return
+
+            await results.put(None)
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await results.get()
+                if result is None:
+                    running -= 1
+                    continue
+
+                if isinstance(result, Exception):
+                    raise result
+
+                yield result
+        finally:
+            for task in workers:
+                task.cancel()
+
     # endregion
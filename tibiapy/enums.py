@@ -17,6 +17,7 @@ if TYPE_CHECKING:
 
 __all__ = (
     "AuctionBattlEyeFilter",
+    "AuctionChangeType",
     "AuctionOrderBy",
     "AuctionOrderDirection",
     "PvpTypeFilter",
@@ -28,8 +29,11 @@ __all__ = (
     "BattlEyeType",
     "BazaarType",
     "BidType",
+    "CharacterActivity",
+    "CharacterChangeType",
     "HighscoresBattlEyeType",
     "HighscoresCategory",
+    "HighscoresChangeType",
     "HighscoresProfession",
     "HouseOrder",
     "HouseStatus",
@@ -118,6 +122,20 @@ class AuctionBattlEyeFilter(NumericEnum):
     """
 
 
+class AuctionChangeType(StringEnum):
+    """The types of changes an auction can have between two checks of the bazaar.
+
+    .. versionadded:: 6.4.0
+    """
+
+    ADDED = "added"
+    """The auction was not seen before."""
+    CHANGED = "changed"
+    """The auction's bid or status changed."""
+    ENDED = "ended"
+    """The auction is no longer listed in the current auctions."""
+
+
 class AuctionOrderDirection(NumericEnum):
     """The possible ordering directions for auctions.
 
@@ -266,6 +284,38 @@ class BidType(StringEnum):
     """The bid that won the auction."""
 
 
+class CharacterActivity(StringEnum):
+    """The activity levels used to decide how often a character is checked.
+
+    .. versionadded:: 6.4.0
+    """
+
+    ONLINE = "online"
+    """The character is currently online."""
+    RECENTLY_ONLINE = "recently_online"
+    """The character logged out recently."""
+    OFFLINE = "offline"
+    """The character has been offline for a while."""
+    INACTIVE = "inactive"
+    """The character has been offline for a long time."""
+
+
+class CharacterChangeType(StringEnum):
+    """The types of changes detected in a watched character.
+
+    .. versionadded:: 6.4.0
+    """
+
+    DEATH = "death"
+    """The character died."""
+    LEVEL = "level"
+    """The character's level changed."""
+    WORLD = "world"
+    """The character was transferred to another world."""
+    GUILD = "guild"
+    """The character joined, left or changed guilds."""
+
+
 class HighscoresBattlEyeType(NumericEnum):
     """The possible BattlEye filters that can be used for highscores."""
 
@@ -310,6 +360,20 @@ class HighscoresCategory(NumericEnum):
     SWORD_FIGHTING = 13
 
 
+class HighscoresChangeType(StringEnum):
+    """The types of changes a highscores entry can have between two refreshes of the highscores.
+
+    .. versionadded:: 6.4.0
+    """
+
+    ADDED = "added"
+    """The character was not in the previous highscores."""
+    CHANGED = "changed"
+    """The character's rank, level or value changed."""
+    DROPPED = "dropped"
+    """The character is no longer in the highscores."""
+
+
 class HighscoresProfession(NumericEnum):
     """The vocation filters available for Highscores.
 
@@ -0,0 +1,351 @@
+"""Stores that keep the history of information that Tibia.com only exposes as its current state."""
+from __future__ import annotations
+
+import bisect
+import datetime
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, NamedTuple, Optional, Union
+
+from tibiapy.enums import HighscoresCategory, HighscoresChangeType, HighscoresProfession
+from tibiapy.models import Highscores, RaceRow
+
+if TYPE_CHECKING:
+    from tibiapy.models import HighscoresEntry, HighscoresRow, KillStatistics
+
+__all__ = (
+    "HighscoresChange",
+    "KillStatisticsHistory",
+    "compare_highscores",
+)
+
+_RACE_RECORD = b"R"
+_WORLD_RECORD = b"W"
+_DAY_RECORD = b"D"
+_NAME_HEADER = struct.Struct("<H")
+_DAY_HEADER = struct.Struct("<HiI")
+_FIELDS = len(RaceRow._fields)
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
+
+
+class KillStatisticsHistory:
+    """An append-only history of the daily kill statistics of multiple worlds.
+
+    Tibia.com only shows the kill statistics of the last day and week, so keeping a daily snapshot of every world is
+    the only way to query older values.
+
+    Race and world names are interned to numeric IDs, and each day is stored as a single array of integers, containing
+    the values of every race, in the order of their IDs. Queries read the values directly from those arrays, without
+    building any models.
+
+    If a path is provided, the existing history is loaded from it, and every new snapshot is appended to it.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    path: :class:`str`, optional
+        The path to the file where the history is stored.
+
+    """
+
+    TOTAL = ""
+    """The key used to query the totals of each day."""
+
+    def __init__(self, path: Optional[Union[str, os.PathLike]] = None):
+        self.path = path
+        self._race_ids: dict[str, int] = {self.TOTAL: 0}
+        self._world_ids: dict[str, int] = {}
+        self._worlds: list[str] = []
+        self._days: list[array] = []
+        self._counts: list[list[array]] = []
+        if path is not None and os.path.exists(path):
+            with open(path, "rb") as f:
+                self._load(f.read())
+
+    @property
+    def worlds(self) -> list[str]:
+        """The worlds with at least one snapshot stored."""
+        return list(self._worlds)
+
+    @property
+    def races(self) -> list[str]:
+        """The races that have appeared in any snapshot."""
+        return [race for race in self._race_ids if race != self.TOTAL]
+
+    def dates(self, world: str) -> list[datetime.date]:
+        """Get the dates of the snapshots stored for a world.
+
+        Parameters
+        ----------
+        world:
+            The name of the world.
+
+        Returns
+        -------
+            The dates of the snapshots, in ascending order.
+
+        """
+        world_id = self._world_ids.get(world)
+        if world_id is None:
+            return []
+
+        return [datetime.date.fromordinal(day) for day in self._days[world_id]]
+
+    def append(self, kill_statistics: KillStatistics, date: datetime.date) -> None:
+        """Add the kill statistics of a world for a day to the history.
+
+        Parameters
+        ----------
+        kill_statistics:
+            The kill statistics of the world, in either their full or compact form.
+        date:
+            The day the statistics belong to.
+
+        Raises
+        ------
+        ValueError
+            If the history already contains that day or a later one for the world.
+
+        """
+        records = bytearray()
+        world_id = self._world_ids.get(kill_statistics.world)
+        if world_id is None:
+            world_id = self._add_world(kill_statistics.world)
+            records += self._encode_name(_WORLD_RECORD, kill_statistics.world)
+
+        day = date.toordinal()
+        days = self._days[world_id]
+        if days and days[-1] >= day:
+            raise ValueError(f"history for {kill_statistics.world} already contains {date} or a later day")
+
+        entries = {self.TOTAL: kill_statistics.total, **kill_statistics.entries}
+        for race in entries:
+            if race not in self._race_ids:
+                self._race_ids[race] = len(self._race_ids)
+                records += self._encode_name(_RACE_RECORD, race)
+
+        counts = array("I", [0]) * (_FIELDS * len(self._race_ids))
+        for race, entry in entries.items():
+            offset = self._race_ids[race] * _FIELDS
+            counts[offset:offset + _FIELDS] = array("I", (entry.last_day_killed, entry.last_day_players_killed,
+                                                          entry.last_week_killed, entry.last_week_players_killed))
+
+        days.append(day)
+        self._counts[world_id].append(counts)
+        if self.path is not None:
+            records += _DAY_RECORD + _DAY_HEADER.pack(world_id, day, len(counts)) + _to_little_endian(counts)
+            with open(self.path, "ab") as f:
+                f.write(records)
+
+    def get_race(
+            self,
+            world: str,
+            race: str,
+            start: Optional[datetime.date] = None,
+            end: Optional[datetime.date] = None,
+    ) -> dict[datetime.date, RaceRow]:
+        """Get the statistics of a race in a world over a range of days.
+
+        Parameters
+        ----------
+        world:
+            The name of the world.
+        race:
+            The name of the race, as shown in the kill statistics. Use :attr:`TOTAL` to get the totals.
+        start:
+            The first day to include. If not set, the range starts at the first stored day.
+        end:
+            The last day to include. If not set, the range ends at the last stored day.
+
+        Returns
+        -------
+            The statistics of the race for every stored day in the range.
+            Days before the race first appeared are considered to have no kills.
+
+        """
+        world_id = self._world_ids.get(world)
+        race_id = self._race_ids.get(race)
+        if world_id is None or race_id is None:
+            return {}
+
+        days = self._days[world_id]
+        first = bisect.bisect_left(days, start.toordinal()) if start else 0
+        last = bisect.bisect_right(days, end.toordinal()) if end else len(days)
+        offset = race_id * _FIELDS
+        result = {}
+        for day, counts in zip(days[first:last], self._counts[world_id][first:last]):
+            values = counts[offset:offset + _FIELDS]
+            result[datetime.date.fromordinal(day)] = RaceRow(*values) if values else RaceRow(0, 0, 0, 0)
+
+        return result
+
+    def _add_world(self, world: str) -> int:
+        world_id = len(self._worlds)
+        self._world_ids[world] = world_id
+        self._worlds.append(world)
+        self._days.append(array("i"))
+        self._counts.append([])
+        return world_id
+
+    @staticmethod
+    def _encode_name(record_type: bytes, name: str) -> bytes:
+        encoded = name.encode()
+        return record_type + _NAME_HEADER.pack(len(encoded)) + encoded
+
+    def _load(self, data: bytes) -> None:
+        view = memoryview(data)
+        position = 0
+        while position < len(view):
+            record_type = bytes(view[position:position + 1])
+            position += 1
+            if record_type == _DAY_RECORD:
+                world_id, day, length = _DAY_HEADER.unpack_from(view, position)
+                position += _DAY_HEADER.size
+                counts = array("I")
+                counts.frombytes(view[position:position + length * counts.itemsize])
+                if sys.byteorder != "little":
+                    counts.byteswap()
+
+                position += length * counts.itemsize
+                self._days[world_id].append(day)
+                self._counts[world_id].append(counts)
+                continue
+
+            if record_type not in (_WORLD_RECORD, _RACE_RECORD):
+                raise ValueError(f"invalid record type at position {position - 1}")
+
+            (length,) = _NAME_HEADER.unpack_from(view, position)
+            position += _NAME_HEADER.size
+            name = str(view[position:position + length], "utf-8")
+            position += length
+            if record_type == _WORLD_RECORD:
+                self._add_world(name)
+            else:
+                self._race_ids[name] = len(self._race_ids)
+
+
+class HighscoresChange(NamedTuple):
+    """A change in a highscores entry between two refreshes of the highscores.
+
+    .. versionadded:: 6.4.0
+    """
+
+    type: HighscoresChangeType
+    """The type of change."""
+    world: str
+    """The character's world."""
+    category: HighscoresCategory
+    """The category of the highscores."""
+    vocation: HighscoresProfession
+    """The vocation filter of the highscores."""
+    name: str
+    """The name of the character."""
+    rank: Optional[int]
+    """The character's current rank. :obj:`None` if the character was dropped."""
+    previous_rank: Optional[int]
+    """The character's previous rank. :obj:`None` if the character was added."""
+    level: Optional[int]
+    """The character's current level. :obj:`None` if the character was dropped."""
+    previous_level: Optional[int]
+    """The character's previous level. :obj:`None` if the character was added."""
+    value: Optional[int]
+    """The character's current value. :obj:`None` if the character was dropped."""
+    previous_value: Optional[int]
+    """The character's previous value. :obj:`None` if the character was added."""
+
+    @property
+    def rank_change(self) -> Optional[int]:
+        """The number of ranks the character climbed, negative if they fell. :obj:`None` unless changed."""
+        return self.previous_rank - self.rank if self.type == HighscoresChangeType.CHANGED else None
+
+    @property
+    def level_change(self) -> Optional[int]:
+        """The number of levels the character gained, negative if they lost levels. :obj:`None` unless changed."""
+        return self.level - self.previous_level if self.type == HighscoresChangeType.CHANGED else None
+
+    @property
+    def value_change(self) -> Optional[int]:
+        """The value the character gained, negative if they lost it. :obj:`None` unless changed."""
+        return self.value - self.previous_value if self.type == HighscoresChangeType.CHANGED else None
+
+
+def _highscores_entries(
+        highscores: Union[Highscores, Iterable[Highscores]],
+) -> tuple[HighscoresCategory, HighscoresProfession, list[Union[HighscoresEntry, HighscoresRow]]]:
+    pages = [highscores] if isinstance(highscores, Highscores) else list(highscores)
+    if not pages:
+        raise ValueError("at least one highscores page is required")
+
+    category, vocation = pages[0].category, pages[0].vocation
+    entries = []
+    for page in pages:
+        if page.category != category or page.vocation != vocation:
+            raise ValueError("all highscores pages must have the same category and vocation")
+
+        entries.extend(page.entries)
+
+    return category, vocation, entries
+
+
+def compare_highscores(
+        previous: Union[Highscores, Iterable[Highscores]],
+        current: Union[Highscores, Iterable[Highscores]],
+) -> list[HighscoresChange]:
+    """Compare two refreshes of the highscores, getting only the entries that changed.
+
+    Entries are matched by their world and name, using a single index of the previous entries, so the comparison takes
+    linear time. Both full entries and compact rows are supported.
+
+    .. versionadded:: 6.4.0
+
+    Parameters
+    ----------
+    previous:
+        The previous highscores, either a single page or all the pages of the refresh.
+    current:
+        The current highscores, either a single page or all the pages of the refresh.
+
+    Returns
+    -------
+        The changes, with the added and changed entries in their current order, followed by the dropped entries in
+        their previous order.
+
+    Raises
+    ------
+    ValueError
+        If no pages are provided, or if the pages don't belong to the same category and vocation.
+
+    """
+    category, vocation, previous_entries = _highscores_entries(previous)
+    current_category, current_vocation, current_entries = _highscores_entries(current)
+    if current_category != category or current_vocation != vocation:
+        raise ValueError("all highscores pages must have the same category and vocation")
+
+    index = {(e.world, e.name): (e.rank, e.level, e.value) for e in previous_entries}
+    changes = []
+    for entry in current_entries:
+        values = index.pop((entry.world, entry.name), None)
+        if values is None:
+            changes.append(HighscoresChange(HighscoresChangeType.ADDED, entry.world, category, vocation, entry.name,
+                                            entry.rank, None, entry.level, None, entry.value, None))
+        elif values != (entry.rank, entry.level, entry.value):
+            rank, level, value = values
+            changes.append(HighscoresChange(HighscoresChangeType.CHANGED, entry.world, category, vocation, entry.name,
+                                            entry.rank, rank, entry.level, level, entry.value, value))
+
+    for (world, name), (rank, level, value) in index.items():
+        changes.append(HighscoresChange(HighscoresChangeType.DROPPED, world, category, vocation, name,
+                                        None, rank, None, level, None, value))
+
+    return changes
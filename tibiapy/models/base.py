@@ -23,12 +23,17 @@ def to_camel(string: str) -> str:
 
 
 class BaseModel(pydantic.BaseModel):
-    """Base class for all model classes."""
+    """Base class for all model classes.
+
+    The validators and serializers of models are built the first time the model is used, rather than on import, so
+    processes that only use a few models don't pay for the rest.
+    """
 
     model_config = ConfigDict(
         populate_by_name=True,
         alias_generator=to_camel,
         use_attribute_docstrings=True,
+        defer_build=True,
     )
 
 
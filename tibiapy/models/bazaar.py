@@ -1,10 +1,13 @@
 """Models relatd to the character bazaar."""
 import datetime
 from abc import ABC, abstractmethod
-from typing import Generic, Optional, TypeVar
+from typing import Any, Callable, Generic, Optional, TypeVar
+
+from pydantic import PrivateAttr, SerializerFunctionWrapHandler, field_serializer
 
 from tibiapy.enums import (
     AuctionBattlEyeFilter,
+    AuctionChangeType,
     AuctionOrderBy,
     AuctionOrderDirection,
     AuctionSearchType,
@@ -23,6 +26,7 @@ from tibiapy.models.pagination import AjaxPaginator, PaginatedWithUrl
 __all__ = (
     "AchievementEntry",
     "Auction",
+    "AuctionChange",
     "AuctionDetails",
     "AuctionFilters",
     "BestiaryEntry",
@@ -34,6 +38,7 @@ __all__ = (
     "Familiars",
     "ItemEntry",
     "ItemSummary",
+    "LazyAuctionDetails",
     "MountEntry",
     "Mounts",
     "OutfitEntry",
@@ -493,6 +498,110 @@ class AuctionDetails(BaseModel):
         return {skill.name: skill for skill in self.skills}
 
 
+class LazyAuctionDetails(AuctionDetails):
+    """The details of an auction, where each section is only parsed the first time one of its fields is accessed.
+
+    Accessing a field parses the whole section of the page that contains it, e.g. accessing :attr:`hit_points` also
+    parses the rest of the general section.
+
+    Dumping, comparing or pickling the details will parse all the remaining sections first.
+
+    .. versionadded:: 6.4.0
+    """
+
+    _loader: Optional[Callable[[str], dict[str, Any]]] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_loader(cls, loader: Callable[[str], dict[str, Any]]) -> "LazyAuctionDetails":
+        """Create an instance with no parsed sections.
+
+        Parameters
+        ----------
+        loader:
+            A function that receives the name of a field and returns the values for all the fields in its section.
+
+        Returns
+        -------
+            The lazy auction details.
+
+        """
+        details = cls.model_construct()
+        details.__dict__.clear()
+        details._loader = loader
+        return details
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether all the sections have been parsed already."""
+        return self._loader is None
+
+    def materialize(self) -> "LazyAuctionDetails":
+        """Parse all the sections that haven't been accessed yet.
+
+        Once done, the reference to the page's content is released.
+
+        Returns
+        -------
+            The same instance, for chaining.
+
+        """
+        if self._loader is None:
+            return self
+
+        for field in type(self).model_fields:
+            if field not in self.__dict__:
+                self.__dict__.update(self._loader(field))
+
+        self._release_loader()
+        return self
+
+    def _release_loader(self) -> None:
+        values = {field: self.__dict__[field] for field in type(self).model_fields}
+        self.__dict__.clear()
+        self.__dict__.update(values)
+        self.__pydantic_fields_set__.update(values)
+        self._loader = None
+
+    def __getattr__(self, item: str) -> Any:
+        loader = self.__pydantic_private__.get("_loader") if self.__pydantic_private__ else None
+        if loader is not None and item in type(self).model_fields:
+            values = loader(item)
+            self.__dict__.update(values)
+            if len(self.__dict__) == len(type(self).model_fields):
+                self._release_loader()
+
+            return values[item]
+
+        return super().__getattr__(item)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AuctionDetails):
+            return NotImplemented
+
+        self.materialize()
+        if isinstance(other, LazyAuctionDetails):
+            other.materialize()
+
+        # Only the values are compared, so lazy details are equal to eager ones with the same values.
+        return all(self.__dict__[field] == getattr(other, field) for field in AuctionDetails.model_fields)
+
+    __hash__ = None
+
+    def __getstate__(self) -> dict[Any, Any]:
+        # The loader can't be pickled, so the remaining sections are parsed to release it.
+        return super(LazyAuctionDetails, self.materialize()).__getstate__()
+
+    def __repr_args__(self) -> Any:
+        self.materialize()
+        return super().__repr_args__()
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # noqa: D102
+        return super(LazyAuctionDetails, self.materialize()).model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # noqa: D102
+        return super(LazyAuctionDetails, self.materialize()).model_dump_json(**kwargs)
+
+
 class Auction(BaseModel):
     """Represents an auction in the list, containing the summary."""
 
@@ -527,6 +636,13 @@ class Auction(BaseModel):
     details: Optional[AuctionDetails] = None
     """The auction's details."""
 
+    @field_serializer("details", mode="wrap")
+    def _serialize_details(self, details: Optional[AuctionDetails], handler: SerializerFunctionWrapHandler) -> Any:
+        if isinstance(details, LazyAuctionDetails):
+            details.materialize()
+
+        return handler(details)
+
     @property
     def character_url(self) -> str:
         """The URL of the character's information page on Tibia.com."""
@@ -538,6 +654,24 @@ class Auction(BaseModel):
         return get_auction_url(self.auction_id)
 
 
+class AuctionChange(BaseModel):
+    """A change detected in an auction between two checks of the bazaar.
+
+    .. versionadded:: 6.4.0
+    """
+
+    type: AuctionChangeType
+    """The type of change."""
+    auction_id: int
+    """The internal id of the auction."""
+    auction: Optional[Auction] = None
+    """The auction as currently listed. :obj:`None` if the auction ended."""
+    previous_bid: Optional[int] = None
+    """The bid the auction had when it was last seen. :obj:`None` if the auction was just added."""
+    previous_status: Optional[AuctionStatus] = None
+    """The status the auction had when it was last seen. :obj:`None` if the auction was just added."""
+
+
 class CharacterBazaar(PaginatedWithUrl[Auction]):
     """Represents the char bazaar."""
 
@@ -2,12 +2,12 @@
 from __future__ import annotations
 
 import datetime
-from typing import Optional
+from typing import NamedTuple, Optional
 
 from pydantic import computed_field
 
 from tibiapy import urls
-from tibiapy.enums import Sex, Vocation
+from tibiapy.enums import CharacterChangeType, Sex, Vocation
 from tibiapy.models.base import BaseCharacter, BaseGuild, BaseModel, HouseWithId
 
 __all__ = (
@@ -15,11 +15,13 @@ __all__ = (
     "AccountInformation",
     "Achievement",
     "Character",
+    "CharacterChange",
     "CharacterHouse",
     "Death",
     "DeathParticipant",
     "GuildMembership",
     "OnlineCharacter",
+    "OnlineCharacterRow",
     "OtherCharacter",
 )
 
@@ -138,6 +140,29 @@ class OnlineCharacter(BaseCharacter):
     """The level of the character."""
 
 
+class OnlineCharacterRow(NamedTuple):
+    """A compact representation of an :class:`OnlineCharacter`.
+
+    .. versionadded:: 6.4.0
+    """
+
+    name: str
+    """The name of the character."""
+    level: int
+    """The level of the character."""
+    vocation: Vocation
+    """The vocation of the character."""
+
+    @classmethod
+    def from_model(cls, character: OnlineCharacter) -> OnlineCharacterRow:
+        """Create a row from an online character."""
+        return cls(character.name, character.level, character.vocation)
+
+    def to_model(self) -> OnlineCharacter:
+        """Upgrade the row to a full online character."""
+        return OnlineCharacter.model_construct(**self._asdict())
+
+
 class OtherCharacter(BaseCharacter):
     """A character listed in the characters section of a character's page.
 
@@ -249,3 +274,25 @@ class Character(BaseCharacter):
         """The URL to the husband/spouse information page on Tibia.com, if applicable."""
         return urls.get_character_url(self.married_to) if self.married_to else None
     # endregion
+
+
+class CharacterChange(BaseModel):
+    """A change detected in a watched character between two checks.
+
+    .. versionadded:: 6.4.0
+    """
+
+    type: CharacterChangeType
+    """The type of change."""
+    name: str
+    """The name of the character."""
+    character: Character
+    """The character as currently seen."""
+    death: Optional[Death] = None
+    """The new death, for :attr:`CharacterChangeType.DEATH` changes."""
+    previous_level: Optional[int] = None
+    """The level the character had when last seen, for :attr:`CharacterChangeType.LEVEL` changes."""
+    previous_world: Optional[str] = None
+    """The world the character was in when last seen, for :attr:`CharacterChangeType.WORLD` changes."""
+    previous_guild: Optional[str] = None
+    """The guild the character was in when last seen, for :attr:`CharacterChangeType.GUILD` changes."""
@@ -1,7 +1,7 @@
 """Models for guilds and members."""
 import datetime
 from collections import OrderedDict, defaultdict
-from typing import Optional
+from typing import NamedTuple, Optional, Union
 
 from pydantic import computed_field
 
@@ -12,6 +12,7 @@ from tibiapy.urls import get_guild_url, get_guild_wars_url, get_world_guilds_url
 __all__ = (
     "GuildHouse",
     "GuildMember",
+    "GuildMemberRow",
     "GuildInvite",
     "Guild",
     "GuildEntry",
@@ -40,6 +41,38 @@ class GuildMember(BaseCharacter):
     """Whether the member is online or not."""
 
 
+class GuildMemberRow(NamedTuple):
+    """A compact representation of a :class:`GuildMember`.
+
+    .. versionadded:: 6.4.0
+    """
+
+    name: str
+    """The name of the member."""
+    rank: str
+    """The rank the member belongs to."""
+    title: Optional[str]
+    """The member's title."""
+    level: int
+    """The member's level."""
+    vocation: Vocation
+    """The member's vocation."""
+    joined_on: datetime.date
+    """The day the member joined the guild."""
+    is_online: bool
+    """Whether the member is online or not."""
+
+    @classmethod
+    def from_model(cls, member: GuildMember) -> "GuildMemberRow":
+        """Create a row from a guild member."""
+        return cls(member.name, member.rank, member.title, member.level, member.vocation, member.joined_on,
+                   member.is_online)
+
+    def to_model(self) -> GuildMember:
+        """Upgrade the row to a full guild member."""
+        return GuildMember.model_construct(**self._asdict())
+
+
 class GuildInvite(BaseCharacter):
     """Represents an invited character."""
 
@@ -82,8 +115,8 @@ class Guild(BaseGuild):
     """The reason why the guild will get disbanded."""
     homepage: Optional[str] = None
     """The guild's homepage, if any."""
-    members: list[GuildMember]
-    """List of guild members."""
+    members: list[Union[GuildMember, GuildMemberRow]]
+    """List of guild members. If the guild was parsed with ``compact=True``, they are :class:`GuildMemberRow`."""
     invites: list[GuildInvite]
     """List of invited characters."""
 
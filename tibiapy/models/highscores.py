@@ -1,6 +1,6 @@
 """Models for highscores."""
 import datetime
-from typing import Optional
+from typing import NamedTuple, Optional, Union
 
 from pydantic import SerializeAsAny
 
@@ -42,8 +42,51 @@ class LoyaltyHighscoresEntry(HighscoresEntry):
     """The character's loyalty title."""
 
 
-class Highscores(PaginatedWithUrl[SerializeAsAny[HighscoresEntry]]):
-    """Represents the highscores of a world."""
+class HighscoresRow(NamedTuple):
+    """A compact representation of a :class:`HighscoresEntry`.
+
+    .. versionadded:: 6.4.0
+    """
+
+    rank: int
+    """The character's rank in the respective highscores."""
+    name: str
+    """The name of the character."""
+    vocation: Vocation
+    """The character's vocation."""
+    world: str
+    """The character's world."""
+    level: int
+    """The character's level."""
+    value: int
+    """The character's value for the highscores."""
+    title: Optional[str] = None
+    """The character's loyalty title, only set for the loyalty points category."""
+
+    @classmethod
+    def from_model(cls, entry: HighscoresEntry) -> "HighscoresRow":
+        """Create a row from a highscores entry."""
+        return cls(entry.rank, entry.name, entry.vocation, entry.world, entry.level, entry.value,
+                   getattr(entry, "title", None))
+
+    def to_model(self) -> Union[HighscoresEntry, LoyaltyHighscoresEntry]:
+        """Upgrade the row to a full highscores entry.
+
+        A :class:`LoyaltyHighscoresEntry` is returned if the row has a title.
+        """
+        values = self._asdict()
+        title = values.pop("title")
+        if title is not None:
+            return LoyaltyHighscoresEntry.model_construct(**values, title=title)
+
+        return HighscoresEntry.model_construct(**values)
+
+
+class Highscores(PaginatedWithUrl[Union[SerializeAsAny[HighscoresEntry], HighscoresRow]]):
+    """Represents the highscores of a world.
+
+    If the highscores were parsed with ``compact=True``, the entries are :class:`HighscoresRow` instead.
+    """
 
     world: Optional[str] = None
     """The world the highscores belong to. If this is :obj:`None`, the highscores shown are for all worlds."""
@@ -1,4 +1,6 @@
 """Models related to the Kill Statistics."""
+from typing import NamedTuple, Union
+
 from tibiapy.models import BaseModel
 from tibiapy.urls import get_kill_statistics_url
 
@@ -16,13 +18,41 @@ class RaceEntry(BaseModel):
     """Number of players killed by this race in the last week."""
 
 
+class RaceRow(NamedTuple):
+    """A compact representation of a :class:`RaceEntry`.
+
+    .. versionadded:: 6.4.0
+    """
+
+    last_day_killed: int
+    """Number of creatures of this race killed in the last day."""
+    last_day_players_killed: int
+    """Number of players killed by this race in the last day."""
+    last_week_killed: int
+    """Number of creatures of this race killed in the last week."""
+    last_week_players_killed: int
+    """Number of players killed by this race in the last week."""
+
+    @classmethod
+    def from_model(cls, entry: RaceEntry) -> "RaceRow":
+        """Create a row from a race entry."""
+        return cls(entry.last_day_killed, entry.last_day_players_killed, entry.last_week_killed,
+                   entry.last_week_players_killed)
+
+    def to_model(self) -> RaceEntry:
+        """Upgrade the row to a full race entry."""
+        return RaceEntry.model_construct(**self._asdict())
+
+
 class KillStatistics(BaseModel):
     """Represents the kill statistics of a world."""
 
     world: str
     """The world the statistics belong to."""
-    entries: dict[str, RaceEntry]
-    """A dictionary of kills entries of every race, where the key is the name of the race."""
+    entries: dict[str, Union[RaceEntry, RaceRow]]
+    """A dictionary of kills entries of every race, where the key is the name of the race.
+
+    If the statistics were parsed with ``compact=True``, the entries are :class:`RaceRow`."""
     total: RaceEntry
     """The kill statistics totals."""
     available_worlds: list[str]
@@ -1,11 +1,11 @@
 """Models related to game worlds."""
 import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from pydantic import computed_field
 
 from tibiapy.enums import BattlEyeType, PvpType, TransferType, WorldLocation
-from tibiapy.models import OnlineCharacter
+from tibiapy.models import OnlineCharacter, OnlineCharacterRow
 from tibiapy.models.base import BaseModel
 from tibiapy.urls import get_world_url
 
@@ -68,8 +68,10 @@ class World(BaseWorld):
     """The month and year the world was created. In YYYY-MM format."""
     world_quest_titles: list[str]
     """List of world quest titles the server has achieved."""
-    online_players: list[OnlineCharacter]
-    """A list of characters currently online in the server."""
+    online_players: list[Union[OnlineCharacter, OnlineCharacterRow]]
+    """A list of characters currently online in the server.
+
+    If the world was parsed with ``compact=True``, the characters are :class:`OnlineCharacterRow`."""
 
     @property
     def creation_year(self) -> int:
@@ -1,8 +1,9 @@
 """Contains all classes related to the Character Bazaar sections in Tibia.com."""
+import functools
 import logging
 import re
 import urllib.parse
-from typing import Optional
+from typing import Any, Callable, Optional
 
 import bs4
 
@@ -39,6 +40,7 @@ from tibiapy.models import (
     Familiars,
     ItemEntry,
     ItemSummary,
+    LazyAuctionDetails,
     MountEntry,
     Mounts,
     OutfitEntry,
@@ -57,6 +59,7 @@ from tibiapy.utils import (
     parse_pagination,
     parse_tibia_datetime,
     parse_tibiacom_content,
+    repair_self_closing_tags,
     try_enum,
 )
 
@@ -72,12 +75,50 @@ tier_regex = re.compile(r"(.*)\s\(tier (\d)\)")
 
 log = logging.getLogger("tibiapy")
 
+DETAILS_SECTIONS_FIELDS: dict[str, tuple[str, ...]] = {
+    "General": (
+        "hit_points", "mana", "capacity", "speed", "mounts_count", "outfits_count", "titles_count", "blessings_count",
+        "skills", "creation_date", "experience", "gold", "achievement_points", "regular_world_transfer_available_date",
+        "charm_expansion", "available_charm_points", "spent_charm_points", "daily_reward_streak",
+        "hunting_task_points", "permanent_hunting_task_slots", "permanent_prey_slots", "prey_wildcards", "hirelings",
+        "hireling_jobs", "hireling_outfits", "exalted_dust", "exalted_dust_limit", "boss_points",
+        "bonus_promotion_points",
+    ),
+    "ItemSummary": ("items",),
+    "StoreItemSummary": ("store_items",),
+    "Mounts": ("mounts",),
+    "StoreMounts": ("store_mounts",),
+    "Outfits": ("outfits",),
+    "StoreOutfits": ("store_outfits",),
+    "Familiars": ("familiars",),
+    "Blessings": ("blessings",),
+    "Imbuements": ("imbuements",),
+    "Charms": ("charms",),
+    "CompletedCyclopediaMapAreas": ("completed_cyclopedia_map_areas",),
+    "CompletedQuestLines": ("completed_quest_lines",),
+    "Titles": ("titles",),
+    "Achievements": ("achievements",),
+    "BestiaryProgress": ("bestiary_progress",),
+    "BosstiaryProgress": ("bosstiary_progress",),
+    "RevealedGems": ("revealed_gems",),
+}
+"""The fields of :class:`AuctionDetails` set by each section of the character details, by the section's table id."""
+DETAILS_FIELD_SECTIONS = {field: section for section, fields in DETAILS_SECTIONS_FIELDS.items() for field in fields}
+
 __all__ = (
     "CharacterBazaarParser",
     "AuctionParser",
 )
 
 
+def _parse_bazaar_content(content: str, builder: str) -> bs4.BeautifulSoup:
+    """Parse the content of a bazaar page, repairing the markup that ``lxml`` can't handle."""
+    if builder == "lxml":
+        content = repair_self_closing_tags(content)
+
+    return parse_tibiacom_content(content, builder=builder)
+
+
 class AuctionFiltersParser:
     @classmethod
     def parse_from_table(cls, table: bs4.Tag) -> AuctionFilters:
@@ -123,13 +164,17 @@ class CharacterBazaarParser:
     """Parser for the character bazaar in Tibia.com."""
 
     @classmethod
-    def from_content(cls, content: str) -> CharacterBazaar:
+    def from_content(cls, content: str, *, builder: str = "lxml") -> CharacterBazaar:
         """Get the bazaar's information and list of auctions from Tibia.com.
 
         Parameters
         ----------
         content:
             The HTML content of the bazaar section at Tibia.com.
+        builder:
+            The tree builder used to parse the page, either ``lxml`` or ``html5lib``.
+
+            .. versionadded:: 6.4.0
 
         Returns
         -------
@@ -137,7 +182,7 @@ class CharacterBazaarParser:
 
         """
         try:
-            parsed_content = parse_tibiacom_content(content, builder="html5lib")
+            parsed_content = _parse_bazaar_content(content, builder)
             content_table = parsed_content.select_one("div.BoxContent")
             tables = content_table.select("div.TableContainer")
             filter_table = None
@@ -171,7 +216,15 @@ class AuctionParser:
     """Parser for Tibia.com character auctions."""
 
     @classmethod
-    def from_content(cls, content: str, auction_id: int = 0, skip_details: bool = False) -> Optional[Auction]:
+    def from_content(
+            cls,
+            content: str,
+            auction_id: int = 0,
+            skip_details: bool = False,
+            *,
+            lazy_details: bool = False,
+            builder: str = "lxml",
+    ) -> Optional[Auction]:
         """Parse an auction detail page from Tibia.com and extracts its data.
 
         Parameters
@@ -187,6 +240,17 @@ class AuctionParser:
 
             This allows fetching basic information like name, level, vocation, world, bid and status, shaving off some
             parsing time.
+        lazy_details:
+            Whether to parse each section of the auction details only when it is first accessed.
+
+            The details will be an instance of :class:`LazyAuctionDetails`.
+            Use :meth:`LazyAuctionDetails.materialize` to parse all the remaining sections at once.
+
+            .. versionadded:: 6.4.0
+        builder:
+            The tree builder used to parse the page, either ``lxml`` or ``html5lib``.
+
+            .. versionadded:: 6.4.0
 
         Returns
         -------
@@ -198,7 +262,7 @@ class AuctionParser:
             If the content does not belong to an auction detail's page.
 
         """
-        parsed_content = parse_tibiacom_content(content, builder="lxml" if skip_details else "html5lib")
+        parsed_content = _parse_bazaar_content(content, builder)
         auction_row = parsed_content.select_one("div.Auction")
         if not auction_row:
             if "internal error" in content:
@@ -212,61 +276,13 @@ class AuctionParser:
             return auction
 
         details_tables = cls._parse_tables(parsed_content)
-        if "General" in details_tables:
-            cls._parse_general_table(builder, details_tables["General"])
-
-        if "ItemSummary" in details_tables:
-            builder.items(cls._parse_items_table(details_tables["ItemSummary"]))
-
-        if "StoreItemSummary" in details_tables:
-            builder.store_items(cls._parse_items_table(details_tables["StoreItemSummary"]))
-
-        if "Mounts" in details_tables:
-            builder.mounts(cls._parse_mounts_table(details_tables["Mounts"]))
-
-        if "StoreMounts" in details_tables:
-            builder.store_mounts(cls._parse_mounts_table(details_tables["StoreMounts"]))
-
-        if "Outfits" in details_tables:
-            builder.outfits(cls._parse_outfits_table(details_tables["Outfits"]))
-
-        if "StoreOutfits" in details_tables:
-            builder.store_outfits(cls._parse_outfits_table(details_tables["StoreOutfits"]))
-
-        if "Familiars" in details_tables:
-            builder.familiars(cls._parse_familiars_table(details_tables["Familiars"]))
-
-        if "Blessings" in details_tables:
-            cls._parse_blessings_table(builder, details_tables["Blessings"])
-
-        if "Imbuements" in details_tables:
-            builder.imbuements(cls._parse_single_column_table(details_tables["Imbuements"]))
-
-        if "Charms" in details_tables:
-            cls._parse_charms_table(builder, details_tables["Charms"])
-
-        if "CompletedCyclopediaMapAreas" in details_tables:
-            builder.completed_cyclopedia_map_areas(
-                cls._parse_single_column_table(details_tables["CompletedCyclopediaMapAreas"]),
-            )
-
-        if "CompletedQuestLines" in details_tables:
-            builder.completed_quest_lines(cls._parse_single_column_table(details_tables["CompletedQuestLines"]))
-
-        if "Titles" in details_tables:
-            builder.titles(cls._parse_single_column_table(details_tables["Titles"]))
-
-        if "Achievements" in details_tables:
-            cls._parse_achievements_table(builder, details_tables["Achievements"])
-
-        if "BestiaryProgress" in details_tables:
-            cls._parse_bestiary_table(builder, details_tables["BestiaryProgress"])
-
-        if "BosstiaryProgress" in details_tables:
-            cls._parse_bestiary_table(builder, details_tables["BosstiaryProgress"], True)
+        if lazy_details:
+            auction.details = LazyAuctionDetails.from_loader(cls._get_details_loader(details_tables))
+            return auction
 
-        if "RevealedGems" in details_tables:
-            cls._parse_revealed_gems_table(builder, details_tables["RevealedGems"])
+        for section in DETAILS_SECTIONS_FIELDS:
+            if section in details_tables:
+                cls._parse_details_section(builder, section, details_tables[section])
 
         auction.details = builder.build()
         return auction
@@ -362,7 +378,76 @@ class AuctionParser:
 
         """
         details_tables = parsed_content.select("div.CharacterDetailsBlock")
-        return {table["id"]: table for table in details_tables}
+        return {table["id"]: table for table in details_tables if table.has_attr("id")}
+
+    @classmethod
+    def _parse_details_section(cls, builder: AuctionDetailsBuilder, section: str, table: bs4.Tag) -> None:
+        """Parse a section of the character details, storing its values in the builder.
+
+        Parameters
+        ----------
+        builder: :class:`AuctionDetailsBuilder`
+            The builder where data will be stored to.
+        section: :class:`str`
+            The ID of the section's table.
+        table: :class:`bs4.Tag`
+            The table containing the section.
+
+        """
+        # Sections whose table is parsed into a single value, and the builder method that receives it.
+        value_sections = {
+            "ItemSummary": (cls._parse_items_table, builder.items),
+            "StoreItemSummary": (cls._parse_items_table, builder.store_items),
+            "Mounts": (cls._parse_mounts_table, builder.mounts),
+            "StoreMounts": (cls._parse_mounts_table, builder.store_mounts),
+            "Outfits": (cls._parse_outfits_table, builder.outfits),
+            "StoreOutfits": (cls._parse_outfits_table, builder.store_outfits),
+            "Familiars": (cls._parse_familiars_table, builder.familiars),
+            "Imbuements": (cls._parse_single_column_table, builder.imbuements),
+            "CompletedCyclopediaMapAreas": (cls._parse_single_column_table, builder.completed_cyclopedia_map_areas),
+            "CompletedQuestLines": (cls._parse_single_column_table, builder.completed_quest_lines),
+            "Titles": (cls._parse_single_column_table, builder.titles),
+        }
+        # Sections whose table handler stores the values in the builder by itself.
+        builder_sections = {
+            "General": cls._parse_general_table,
+            "Blessings": cls._parse_blessings_table,
+            "Charms": cls._parse_charms_table,
+            "Achievements": cls._parse_achievements_table,
+            "BestiaryProgress": cls._parse_bestiary_table,
+            "BosstiaryProgress": functools.partial(cls._parse_bestiary_table, bosstiary=True),
+            "RevealedGems": cls._parse_revealed_gems_table,
+        }
+        if section in value_sections:
+            parse_table, setter = value_sections[section]
+            setter(parse_table(table))
+        elif section in builder_sections:
+            builder_sections[section](builder, table)
+
+    @classmethod
+    def _get_details_loader(cls, details_tables: dict[str, bs4.Tag]) -> Callable[[str], dict[str, Any]]:
+        """Get a function that parses the section of the details containing a field.
+
+        Parameters
+        ----------
+        details_tables: :class:`dict`
+            The character details tables, grouped by their id.
+
+        Returns
+        -------
+        Callable[[:class:`str`], :class:`dict`]
+            A function that receives the name of a field and returns the values of all fields in the same section.
+
+        """
+        def loader(field: str) -> dict[str, Any]:
+            section = DETAILS_FIELD_SECTIONS.get(field)
+            builder = AuctionDetailsBuilder()
+            if section in details_tables:
+                cls._parse_details_section(builder, section, details_tables[section])
+
+            return {f: getattr(builder, f"_{f}") for f in DETAILS_SECTIONS_FIELDS.get(section, (field,))}
+
+        return loader
 
     @classmethod
     def _parse_data_table(cls, table: bs4.Tag) -> dict[str, str]:
@@ -750,6 +835,9 @@ class AuctionParser:
         _, *rows = get_rows(table_content)
         for row in rows:
             gem_tag = row.select_one("div.Gem")
+            if not gem_tag:
+                continue
+
             gem_type = gem_tag["title"]
             effects = [t.text for t in row.select("span")]
             builder.add_revealed_gem(RevealedGem(
@@ -758,8 +846,11 @@ class AuctionParser:
             ))
 
     @classmethod
-    def _parse_page_items(cls, content: str, paginator: AjaxPaginator) -> list[DisplayImage]:
-        parsed_content = parse_tibiacom_content(content, builder="html5lib")
+    def _parse_page_items(cls, content: str, paginator: AjaxPaginator, builder: str = "lxml") -> list[DisplayImage]:
+        if builder == "lxml":
+            content = repair_self_closing_tags(content)
+
+        parsed_content = bs4.BeautifulSoup(content, builder)
         item_boxes = parsed_content.select(CSS_CLASS_ICON)
         entries = []
         for item_box in item_boxes:
@@ -1,10 +1,11 @@
 """Models related to the Tibia.com character page."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import re
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from tibiapy.builders import CharacterBuilder
 from tibiapy.enums import Sex, Vocation
@@ -25,7 +26,7 @@ from tibiapy.utils import (
     get_rows,
     parse_integer,
     parse_link_info,
-    parse_popup,
+    parse_popup_text,
     parse_tibia_date,
     parse_tibia_datetime,
     parse_tibiacom_content,
@@ -55,6 +56,12 @@ badge_popup_regexp = re.compile(r"\$\(this\),\s+'([^']+)',\s+'([^']+)',")
 
 traded_label = "(traded)"
 
+# Extracts the fields of the character information table that are part of a character's fingerprint.
+fingerprint_fields_regexp = re.compile(
+    r">(Name|Level|World|Guild(?:&#160;|\s)Membership):</td>\s*<td>(.*?)</td>",
+    re.DOTALL,
+)
+
 __all__ = (
     "CharacterParser",
 )
@@ -111,6 +118,39 @@ class CharacterParser:
 
         return builder.build()
 
+    @classmethod
+    def fingerprint(cls, content: Union[str, bytes]) -> Optional[str]:
+        """Get a hash of the parts of a character's page that are relevant to detect changes, without parsing it.
+
+        The hash covers the character's name, level, world, guild membership and deaths.
+
+        .. versionadded:: 6.4.0
+
+        Parameters
+        ----------
+        content:
+            The HTML content of the page.
+
+        Returns
+        -------
+            The hash of the page, or :obj:`None` if the page doesn't contain a character's information.
+
+        """
+        if isinstance(content, bytes):
+            content = content.decode()
+
+        fields = fingerprint_fields_regexp.findall(content)
+        if not fields:
+            return None
+
+        digest = hashlib.sha1(repr(fields).encode(), usedforsecurity=False)
+        deaths_start = content.find(">Character Deaths<")
+        if deaths_start >= 0:
+            deaths_end = content.find("</table>", deaths_start)
+            digest.update(content[deaths_start:deaths_end].encode())
+
+        return digest.hexdigest()
+
     @classmethod
     def _parse_account_information(cls, builder: CharacterBuilder, rows: list[bs4.Tag]) -> None:
         """Parse the character's account information."""
@@ -152,9 +192,7 @@ class CharacterParser:
         columns = row.select("td > span")
         for column in columns:
             popup_span = column.select_one("span.HelperDivIndicator")
-            popup = parse_popup(popup_span["onmouseover"])
-            name = popup[0]
-            description = popup[1].text
+            name, description = parse_popup_text(popup_span["onmouseover"])
             icon_image = column.select_one("img")
             icon_url = icon_image["src"]
             builder.add_account_badge(AccountBadge(name=name, icon_url=icon_url, description=description))
@@ -2,7 +2,7 @@
 import os
 import re
 import urllib.parse
-from typing import Optional
+from typing import Optional, Union
 
 import bs4
 
@@ -16,7 +16,7 @@ from tibiapy.models import (
     CreatureEntry,
     CreaturesSection,
 )
-from tibiapy.utils import convert_line_breaks, parse_tibiacom_content
+from tibiapy.utils import convert_line_breaks, parse_markup, parse_tibiacom_content
 
 __all__ = (
     "BoostableBossesParser",
@@ -48,9 +48,12 @@ class BoostedCreaturesParser:
         return name, identifier
 
     @classmethod
-    def from_header(cls, content: str) -> BoostedCreatures:
+    def from_header(cls, content: Union[str, bytes]) -> BoostedCreatures:
         """Parse both boosted creature and boss from the content of any section in Tibia.com.
 
+        .. versionchanged:: 6.4.0
+            The content may be passed as UTF-8 encoded :class:`bytes`.
+
         Parameters
         ----------
         content:
@@ -67,8 +70,7 @@ class BoostedCreaturesParser:
 
         """
         try:
-            parsed_content = bs4.BeautifulSoup(content.replace("ISO-8859-1", "utf-8"), "lxml",
-                                               parse_only=bs4.SoupStrainer("div", attrs={"id": "RightArtwork"}))
+            parsed_content = parse_markup(content, parse_only=bs4.SoupStrainer("div", attrs={"id": "RightArtwork"}))
             creature_name, creature_identifier = cls._parse_boosted_platform(parsed_content, "Monster")
             boss_name, boss_identifier = cls._parse_boosted_platform(parsed_content, "Boss")
             return BoostedCreatures(
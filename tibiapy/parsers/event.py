@@ -8,7 +8,7 @@ import bs4
 
 from tibiapy.builders import EventScheduleBuilder
 from tibiapy.models import EventEntry, EventSchedule
-from tibiapy.utils import parse_popup, parse_tibiacom_content
+from tibiapy.utils import parse_popups, parse_tibiacom_content
 
 __all__ = (
     "EventScheduleParser",
@@ -45,13 +45,16 @@ class EventScheduleParser:
         builder = EventScheduleBuilder().year(year).month(month)
         events_table = parsed_content.select_one("#eventscheduletable")
         day_cells = events_table.select("td")
+        day_cells_popups = [day_cell.select("span.HelperDivIndicator") for day_cell in day_cells]
+        # All popups in the calendar are parsed at once, then handed back to their day cells in the same order.
+        parsed_popups = iter(parse_popups(popup["onmouseover"] for popups in day_cells_popups for popup in popups))
 
         ongoing_events = []
         ongoing_day = 1
         first_day = True
 
-        for day_cell in day_cells:
-            day, today_events = cls._process_day_cell(day_cell)
+        for day_cell, popups in zip(day_cells, day_cells_popups):
+            day, today_events = cls._process_day_cell(day_cell, [(popup, next(parsed_popups)) for popup in popups])
             month, year = cls._adjust_date(ongoing_day, day, month, year)
             ongoing_day = day + 1
 
@@ -118,12 +121,16 @@ class EventScheduleParser:
         return values
 
     @classmethod
-    def _process_day_cell(cls, day_cell: bs4.Tag) -> tuple[int, list[EventEntry]]:
+    def _process_day_cell(
+            cls,
+            day_cell: bs4.Tag,
+            popups: list[tuple[bs4.Tag, tuple[str, bs4.Tag]]],
+    ) -> tuple[int, list[EventEntry]]:
         day_div = day_cell.select_one("div")
         day = int(day_div.text)
         today_events = []
 
-        for popup in day_cell.select("span.HelperDivIndicator"):
+        for popup, (title, popup_content) in popups:
             colored_blocks = popup.select("div:not([class])")
             event_colors = {}
             for block in colored_blocks:
@@ -131,7 +138,6 @@ class EventScheduleParser:
                 block_title = block.text.replace("*", "")
                 event_colors[block_title] = style_values["background"]
 
-            title, popup_content = parse_popup(popup["onmouseover"])
             divs = popup_content.select("div")
             # Multiple events can be described in the same popup, they come in pairs, title and content.
             for title, content in zip(*[iter(d.text for d in divs)] * 2):
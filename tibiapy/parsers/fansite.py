@@ -8,7 +8,7 @@ from tibiapy.models.fansite import (
     FansiteSocialMedia,
     FansitesSection,
 )
-from tibiapy.utils import get_rows, parse_popup, parse_tibiacom_content
+from tibiapy.utils import get_rows, parse_popup_text, parse_tibiacom_content
 
 
 class FansitesSectionParser:
@@ -60,20 +60,20 @@ class FansitesSectionParser:
             content = []
             content_poupups = cols[2].select("span")
             for content_span in content_poupups:
-                _, popup = parse_popup(content_span["onmouseover"])
-                content.append(FansiteContent(name=popup.text, icon_url=content_span.select_one("img")["src"]))
+                _, content_name = parse_popup_text(content_span["onmouseover"])
+                content.append(FansiteContent(name=content_name, icon_url=content_span.select_one("img")["src"]))
 
             social = []
             social_poupups = cols[3].select("span")
             for social_span in social_poupups:
-                _, popup = parse_popup(social_span["onmouseover"])
-                social.append(FansiteSocialMedia(name=popup.text, icon_url=social_span.select_one("img")["src"]))
+                _, social_name = parse_popup_text(social_span["onmouseover"])
+                social.append(FansiteSocialMedia(name=social_name, icon_url=social_span.select_one("img")["src"]))
 
             languages = []
             languages_poupups = cols[4].select("div.HelperDivIndicator")
             for language_div in languages_poupups:
-                _, popup = parse_popup(language_div["onmouseover"])
-                languages.append(popup.text)
+                _, language = parse_popup_text(language_div["onmouseover"])
+                languages.append(language)
 
             specials = [t.text for t in cols[5].select("li")]
 
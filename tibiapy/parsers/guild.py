@@ -3,15 +3,17 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 from tibiapy.builders import GuildBuilder, GuildWarEntryBuilder, GuildWarsBuilder
+from tibiapy.enums import Vocation
 from tibiapy.errors import InvalidContentError
 from tibiapy.models import (
     GuildEntry,
     GuildHouse,
     GuildInvite,
     GuildMember,
+    GuildMemberRow,
     GuildsSection,
     GuildWarEntry,
 )
@@ -21,6 +23,7 @@ from tibiapy.utils import (
     parse_link_info,
     parse_tibia_date,
     parse_tibiacom_content,
+    try_enum,
 )
 
 if TYPE_CHECKING:
@@ -122,13 +125,17 @@ class GuildParser:
     """Parser for guild pages in Tibia.com."""
 
     @classmethod
-    def from_content(cls, content: str) -> Optional[Guild]:
+    def from_content(cls, content: Union[str, bytes], *, compact: bool = False) -> Optional[Guild]:
         """Create an instance of the class from the HTML content of the guild's page.
 
         Parameters
         ----------
         content: :class:`str`
             The HTML content of the page.
+        compact: :class:`bool`
+            Whether to store the members as :class:`GuildMemberRow` instead of :class:`GuildMember`.
+
+            .. versionadded:: 6.4.0
 
         Returns
         -------
@@ -140,7 +147,8 @@ class GuildParser:
             If content is not the HTML of a guild's page.
 
         """
-        if "An internal error has occurred" in content:
+        error_message = "An internal error has occurred"
+        if (error_message.encode() if isinstance(content, bytes) else error_message) in content:
             return None
 
         parsed_content = parse_tibiacom_content(content)
@@ -157,9 +165,13 @@ class GuildParser:
         cls._parse_guild_homepage(builder, info_container)
         cls._parse_guild_guildhall(builder, info_container)
         cls._parse_guild_disband_info(builder, info_container)
-        cls._parse_guild_members(builder, parsed_content)
+        rows = [] if compact else None
+        cls._parse_guild_members(builder, parsed_content, rows)
+        guild = builder.build()
+        if rows is not None:
+            guild.members = rows
 
-        return builder.build()
+        return guild
 
     # endregion
 
@@ -170,6 +182,7 @@ class GuildParser:
             builder: GuildBuilder,
             previous_rank: dict[int, str],
             values: tuple[str, ...],
+            rows: list[GuildMemberRow] = None,
     ) -> None:
         """Parse the column texts of a member row into a member dictionary.
 
@@ -181,6 +194,8 @@ class GuildParser:
             The last rank present in the rows.
         values: :class:`tuple` of :class:`str`
             A list of row contents.
+        rows: :class:`list` of :class:`GuildMemberRow`, optional
+            If set, the member is appended to this list as a compact row instead of being added to the builder.
 
         """
         rank, name, vocation, level, joined, status = values
@@ -192,6 +207,11 @@ class GuildParser:
             title = m.group(2)
 
         joined = parse_tibia_date(joined)
+        if rows is not None:
+            rows.append(GuildMemberRow(name.strip(), rank.strip(), title, int(level), try_enum(Vocation, vocation),
+                                       joined, status == "online"))
+            return
+
         builder.add_member(GuildMember(name=name.strip(), rank=rank.strip(), title=title, level=int(level),
                                        vocation=vocation, joined_on=joined, is_online=status == "online"))
 
@@ -309,7 +329,12 @@ class GuildParser:
         builder.logo_url(logo_img["src"])
 
     @classmethod
-    def _parse_guild_members(cls, builder: GuildBuilder, parsed_content: bs4.Tag) -> None:
+    def _parse_guild_members(
+            cls,
+            builder: GuildBuilder,
+            parsed_content: bs4.Tag,
+            rows: list[GuildMemberRow] = None,
+    ) -> None:
         """Parse the guild's member and invited list.
 
         Parameters
@@ -318,6 +343,8 @@ class GuildParser:
             The builder where data will be stored to.
         parsed_content: :class:`bs4.Tag`
             The parsed content of the guild's page
+        rows: :class:`list` of :class:`GuildMemberRow`, optional
+            If set, members are appended to this list as compact rows instead of being added to the builder.
 
         """
         member_rows = parsed_content.find_all("tr", {"bgcolor": ["#D4C0A1", "#F1E0C6"]})
@@ -326,7 +353,7 @@ class GuildParser:
             columns = row.select("td")
             values = tuple(clean_text(c) for c in columns)
             if len(columns) == COLS_GUILD_MEMBER:
-                cls._parse_current_member(builder, previous_rank, values)
+                cls._parse_current_member(builder, previous_rank, values, rows)
 
             if len(columns) == COLS_INVITED_MEMBER:
                 cls._parse_invited_member(builder, values)
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import datetime
+import html
+import logging
 import re
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 import bs4
 
@@ -14,10 +16,12 @@ from tibiapy.enums import (
     HighscoresCategory,
     HighscoresProfession,
     PvpTypeFilter,
+    Vocation,
 )
 from tibiapy.errors import InvalidContentError
-from tibiapy.models import HighscoresEntry, LoyaltyHighscoresEntry
+from tibiapy.models import HighscoresEntry, HighscoresRow, LoyaltyHighscoresEntry
 from tibiapy.utils import (
+    HTML_TAG_PATTERN,
     clean_text,
     parse_form_data,
     parse_integer,
@@ -33,8 +37,22 @@ __all__ = (
     "HighscoresParser",
 )
 
+log = logging.getLogger("tibiapy")
+
 results_pattern = re.compile(r"Results: ([\d,]+)")
 numeric_pattern = re.compile(r"(\d+)")
+highscores_title_pattern = re.compile(
+    r'<div class="Text">Highscores\s*(?:<span class="RightArea">([^<]*)</span>)?\s*</div>',
+)
+form_pattern = re.compile(r"<form\b.*?</form>", re.DOTALL)
+page_navigation_pattern = re.compile(r'<td class="PageNavigation">.*?</td>', re.DOTALL)
+entries_table_pattern = re.compile(r'<table class="TableContent"[^>]*>(.*?)</table>', re.DOTALL)
+styled_row_pattern = re.compile(r"<tr style=[^>]*>(.*?)</tr>", re.DOTALL)
+cell_pattern = re.compile(r"<td[^>]*>(.*?)</td>", re.DOTALL)
+select_pattern = re.compile(r'<select\b[^>]*\bname="([^"]+)"[^>]*>(.*?)</select>', re.DOTALL)
+option_pattern = re.compile(r"<option\b([^>]*)>(.*?)</option>", re.DOTALL)
+input_pattern = re.compile(r"<input\b([^>]*)>")
+attribute_pattern = re.compile(r'\b([\w-]+)(?:="([^"]*)")?')
 
 
 class HighscoresParser:
@@ -43,7 +61,7 @@ class HighscoresParser:
     _ENTRIES_PER_PAGE = 50
 
     @classmethod
-    def from_content(cls, content: str) -> Optional[Highscores]:
+    def from_content(cls, content: str, *, compact: bool = False) -> Optional[Highscores]:
         """Create an instance of the class from the html content of a highscores page.
 
         Notes
@@ -55,6 +73,10 @@ class HighscoresParser:
         ----------
         content:
             The HTML content of the page.
+        compact:
+            Whether to store the entries as :class:`HighscoresRow` instead of :class:`HighscoresEntry`.
+
+            .. versionadded:: 6.4.0
 
         Returns
         -------
@@ -65,6 +87,30 @@ class HighscoresParser:
         InvalidContent
             If content is not the HTML of a highscore's page.
 
+        """
+        highscores = cls._parse_with_patterns(content, compact)
+        if highscores is None:
+            highscores = cls._parse_with_tree(content, compact)
+
+        return highscores
+
+    # region Private methods
+    @classmethod
+    def _parse_with_tree(cls, content: str, compact: bool = False) -> Optional[Highscores]:
+        """Parse a highscores page by building its whole document tree.
+
+        Parameters
+        ----------
+        content: :class:`str`
+            The HTML content of the page.
+        compact: :class:`bool`
+            Whether to store the entries as :class:`HighscoresRow` instead of :class:`HighscoresEntry`.
+
+        Returns
+        -------
+        :class:`Highscores`, optional
+            The highscores results contained in the page.
+
         """
         parsed_content = parse_tibiacom_content(content)
         form = parsed_content.select_one("form")
@@ -83,12 +129,83 @@ class HighscoresParser:
             builder.last_updated(datetime.datetime.now(tz=datetime.timezone.utc) - last_update)
 
         entries_table = tables.get("Highscores")
-        cls._parse_entries_table(builder, entries_table)
-        return builder.build()
+        rows = [] if compact else None
+        cls._parse_entries_table(builder, entries_table, rows)
+        highscores = builder.build()
+        if rows is not None:
+            highscores.entries = rows
+
+        return highscores
 
-    # region Private methods
     @classmethod
-    def _parse_entries_table(cls, builder: HighscoresBuilder, table: bs4.Tag) -> None:
+    def _parse_with_patterns(cls, content: str, compact: bool = False) -> Optional[Highscores]:
+        """Parse a highscores page by extracting its rows with regular expressions, without building a document tree.
+
+        Only the filters form and the pagination block are parsed as HTML, as they are small.
+
+        Parameters
+        ----------
+        content: :class:`str`
+            The HTML content of the page.
+        compact: :class:`bool`
+            Whether to store the entries as :class:`HighscoresRow` instead of :class:`HighscoresEntry`.
+
+        Returns
+        -------
+        :class:`Highscores`, optional
+            The highscores results contained in the page, or :obj:`None` if the page's structure is not the expected.
+
+        """
+        box_start = content.find('class="BoxContent"')
+        form_match = form_pattern.search(content, box_start) if box_start >= 0 else None
+        title_match = highscores_title_pattern.search(content, box_start) if box_start >= 0 else None
+        if not form_match or not title_match:
+            return None
+
+        navigation_match = page_navigation_pattern.search(content, title_match.end())
+        table_match = entries_table_pattern.search(content, title_match.end())
+        if not navigation_match or not table_match:
+            return None
+
+        try:
+            builder = HighscoresBuilder()
+            cls._parse_filters_with_patterns(builder, form_match.group(0))
+            if (last_update := title_match.group(1)) is not None:
+                m = numeric_pattern.search(last_update)
+                last_update = datetime.timedelta(minutes=int(m.group(1))) if m else datetime.timedelta()
+                builder.last_updated(datetime.datetime.now(tz=datetime.timezone.utc) - last_update)
+
+            navigation = parse_tibiacom_content(f"<table><tr>{navigation_match.group(0)}</tr></table>",
+                                                tag="td", html_class="PageNavigation")
+            page, total_pages, results_count = parse_pagination(navigation.select_one("td"))
+            builder.current_page(page).total_pages(total_pages).results_count(results_count)
+            rows = [] if compact else None
+            for row_match in styled_row_pattern.finditer(table_match.group(1)):
+                cols = [clean_text(html.unescape(HTML_TAG_PATTERN.sub("", c))) for c in
+                        cell_pattern.findall(row_match.group(1))]
+                if "There is currently no data" in cols[0]:
+                    break
+
+                if cols[0] == "Rank":
+                    continue
+
+                if len(cols) <= 2:
+                    break
+
+                cls._parse_entry(builder, cols, rows)
+
+            highscores = builder.build()
+        except (ValueError, IndexError, KeyError, AttributeError, TypeError) as e:
+            log.debug("Unexpected highscores page structure, parsing full document: %s", e)
+            return None
+
+        if rows is not None:
+            highscores.entries = rows
+
+        return highscores
+
+    @classmethod
+    def _parse_entries_table(cls, builder: HighscoresBuilder, table: bs4.Tag, rows: list[HighscoresRow] = None) -> None:
         """Parse the table containing the highscore entries.
 
         Parameters
@@ -97,12 +214,14 @@ class HighscoresParser:
             The builder where data will be stored to.
         table: :class:`bs4.Tag`
             The table containing the entries.
+        rows: :class:`list` of :class:`HighscoresRow`, optional
+            If set, entries are appended to this list as compact rows instead of being added to the builder.
 
         """
         page, total_pages, results_count = parse_pagination(table.select_one(".PageNavigation"))
         builder.current_page(page).total_pages(total_pages).results_count(results_count)
-        rows = table.select("tr[style]")
-        for row in rows:
+        table_rows = table.select("tr[style]")
+        for row in table_rows:
             cols_raw = row.select("td")
             if "There is currently no data" in cols_raw[0].text:
                 break
@@ -113,7 +232,7 @@ class HighscoresParser:
             if len(cols_raw) <= 2:
                 break
 
-            cls._parse_entry(builder, cols_raw)
+            cls._parse_entry(builder, cols_raw, rows)
 
     @classmethod
     def _parse_filters_table(cls, builder: HighscoresBuilder, form: bs4.Tag) -> None:
@@ -136,6 +255,46 @@ class HighscoresParser:
         builder.pvp_types_filter({try_enum(PvpTypeFilter, int(v)) for v in data.values_multiple["worldtypes[]"]})
         builder.available_worlds([v for v in data.available_options["world"].values() if v])
 
+    @classmethod
+    def _parse_filters_with_patterns(cls, builder: HighscoresBuilder, form: str) -> None:
+        """Parse the filters form found in a highscores page, using regular expressions.
+
+        This sets the same values as :meth:`_parse_filters_table`.
+
+        Parameters
+        ----------
+        builder: :class:`HighscoresBuilder`
+            The builder where data will be stored to.
+        form: :class:`str`
+            The HTML content of the form.
+
+        """
+        values = {}
+        world_options = {}
+        for name, options_content in select_pattern.findall(form):
+            values[name] = None
+            for attributes, label in option_pattern.findall(options_content):
+                attributes = dict(attribute_pattern.findall(attributes))
+                if name == "world":
+                    world_options[clean_text(html.unescape(label))] = attributes.get("value")
+
+                if "selected" in attributes:
+                    values[name] = attributes.get("value")
+
+        world_types = []
+        for attributes in input_pattern.findall(form):
+            attributes = dict(attribute_pattern.findall(attributes))
+            if attributes.get("name") == "worldtypes[]" and "checked" in attributes:
+                world_types.append(attributes.get("value"))
+
+        builder.world(values.get("world") or None)
+        builder.battleye_filter(try_enum(HighscoresBattlEyeType, parse_integer(values.get("beprotection"), None)))
+        builder.category(try_enum(HighscoresCategory, parse_integer(values.get("category"), None)))
+        builder.vocation(try_enum(HighscoresProfession, parse_integer(values.get("profession"), None),
+                                  HighscoresProfession.ALL))
+        builder.pvp_types_filter({try_enum(PvpTypeFilter, int(v)) for v in world_types})
+        builder.available_worlds([v for v in world_options.values() if v])
+
     @classmethod
     def _parse_tables(cls, parsed_content: bs4.BeautifulSoup) -> dict[str, bs4.Tag]:
         """Parse the information tables found in a highscores page.
@@ -163,15 +322,22 @@ class HighscoresParser:
         return output
 
     @classmethod
-    def _parse_entry(cls, builder: HighscoresBuilder, cols: bs4.ResultSet) -> None:
+    def _parse_entry(
+            cls,
+            builder: HighscoresBuilder,
+            cols: Union[bs4.ResultSet, list[str]],
+            rows: list[HighscoresRow] = None,
+    ) -> None:
         """Parse an entry's row and adds the result to py:attr:`entries`.
 
         Parameters
         ----------
         builder: :class:`HighscoresBuilder`
             The builder where data will be stored to.
-        cols: :class:`bs4.ResultSet`
-            The list of columns for that entry.
+        cols: :class:`bs4.ResultSet` or :class:`list` of :class:`str`
+            The list of columns for that entry, or their text.
+        rows: :class:`list` of :class:`HighscoresRow`, optional
+            If set, the entry is appended to this list as a compact row instead of being added to the builder.
 
         """
         rank, name, *values = (clean_text(c) for c in cols)
@@ -184,6 +350,10 @@ class HighscoresParser:
 
         value = int(value.replace(",", ""))
         level = int(level)
+        if rows is not None:
+            rows.append(HighscoresRow(rank, name, try_enum(Vocation, vocation), world, level, value, extra))
+            return
+
         if builder._category == HighscoresCategory.LOYALTY_POINTS:
             entry = LoyaltyHighscoresEntry(rank=rank, name=name, vocation=vocation, world=world, level=level,
                                            value=value, title=extra)
@@ -3,7 +3,7 @@ from typing import Optional
 
 from tibiapy.builders.kill_statistics import KillStatisticsBuilder
 from tibiapy.errors import InvalidContentError
-from tibiapy.models import KillStatistics, RaceEntry
+from tibiapy.models import KillStatistics, RaceEntry, RaceRow
 from tibiapy.utils import clean_text, get_rows, parse_form_data, parse_tibiacom_content
 
 __all__ = (
@@ -15,13 +15,18 @@ class KillStatisticsParser:
     """Parser for kill statistics."""
 
     @classmethod
-    def from_content(cls, content: str) -> Optional[KillStatistics]:
+    def from_content(cls, content: str, *, compact: bool = False) -> Optional[KillStatistics]:
         """Create an instance of the class from the HTML content of the kill statistics' page.
 
         Parameters
         ----------
         content:
             The HTML content of the page.
+        compact:
+            Whether to store the entries as :class:`RaceRow` instead of :class:`RaceEntry`.
+            The totals are always stored as a :class:`RaceEntry`.
+
+            .. versionadded:: 6.4.0
 
         Returns
         -------
@@ -49,12 +54,20 @@ class KillStatisticsParser:
 
             header, subheader, *rows = get_rows(entries_table)
 
+            compact_entries = {}
             for i, row in enumerate(rows):
                 columns_raw = row.select("td")
                 columns = [clean_text(c) for c in columns_raw]
                 if not columns[2].isnumeric():
                     continue
 
+                if compact and i != len(rows) - 1:
+                    compact_entries[columns[0]] = RaceRow(last_day_players_killed=int(columns[1]),
+                                                          last_day_killed=int(columns[2]),
+                                                          last_week_players_killed=int(columns[3]),
+                                                          last_week_killed=int(columns[4]))
+                    continue
+
                 entry = RaceEntry(last_day_players_killed=int(columns[1]),
                                   last_day_killed=int(columns[2]),
                                   last_week_players_killed=int(columns[3]),
@@ -64,6 +77,10 @@ class KillStatisticsParser:
                 else:
                     builder.set_entry(columns[0], entry)
 
-            return builder.build()
+            kill_statistics = builder.build()
+            if compact:
+                kill_statistics.entries = compact_entries
+
+            return kill_statistics
         except (AttributeError, KeyError) as e:
             raise InvalidContentError("content does not belong to a Tibia.com kill statistics page.", e) from e
@@ -169,7 +169,7 @@ class NewsParser:
     """Parser for news articles from Tibia.com."""
 
     @classmethod
-    def from_content(cls, content: str, news_id: int = 0) -> Optional[News]:
+    def from_content(cls, content: Union[str, bytes], news_id: int = 0) -> Optional[News]:
         """Get a news entry by its HTML content from Tibia.com.
 
         Notes
@@ -194,7 +194,8 @@ class NewsParser:
             If content is not the HTML of a news' page.
 
         """
-        if "News not found" in content:
+        not_found_message = "News not found"
+        if (not_found_message.encode() if isinstance(content, bytes) else not_found_message) in content:
             return None
 
         try:
@@ -3,12 +3,15 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Optional, Union
+
+from lxml import etree
 
 from tibiapy.builders.world import WorldBuilder, WorldEntryBuilder, WorldOverviewBuilder
-from tibiapy.enums import BattlEyeType, PvpType, TransferType, WorldLocation
+from tibiapy.enums import BattlEyeType, PvpType, TransferType, Vocation, WorldLocation
 from tibiapy.errors import InvalidContentError
-from tibiapy.models import OnlineCharacter, WorldEntry
+from tibiapy.models import OnlineCharacter, OnlineCharacterRow, WorldEntry
 from tibiapy.utils import (
     clean_text,
     get_rows,
@@ -28,6 +31,7 @@ if TYPE_CHECKING:
 __all__ = (
     "WorldParser",
     "WorldOverviewParser",
+    "WorldStreamParser",
 )
 
 record_regexp = re.compile(r"(?P<count>[\d.,]+) players \(on (?P<date>[^)]+)\)")
@@ -38,13 +42,17 @@ class WorldParser:
     """Parses Tibia.com content into worlds."""
 
     @classmethod
-    def from_content(cls, content: str) -> Optional[World]:
+    def from_content(cls, content: str, *, compact: bool = False) -> Optional[World]:
         """Parse a Tibia.com response into a :class:`World`.
 
         Parameters
         ----------
         content:
             The raw HTML from the server's information page.
+        compact:
+            Whether to store the online players as :class:`OnlineCharacterRow` instead of :class:`OnlineCharacter`.
+
+            .. versionadded:: 6.4.0
 
         Returns
         -------
@@ -70,15 +78,23 @@ class WorldParser:
             if not online_table:
                 return builder.build()
 
+            rows = []
             for row in online_table.select("tr.Odd, tr.Even"):
                 cols_raw = row.select("td")
                 name, level, vocation = (clean_text(c) for c in cols_raw)
-                builder.add_online_player(OnlineCharacter(name=name, level=int(level), vocation=vocation))
+                if compact:
+                    rows.append(OnlineCharacterRow(name, int(level), try_enum(Vocation, vocation)))
+                else:
+                    builder.add_online_player(OnlineCharacter(name=name, level=int(level), vocation=vocation))
 
         except AttributeError as e:
             raise InvalidContentError("content is not from the world section in Tibia.com") from e
 
-        return builder.build()
+        world = builder.build()
+        if compact:
+            world.online_players = rows
+
+        return world
 
     @classmethod
     def _parse_world_info(cls, builder: WorldBuilder, world_info_table: bs4.Tag) -> None:
@@ -91,6 +107,25 @@ class WorldParser:
         world_info_table: :class:`bs4.Tag`
             The table containing the world's information.
 
+        """
+        for row in get_rows(world_info_table):
+            cols_raw = row.select("td")
+            field, value = (clean_text(ele) for ele in cols_raw)
+            cls._parse_world_info_field(builder, field, value)
+
+    @classmethod
+    def _parse_world_info_field(cls, builder: WorldBuilder, field: str, value: str) -> None:
+        """Apply a single field of the World Information table to the builder.
+
+        Parameters
+        ----------
+        builder: :class:`WorldBuilder`
+            The instance of the builder where data will be collected.
+        field: :class:`str`
+            The name of the field, as displayed in the table.
+        value: :class:`str`
+            The value of the field.
+
         """
         field_actions = {
             "Status": lambda v: builder.is_online("online" in v.lower()),
@@ -105,14 +140,9 @@ class WorldParser:
             "BattlEye Status": lambda v: cls._parse_battleye_status(builder, v),
             "Game World Type": lambda v: builder.is_experimental(v.lower() == "experimental"),
         }
-        for row in get_rows(world_info_table):
-            cols_raw = row.select("td")
-            cols = [clean_text(ele) for ele in cols_raw]
-            field, value = cols
-            field = field.replace(":", "")
-            if field in field_actions:
-                action = field_actions[field]
-                action(value)
+        field = field.replace(":", "")
+        if field in field_actions:
+            field_actions[field](value)
 
     @classmethod
     def _parse_world_quest_titles(cls, builder: WorldBuilder, value: str) -> None:
@@ -153,6 +183,195 @@ class WorldParser:
             builder.battleye_since(None).battleye_type(BattlEyeType.UNPROTECTED)
 
 
+class WorldStreamParser:
+    """Incrementally parses the page of a world, while its content is being read.
+
+    Content is passed in chunks using :meth:`feed`, and the online players are returned as soon as their rows are
+    read. Rows are discarded from the tree once parsed, so the memory used does not grow with the number of players.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    compact: :class:`bool`
+        Whether to produce :class:`OnlineCharacterRow` instead of :class:`OnlineCharacter`.
+    keep_players: :class:`bool`
+        Whether to keep the parsed online players, to include them in :attr:`world`.
+
+    """
+
+    def __init__(self, *, compact: bool = False, keep_players: bool = True):
+        self.compact = compact
+        self.keep_players = keep_players
+        self._parser = etree.HTMLPullParser(events=("end",), tag=("div", "option", "tr"))
+        self._builder = WorldBuilder()
+        self._online_players: list[Union[OnlineCharacter, OnlineCharacterRow]] = []
+        self._caption: Optional[str] = None
+        self._name: Optional[str] = None
+        self._not_found = False
+        self._has_info = False
+        self._world: Optional[World] = None
+        self._closed = False
+
+    @property
+    def world(self) -> Optional[World]:
+        """The world described in the page, or :obj:`None` if the world doesn't exist.
+
+        Only available after :meth:`close` is called.
+        """
+        return self._world
+
+    def feed(self, data: Union[str, bytes]) -> list[Union[OnlineCharacter, OnlineCharacterRow]]:
+        """Feed a chunk of the page's content to the parser.
+
+        Parameters
+        ----------
+        data:
+            The next chunk of the page.
+
+        Returns
+        -------
+            The online players found in the chunk.
+
+        Raises
+        ------
+        InvalidContent
+            If the content is not the HTML content of the world section in Tibia.com
+
+        """
+        self._parser.feed(data)
+        return self._read_events()
+
+    def close(self) -> list[Union[OnlineCharacter, OnlineCharacterRow]]:
+        """Signal the end of the content, building :attr:`world`.
+
+        Returns
+        -------
+            The online players found in the remaining content.
+
+        Raises
+        ------
+        InvalidContent
+            If the content is not the HTML content of the world section in Tibia.com
+
+        """
+        if self._closed:
+            return []
+
+        self._closed = True
+        self._parser.close()
+        players = self._read_events()
+        if self._not_found:
+            return players
+
+        if self._name is None or not self._has_info:
+            raise InvalidContentError("content is not from the world section in Tibia.com")
+
+        self._world = self._builder.name(self._name).build()
+        if self.compact:
+            self._world.online_players = self._online_players
+
+        return players
+
+    @classmethod
+    def iter_online_players(
+            cls,
+            content: Union[str, Iterable[str]],
+            *,
+            compact: bool = False,
+            chunk_size: int = 16384,
+    ) -> Iterator[Union[OnlineCharacter, OnlineCharacterRow]]:
+        """Iterate over the online players of a world's page, without building the whole document.
+
+        Parameters
+        ----------
+        content:
+            The HTML content of the world's page, or an iterable of its chunks.
+        compact:
+            Whether to yield :class:`OnlineCharacterRow` instead of :class:`OnlineCharacter`.
+        chunk_size:
+            The size of the chunks to feed the parser with, when the content is passed as a single string.
+
+        Yields
+        ------
+            The online players, in the order displayed.
+
+        Raises
+        ------
+        InvalidContent
+            If the content is not the HTML content of the world section in Tibia.com
+
+        """
+        chunks = content
+        if isinstance(content, str):
+            chunks = (content[i:i + chunk_size] for i in range(0, len(content), chunk_size))
+
+        parser = cls(compact=compact, keep_players=False)
+        for chunk in chunks:
+            yield from parser.feed(chunk)
+
+        yield from parser.close()
+
+    def _read_events(self) -> list[Union[OnlineCharacter, OnlineCharacterRow]]:
+        players = []
+        for _, element in self._parser.read_events():
+            if element.tag == "tr":
+                if player := self._parse_row(element):
+                    players.append(player)
+
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+            elif element.tag == "option":
+                if self._name is None and element.get("selected") is not None:
+                    self._name = self._get_text(element)
+
+            else:
+                classes = (element.get("class") or "").split()
+                if "Text" in classes:
+                    self._caption = self._get_text(element)
+                    self._not_found = self._not_found or self._caption == "Error"
+                    self._has_info = self._has_info or self._caption == "World Information"
+                elif "TableContainer" in classes:
+                    element.clear()
+
+        return players
+
+    def _parse_row(self, row: etree._Element) -> Optional[Union[OnlineCharacter, OnlineCharacterRow]]:
+        if self._caption is None:
+            return None
+
+        cols = [self._get_text(c) for c in row.findall("td")]
+        if self._caption == "World Information" and len(cols) == 2:
+            WorldParser._parse_world_info_field(self._builder, *cols)
+            return None
+
+        if "Players Online" not in self._caption or row.get("class") not in {"Odd", "Even"}:
+            return None
+
+        try:
+            name, level, vocation = cols
+            if self.compact:
+                player = OnlineCharacterRow(name, int(level), try_enum(Vocation, vocation))
+            else:
+                player = OnlineCharacter(name=name, level=int(level), vocation=vocation)
+        except ValueError as e:
+            raise InvalidContentError("content is not from the world section in Tibia.com") from e
+
+        if self.keep_players:
+            if self.compact:
+                self._online_players.append(player)
+            else:
+                self._builder.add_online_player(player)
+
+        return player
+
+    @staticmethod
+    def _get_text(element: etree._Element) -> str:
+        return clean_text("".join(element.itertext()))
+
+
 class WorldOverviewParser:
     """Parses Tibia.com content from the World Overview section."""
 
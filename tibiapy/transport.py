@@ -0,0 +1,557 @@
+"""Transports used by the client to perform requests.
+
+Transports allow replacing how responses are obtained, e.g. recording real traffic to an archive, and replaying it
+later without network access.
+"""
+from __future__ import annotations
+
+import asyncio
+import codecs
+import contextlib
+import contextvars
+import gzip
+import json
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from multidict import CIMultiDict
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from tibiapy.cache import CacheBackend
+
+__all__ = (
+    "CachingTransport",
+    "LiveTransport",
+    "RecordingTransport",
+    "ReplayTransport",
+    "Transport",
+    "TransportResponse",
+)
+
+log = logging.getLogger("tibiapy")
+
+# Stored in place of a response that can't be cached, so clients waiting for it request it themselves at once.
+_UNCACHEABLE = b""
+_refreshing: contextvars.ContextVar[bool] = contextvars.ContextVar("tibiapy_refreshing", default=False)
+
+
+class TransportResponse:
+    """A response obtained by a transport.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    url: :class:`str`
+        The final URL of the response, after redirects.
+    method: :class:`str`
+        The HTTP method used for the request.
+    status: :class:`int`
+        The HTTP status code of the response.
+    reason: :class:`str`
+        The HTTP status reason of the response.
+    headers: :class:`multidict.CIMultiDict`
+        The headers of the response.
+    body: :class:`bytes`, optional
+        The raw body of the response, if the transport obtained it.
+    encoding: :class:`str`
+        The encoding of the body.
+
+    """
+
+    __slots__ = ("_content", "body", "encoding", "headers", "method", "reason", "status", "url")
+
+    def __init__(self, url: str, *, method: str, status: int, reason: Optional[str], headers: CIMultiDict,
+                 content: Optional[str] = None, body: Optional[bytes] = None, encoding: str = "utf-8"):
+        self.url = url
+        self.method = method
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.encoding = encoding
+        self._content = content
+
+    @property
+    def content(self) -> str:
+        """:class:`str`: The decoded body of the response.
+
+        If the transport only obtained the raw body, it is decoded on first access.
+        """
+        if self._content is None:
+            self._content = self.body.decode(self.encoding) if self.body is not None else ""
+
+        return self._content
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} url={self.url!r} method={self.method!r} status={self.status!r}>"
+
+
+class Transport(ABC):
+    """Base class for all transports.
+
+    The following implement this class:
+
+    - :class:`.LiveTransport`
+    - :class:`.CachingTransport`
+    - :class:`.RecordingTransport`
+    - :class:`.ReplayTransport`
+
+    .. versionadded:: 6.4.0
+    """
+
+    @abstractmethod
+    async def request(
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        """Perform a request.
+
+        Parameters
+        ----------
+        session:
+            The client's session.
+        method:
+            The HTTP method to use for the request.
+        url:
+            The URL that will be requested.
+        data:
+            A mapping representing the form-data to send as part of the request.
+        headers:
+            A mapping representing the headers to send as part of the request.
+
+        Returns
+        -------
+            The response obtained.
+
+        """
+        ...
+
+    async def stream(
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            *,
+            consumer: Callable[[str], Any],
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        """Perform a request, passing the decoded body to a consumer in chunks, as it is received.
+
+        By default, the request is performed using :meth:`request` and the whole body is passed at once.
+
+        Parameters
+        ----------
+        session:
+            The client's session.
+        method:
+            The HTTP method to use for the request.
+        url:
+            The URL that will be requested.
+        consumer:
+            A callable that receives each chunk of the body.
+        data:
+            A mapping representing the form-data to send as part of the request.
+        headers:
+            A mapping representing the headers to send as part of the request.
+
+        Returns
+        -------
+            The response obtained, containing the full body.
+
+        """
+        response = await self.request(session, method, url, data, headers)
+        if response.content:
+            consumer(response.content)
+
+        return response
+
+
+class LiveTransport(Transport):
+    """A transport that performs requests to Tibia.com using the client's session.
+
+    This is the transport used by default.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    chunk_size: :class:`int`
+        The maximum number of bytes read at once when streaming a response.
+
+    """
+
+    def __init__(self, *, chunk_size: int = 16384):
+        self.chunk_size = chunk_size
+
+    async def request(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        async with session.request(method, url, data=data, headers=headers) as resp:
+            return TransportResponse(
+                str(resp.url),
+                method=resp.method,
+                status=resp.status,
+                reason=resp.reason,
+                headers=CIMultiDict(resp.headers),
+                body=await resp.read(),
+                encoding=resp.charset or "utf-8",
+            )
+
+    async def stream(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            *,
+            consumer: Callable[[str], Any],
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        async with session.request(method, url, data=data, headers=headers) as resp:
+            decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")()
+            parts = []
+            async for chunk in resp.content.iter_chunked(self.chunk_size):
+                if text := decoder.decode(chunk):
+                    parts.append(text)
+                    consumer(text)
+
+            if text := decoder.decode(b"", final=True):
+                parts.append(text)
+                consumer(text)
+
+            return TransportResponse(
+                str(resp.url),
+                method=resp.method,
+                status=resp.status,
+                reason=resp.reason,
+                headers=CIMultiDict(resp.headers),
+                content="".join(parts),
+            )
+
+
+def _request_key(method: str, url: str, data: Optional[dict[str, Any]]) -> str:
+    """Get the key used to identify a request in an archive."""
+    key = f"{method.upper()} {url}"
+    if data:
+        key += " " + json.dumps(data, sort_keys=True, default=str)
+
+    return key
+
+
+class CachingTransport(Transport):
+    """A transport that stores the responses obtained by another transport in a cache backend.
+
+    Clients using the same backend share the responses, so each page is only requested once by all of them.
+
+    Only successful ``GET`` responses are stored, for as long as Tibia.com caches them, according to their ``Age``
+    header. Their ``Age`` header is updated every time they are served from the cache.
+
+    While a response is being requested, other clients wait for it to be stored instead of requesting it too. If it's
+    not stored after ``lock_timeout`` seconds, or it turns out it can't be stored, they request it themselves.
+
+    Responses can be requested again before they expire from the cache using :meth:`refreshing`.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    backend: :class:`.CacheBackend`
+        The backend where responses are stored.
+    transport: :class:`Transport`
+        The transport performing the actual requests.
+    ttl: :class:`float`
+        The number of seconds Tibia.com caches its responses for.
+    lock_timeout: :class:`float`
+        The maximum number of seconds to wait for a response being requested by another client.
+    poll_interval: :class:`float`
+        The number of seconds between checks for a response being requested by another client.
+
+    """
+
+    def __init__(
+            self,
+            backend: CacheBackend,
+            transport: Optional[Transport] = None,
+            *,
+            ttl: float = 300.0,
+            lock_timeout: float = 10.0,
+            poll_interval: float = 0.05,
+    ):
+        self.backend = backend
+        self.transport = transport or LiveTransport()
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+
+    @staticmethod
+    @contextlib.contextmanager
+    def refreshing() -> Iterator[None]:
+        """Request responses again inside this context, replacing the ones stored in the cache.
+
+        This is meant to refresh responses in the background before they expire from the cache.
+        The context is inherited by the tasks created inside of it.
+        """
+        token = _refreshing.set(True)
+        try:
+            yield
+        finally:
+            _refreshing.reset(token)
+
+    async def request(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        return await self._request(method, url, data,
+                                   lambda: self.transport.request(session, method, url, data, headers))
+
+    async def stream(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            *,
+            consumer: Callable[[str], Any],
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        streamed = False
+
+        def fetch() -> Awaitable[TransportResponse]:
+            nonlocal streamed
+            streamed = True
+            return self.transport.stream(session, method, url, consumer=consumer, data=data, headers=headers)
+
+        response = await self._request(method, url, data, fetch)
+        if not streamed and response.content:
+            consumer(response.content)
+
+        return response
+
+    async def _request(
+            self,
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]],
+            fetch: Callable[[], Awaitable[TransportResponse]],
+    ) -> TransportResponse:
+        if method.upper() != "GET":
+            return await fetch()
+
+        key = _request_key(method, url, data)
+        lock_key = f"{key} lock"
+        locked = False
+        deadline = time.monotonic() + self.lock_timeout
+        while not _refreshing.get():
+            value = await self.backend.get(key)
+            if value == _UNCACHEABLE:
+                break
+
+            if value is not None:
+                return self._decode(value)
+
+            if locked := await self.backend.add(lock_key, b"1", self.lock_timeout):
+                break
+
+            if time.monotonic() >= deadline:
+                break
+
+            await asyncio.sleep(self.poll_interval)
+
+        stored = False
+        try:
+            response = await fetch()
+            age = response.headers.get("Age", "0")
+            ttl = self.ttl - (int(age) if age.isnumeric() else 0)
+            if response.status == 200 and "maintenance.tibia.com" not in response.url and ttl > 0:
+                await self.backend.set(key, self._encode(response), ttl)
+                stored = True
+        finally:
+            if locked:
+                if not stored:
+                    await self.backend.set(key, _UNCACHEABLE, self.lock_timeout)
+
+                await self.backend.delete(lock_key)
+
+        return response
+
+    @staticmethod
+    def _encode(response: TransportResponse) -> bytes:
+        header = {
+            "url": response.url,
+            "method": response.method,
+            "status": response.status,
+            "reason": response.reason,
+            "headers": list(response.headers.items()),
+            "encoding": response.encoding,
+            "stored": time.time(),
+        }
+        body = response.body if response.body is not None else response.content.encode(response.encoding)
+        return json.dumps(header, separators=(",", ":")).encode() + b"\n" + body
+
+    @staticmethod
+    def _decode(value: bytes) -> TransportResponse:
+        header, _, body = value.partition(b"\n")
+        record = json.loads(header)
+        headers = CIMultiDict(record["headers"])
+        age = headers.get("Age", "0")
+        headers["Age"] = str(int((int(age) if age.isnumeric() else 0) + time.time() - record["stored"]))
+        return TransportResponse(
+            record["url"],
+            method=record["method"],
+            status=record["status"],
+            reason=record["reason"],
+            headers=headers,
+            body=body,
+            encoding=record["encoding"],
+        )
+
+
+class RecordingTransport(Transport):
+    """A transport that records every response obtained by another transport.
+
+    Responses are kept in memory until :meth:`save` is called, writing them as gzip compressed JSON lines.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    path: :class:`str`
+        The path of the archive file.
+    transport: :class:`Transport`
+        The transport performing the actual requests.
+
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], transport: Optional[Transport] = None):
+        self.path = path
+        self.transport = transport or LiveTransport()
+        self._records: list[dict[str, Any]] = []
+
+    @property
+    def recorded_count(self) -> int:
+        """The number of responses recorded."""
+        return len(self._records)
+
+    async def request(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        response = await self.transport.request(session, method, url, data, headers)
+        self._record(method, url, data, response)
+        return response
+
+    async def stream(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,
+            method: str,
+            url: str,
+            *,
+            consumer: Callable[[str], Any],
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,
+    ) -> TransportResponse:
+        response = await self.transport.stream(session, method, url, consumer=consumer, data=data, headers=headers)
+        self._record(method, url, data, response)
+        return response
+
+    def _record(self, method: str, url: str, data: Optional[dict[str, Any]], response: TransportResponse) -> None:
+        self._records.append({
+            "key": _request_key(method, url, data),
+            "url": response.url,
+            "method": response.method,
+            "status": response.status,
+            "reason": response.reason,
+            "headers": list(response.headers.items()),
+            "content": response.content,
+        })
+
+    def save(self) -> None:
+        """Write the recorded responses to the archive, replacing its previous contents."""
+        with gzip.open(self.path, "wt", encoding="utf-8") as f:
+            for record in self._records:
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+
+        log.info("Saved %d responses to %s", len(self._records), self.path)
+
+
+class ReplayTransport(Transport):
+    """A transport that serves responses from an archive created by a :class:`RecordingTransport`.
+
+    If the same request was recorded multiple times, the recorded responses are served in order, starting over once
+    all of them have been served.
+
+    Requests that were not recorded get a 404 response.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    latency: :class:`float`
+        The number of seconds to wait before serving each response, to simulate network latency.
+
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], *, latency: float = 0.0):
+        self.latency = latency
+        self._responses: dict[str, list[TransportResponse]] = {}
+        self._positions: dict[str, int] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                response = TransportResponse(
+                    record["url"],
+                    method=record["method"],
+                    status=record["status"],
+                    reason=record["reason"],
+                    headers=CIMultiDict(record["headers"]),
+                    content=record["content"],
+                )
+                self._responses.setdefault(record["key"], []).append(response)
+
+    async def request(  # noqa: D102
+            self,
+            session: aiohttp.ClientSession,  # noqa: ARG002
+            method: str,
+            url: str,
+            data: Optional[dict[str, Any]] = None,
+            headers: Optional[dict[str, Any]] = None,  # noqa: ARG002
+    ) -> TransportResponse:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        key = _request_key(method, url, data)
+        responses = self._responses.get(key)
+        if not responses:
+            log.warning("No recorded response for %s", key)
+            return TransportResponse(url, method=method, status=404, reason="Not Found", headers=CIMultiDict(),
+                                     content="")
+
+        position = self._positions.get(key, 0)
+        self._positions[key] = (position + 1) % len(responses)
+        return responses[position]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import datetime
+import html
 import re
 import urllib.parse
 from collections import defaultdict
@@ -14,6 +15,12 @@ from pydantic import BaseModel
 from tibiapy.errors import InvalidContentError
 
 TIBIA_CASH_PATTERN = re.compile(r"(\d*\.?\d*)\s?k*$")
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
+POPUP_CONTAINER_TAG = "tibiapy-popup"
+SELF_CLOSING_TAG_PATTERN = re.compile(
+    r"<(?!(?:area|base|br|col|embed|hr|img|input|link|meta|param|source|track|wbr)\b)"
+    r"([a-zA-Z][\w-]*)((?:\s[^<>]*?)?)\s*/>",
+)
 
 T = TypeVar("T")
 D = TypeVar("D")
@@ -477,17 +484,21 @@ def parse_tables_map(
 
 
 def parse_tibiacom_content(
-        content: str,
+        content: Union[str, bytes],
         *,
         html_class: str = "BoxContent",
         tag: str = "div",
         builder: str = "lxml",
+        encoding: str = "utf-8",
 ) -> bs4.BeautifulSoup:
     """Parse HTML content from Tibia.com into a BeautifulSoup object.
 
+    .. versionchanged:: 6.4.0
+        The content may be passed as :class:`bytes`, along with its encoding.
+
     Parameters
     ----------
-    content: :class:`str`
+    content: :class:`str` or :class:`bytes`
         The raw HTML content from Tibia.com
     html_class: :class:`str`
         The HTML class of the parsed element. The default value is ``BoxContent``.
@@ -495,6 +506,8 @@ def parse_tibiacom_content(
         The HTML tag select. The default value is ``div``.
     builder: :class:`str`
         The builder to use. The default value is ``lxml``.
+    encoding: :class:`str`
+        The encoding of the content, if passed as :class:`bytes`. The default value is ``utf-8``.
 
     Returns
     -------
@@ -503,7 +516,66 @@ def parse_tibiacom_content(
 
     """
     strainer = bs4.SoupStrainer(tag, class_=html_class) if builder != "html5lib" else None
-    return bs4.BeautifulSoup(content.replace("ISO-8859-1", "utf-8", 1), builder, parse_only=strainer)
+    return parse_markup(content, builder, parse_only=strainer, encoding=encoding)
+
+
+def parse_markup(
+        content: Union[str, bytes],
+        builder: str = "lxml",
+        *,
+        parse_only: Optional[bs4.SoupStrainer] = None,
+        encoding: str = "utf-8",
+) -> bs4.BeautifulSoup:
+    """Parse HTML content from Tibia.com, ignoring the encoding declared by the page.
+
+    Tibia.com's pages declare ``ISO-8859-1`` as their encoding, but they are actually encoded in ``utf-8``.
+
+    Content passed as :class:`bytes` is decoded by the builder using the given encoding, so the document is not copied
+    to fix the declaration.
+
+    Parameters
+    ----------
+    content: :class:`str` or :class:`bytes`
+        The raw HTML content from Tibia.com
+    builder: :class:`str`
+        The builder to use. The default value is ``lxml``.
+    parse_only: :class:`bs4.SoupStrainer`
+        A strainer used to only parse part of the document.
+    encoding: :class:`str`
+        The encoding of the content, if passed as :class:`bytes`. The default value is ``utf-8``.
+
+    Returns
+    -------
+    :class:`bs4.BeautifulSoup`
+        The parsed content.
+
+    """
+    if isinstance(content, bytes):
+        return bs4.BeautifulSoup(content, builder, parse_only=parse_only, from_encoding=encoding)
+
+    return bs4.BeautifulSoup(content.replace("ISO-8859-1", "utf-8", 1), builder, parse_only=parse_only)
+
+
+def repair_self_closing_tags(content: str) -> str:
+    """Remove the closing slash of non-void elements written as self-closing tags, e.g. ``<div />``.
+
+    Browsers and ``html5lib`` ignore the slash, treating them as opening tags, while ``lxml`` closes them immediately,
+    breaking the nesting of the rest of the document.
+
+    .. versionadded:: 6.4.0
+
+    Parameters
+    ----------
+    content: :class:`str`
+        The raw HTML content.
+
+    Returns
+    -------
+    :class:`str`
+        The content, with the self-closing tags of non-void elements replaced by opening tags.
+
+    """
+    return SELF_CLOSING_TAG_PATTERN.sub(r"<\1\2>", content)
 
 
 def parse_tibiacom_tables(parsed_content: bs4.BeautifulSoup) -> dict[str, bs4.Tag]:
@@ -624,6 +696,21 @@ def split_list(items: str, separator: str = ",", last_separator: str = " and ")
     return [e.strip() for e in items]
 
 
+def _split_popup(popup_content: str) -> tuple[str, str]:
+    """Split the javascript function that creates a popup into its title and HTML content."""
+    parts = popup_content.split(",", 2)
+    title = parts[1].replace("'", "").strip()
+    html_content = (
+        parts[-1]
+        .replace(r"\'", '"')
+        .replace("'", "")
+        .replace(",);", "")
+        .replace(", );", "")
+        .strip()
+    )
+    return title, html_content
+
+
 def parse_popup(popup_content: str) -> tuple[str, bs4.BeautifulSoup]:
     """Parse the information popups used through Tibia.com.
 
@@ -640,20 +727,67 @@ def parse_popup(popup_content: str) -> tuple[str, bs4.BeautifulSoup]:
         The parsed HTML content of the popup.
 
     """
-    parts = popup_content.split(",", 2)
-    title = parts[1].replace("'", "").strip()
-    html = (
-        parts[-1]
-        .replace(r"\'", '"')
-        .replace("'", "")
-        .replace(",);", "")
-        .replace(", );", "")
-        .strip()
-    )
-    parsed_html = bs4.BeautifulSoup(html, "lxml")
+    title, html_content = _split_popup(popup_content)
+    parsed_html = bs4.BeautifulSoup(html_content, "lxml")
     return title, parsed_html
 
 
+def parse_popups(popup_contents: Iterable[str]) -> list[tuple[str, bs4.Tag]]:
+    """Parse multiple information popups at once, using a single parse tree.
+
+    This is faster than calling :func:`parse_popup` for each popup of a page.
+
+    .. versionadded:: 6.4.0
+
+    Parameters
+    ----------
+    popup_contents:
+        The raw contents of the javascript functions that create the popups.
+
+    Returns
+    -------
+    :class:`list` of :class:`tuple`
+        The title and the element containing the parsed HTML content of each popup, in the same order.
+
+    """
+    popups = [_split_popup(popup_content) for popup_content in popup_contents]
+    if not popups:
+        return []
+
+    document = "".join(f"<{POPUP_CONTAINER_TAG}>{html_content}</{POPUP_CONTAINER_TAG}>" for _, html_content in popups)
+    parsed_html = bs4.BeautifulSoup(document, "lxml")
+    containers = parsed_html.find_all(POPUP_CONTAINER_TAG)
+    if len(containers) != len(popups) or any(c.find(POPUP_CONTAINER_TAG) for c in containers):
+        # A popup with broken markup swallowed the others, parse them separately instead.
+        return [(title, bs4.BeautifulSoup(html_content, "lxml")) for title, html_content in popups]
+
+    return [(title, container) for (title, _), container in zip(popups, containers)]
+
+
+def parse_popup_text(popup_content: str) -> tuple[str, str]:
+    """Get the title and text of an information popup, without building a parse tree.
+
+    This is meant for popups that only contain text, where only the text of :func:`parse_popup`'s content is needed.
+
+    .. versionadded:: 6.4.0
+
+    Parameters
+    ----------
+    popup_content: :class:`str`
+        The raw content of the javascript function that creates the popup.
+
+    Returns
+    -------
+    :class:`str`
+        The popup's title.
+    :class:`str`
+        The text of the popup's content.
+
+    """
+    title, html_content = _split_popup(popup_content)
+    return title, html.unescape(HTML_TAG_PATTERN.sub("", html_content))
+
+
 results_pattern = re.compile(r"Results: ([\d,]+)")
 page_pattern = re.compile(r"page=(\d+)")
 
@@ -0,0 +1,848 @@
+"""Components that periodically check Tibia.com for changes."""
+from __future__ import annotations
+
+import asyncio
+import datetime
+import heapq
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
+
+from tibiapy.enums import AuctionChangeType, AuctionStatus, CharacterActivity, CharacterChangeType
+from tibiapy.errors import TibiapyError
+from tibiapy.models import AuctionChange, CharacterChange
+from tibiapy.parsers import CharacterParser
+
+if TYPE_CHECKING:
+    from tibiapy.client import Client
+    from tibiapy.models import Auction, AuctionFilters, Character, TibiaResponse, World
+
+__all__ = (
+    "BazaarWatcher",
+    "CharacterScheduler",
+    "CharacterWatcher",
+)
+
+log = logging.getLogger("tibiapy")
+
+
+class BazaarWatcher:
+    """Detects changes in the current auctions of the character bazaar.
+
+    The watcher keeps the last seen bid and status of every auction, so each check only reports the auctions that were
+    added, changed or ended since the previous check.
+
+    The IDs of those auctions are queued, so only their detail pages need to be fetched, using :meth:`fetch_changed`.
+
+    Auctions can shift from one page to another while the pages are being fetched, so an auction is only considered
+    ended once it is missing from two consecutive checks.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    client: :class:`Client`
+        The client used to fetch the bazaar.
+    filters: :class:`AuctionFilters`
+        The filters to use when fetching the current auctions.
+    test: :class:`bool`
+        Whether to fetch from the test website or not.
+
+    """
+
+    def __init__(self, client: Client, filters: Optional[AuctionFilters] = None, *, test: bool = False):
+        self.client = client
+        self.filters = filters
+        self.test = test
+        self._seen: dict[int, tuple[int, AuctionStatus]] = {}
+        self._missing: set[int] = set()
+        self._queue: dict[int, None] = {}
+
+    @property
+    def tracked_count(self) -> int:
+        """The number of auctions currently being tracked."""
+        return len(self._seen)
+
+    @property
+    def queued_ids(self) -> list[int]:
+        """The IDs of the auctions that changed and haven't been fetched yet, in the order they were queued."""
+        return list(self._queue)
+
+    def process(self, auctions: Iterable[Auction], *, complete: bool = True) -> list[AuctionChange]:
+        """Compare a list of auctions with the last seen state, updating it.
+
+        Parameters
+        ----------
+        auctions:
+            The auctions currently listed.
+        complete:
+            Whether the auctions are the complete list of current auctions.
+            If :obj:`True`, tracked auctions that are not in this list nor in the previous complete list are
+            considered ended.
+
+        Returns
+        -------
+            The changes detected.
+
+        """
+        changes = []
+        listed = set()
+        for auction in auctions:
+            listed.add(auction.auction_id)
+            self._missing.discard(auction.auction_id)
+            previous = self._seen.get(auction.auction_id)
+            current = (auction.bid, auction.status)
+            if previous == current:
+                continue
+
+            self._seen[auction.auction_id] = current
+            if previous is None:
+                changes.append(AuctionChange(type=AuctionChangeType.ADDED, auction_id=auction.auction_id,
+                                             auction=auction))
+            else:
+                changes.append(AuctionChange(type=AuctionChangeType.CHANGED, auction_id=auction.auction_id,
+                                             auction=auction, previous_bid=previous[0], previous_status=previous[1]))
+
+        if complete:
+            for auction_id in [i for i in self._seen if i not in listed]:
+                if auction_id not in self._missing:
+                    self._missing.add(auction_id)
+                    continue
+
+                self._missing.remove(auction_id)
+                previous_bid, previous_status = self._seen.pop(auction_id)
+                changes.append(AuctionChange(type=AuctionChangeType.ENDED, auction_id=auction_id,
+                                             previous_bid=previous_bid, previous_status=previous_status))
+
+        for change in changes:
+            self._queue[change.auction_id] = None
+
+        return changes
+
+    async def check(self) -> list[AuctionChange]:
+        """Fetch all the pages of the current auctions and detect changes.
+
+        Returns
+        -------
+            The changes detected.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+
+        """
+        auctions = []
+        page = 1
+        total_pages = 1
+        while page <= total_pages:
+            response = await self.client.fetch_current_auctions(page, self.filters, test=self.test)
+            auctions.extend(response.data.entries)
+            total_pages = response.data.total_pages
+            page += 1
+
+        changes = self.process(auctions)
+        log.info("BazaarWatcher | %d auctions | %d changes", len(auctions), len(changes))
+        return changes
+
+    async def fetch_changed(
+            self,
+            **kwargs: Any,
+    ) -> AsyncIterator[tuple[int, Union[TibiaResponse[Optional[Auction]], Exception]]]:
+        """Fetch the details of the queued auctions.
+
+        Auctions are removed from the queue once fetched successfully, failed auctions remain queued.
+
+        Parameters
+        ----------
+        **kwargs:
+            The options passed to :meth:`Client.fetch_auctions`.
+
+        Yields
+        ------
+        tuple[int, TibiaResponse[Optional[Auction]] | Exception]
+            The ID of the auction, and either the response or the exception raised while fetching it.
+
+        """
+        kwargs.setdefault("test", self.test)
+        async for auction_id, result in self.client.fetch_auctions(list(self._queue), **kwargs):
+            if not isinstance(result, Exception):
+                self._queue.pop(auction_id, None)
+
+            yield auction_id, result
+
+
+class _CharacterState(NamedTuple):
+    fingerprint: Optional[str]
+    level: int
+    world: str
+    guild: Optional[str]
+    last_death: Optional[datetime.datetime]
+
+
+class CharacterWatcher:
+    """Periodically checks a list of characters, detecting new deaths, level changes, world transfers and guild changes.
+
+    Each check only builds the character if the relevant parts of its page changed since the last check.
+
+    Checks are spread evenly over an interval, and characters that are currently online are checked first, as they are
+    the most likely to change. Their online status is obtained from the world online lists, see :meth:`process_world`.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    client: :class:`Client`
+        The client used to fetch the characters.
+    interval: :class:`float`
+        The number of seconds in which all the characters are checked once.
+    test: :class:`bool`
+        Whether to fetch from the test website or not.
+
+    """
+
+    def __init__(self, client: Client, names: Iterable[str] = (), *, interval: float = 300.0, test: bool = False):
+        self.client = client
+        self.interval = interval
+        self.test = test
+        self._names: dict[str, str] = {}
+        self._seen: dict[str, _CharacterState] = {}
+        self._online: dict[str, set[str]] = {}
+        self.add(*names)
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the characters being watched."""
+        return list(self._names.values())
+
+    @property
+    def online_names(self) -> list[str]:
+        """The names of the watched characters that were last seen online."""
+        online = set().union(*self._online.values())
+        return [name for key, name in self._names.items() if key in online]
+
+    def add(self, *names: str) -> None:
+        """Add characters to the watchlist.
+
+        Parameters
+        ----------
+        *names:
+            The names of the characters.
+
+        """
+        for name in names:
+            self._names.setdefault(name.strip().lower(), name.strip())
+
+    def remove(self, *names: str) -> None:
+        """Remove characters from the watchlist.
+
+        Parameters
+        ----------
+        *names:
+            The names of the characters.
+
+        """
+        for name in names:
+            key = name.strip().lower()
+            self._names.pop(key, None)
+            self._seen.pop(key, None)
+            for online in self._online.values():
+                online.discard(key)
+
+    def last_world(self, name: str) -> Optional[str]:
+        """Get the world a character was in when it was last checked.
+
+        Parameters
+        ----------
+        name:
+            The name of the character.
+
+        Returns
+        -------
+            The name of the world, or :obj:`None` if the character hasn't been checked yet.
+
+        """
+        state = self._seen.get(name.strip().lower())
+        return state.world if state is not None else None
+
+    def schedule(self) -> list[str]:
+        """Get the order in which the characters will be checked in the next round.
+
+        Returns
+        -------
+            The names of the watched characters, with the online characters first.
+
+        """
+        online = set().union(*self._online.values())
+        return sorted(self._names.values(), key=lambda n: n.lower() not in online)
+
+    def process_world(self, world: World) -> int:
+        """Update the online status of the watched characters in a world, using its online list.
+
+        Parameters
+        ----------
+        world:
+            The world, in either its full or compact form.
+
+        Returns
+        -------
+            The number of watched characters that are online in the world.
+
+        """
+        online = {p.name.lower() for p in world.online_players} & self._names.keys()
+        self._online[world.name] = online
+        return len(online)
+
+    def process(self, character: Character, fingerprint: Optional[str] = None) -> list[CharacterChange]:
+        """Compare a character with its last seen state, updating it.
+
+        The first time a character is processed, its state is stored and no changes are reported.
+
+        Parameters
+        ----------
+        character:
+            The character, as currently seen.
+        fingerprint:
+            The fingerprint of the character's page, as returned by :meth:`CharacterParser.fingerprint`.
+
+        Returns
+        -------
+            The changes detected.
+
+        """
+        key = character.name.lower()
+        previous = self._seen.get(key)
+        last_death = character.deaths[0].time if character.deaths else None
+        if previous is not None and previous.last_death is not None and last_death is not None:
+            last_death = max(last_death, previous.last_death)
+
+        self._seen[key] = _CharacterState(fingerprint, character.level, character.world, character.guild_name,
+                                          last_death)
+        if previous is None:
+            return []
+
+        changes = [
+            CharacterChange(type=CharacterChangeType.DEATH, name=character.name, character=character, death=death)
+            for death in reversed(character.deaths)
+            if previous.last_death is None or death.time > previous.last_death
+        ]
+        if character.level != previous.level:
+            changes.append(CharacterChange(type=CharacterChangeType.LEVEL, name=character.name, character=character,
+                                           previous_level=previous.level))
+
+        if character.world != previous.world:
+            changes.append(CharacterChange(type=CharacterChangeType.WORLD, name=character.name, character=character,
+                                           previous_world=previous.world))
+
+        if character.guild_name != previous.guild:
+            changes.append(CharacterChange(type=CharacterChangeType.GUILD, name=character.name, character=character,
+                                           previous_guild=previous.guild))
+
+        return changes
+
+    async def check(self, name: str) -> list[CharacterChange]:
+        """Fetch a character and detect changes.
+
+        The character is only built if its fingerprint changed since the last check.
+
+        Parameters
+        ----------
+        name:
+            The name of the character.
+
+        Returns
+        -------
+            The changes detected.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+
+        """
+        page = (await self.client.fetch_character_page(name, test=self.test)).data
+        fingerprint = CharacterParser.fingerprint(page)
+        previous = self._seen.get(name.strip().lower())
+        if fingerprint is not None and previous is not None and previous.fingerprint == fingerprint:
+            return []
+
+        character = CharacterParser.from_content(page)
+        if character is None:
+            log.warning("CharacterWatcher | %s | character not found", name)
+            return []
+
+        return self.process(character, fingerprint)
+
+    async def check_online(self) -> int:
+        """Fetch the worlds of the watched characters, updating their online status.
+
+        Only the worlds the characters had when they were last checked are fetched.
+
+        Returns
+        -------
+            The number of watched characters that are online.
+
+        Raises
+        ------
+        Forbidden
+            If a 403 Forbidden error was returned.
+            This usually means that Tibia.com is rate-limiting the client because of too many requests.
+        NetworkError
+            If there's any connection errors during the request.
+
+        """
+        worlds = {state.world for key, state in self._seen.items() if key in self._names}
+        responses = await asyncio.gather(*(self.client.fetch_world(w, compact=True, test=self.test) for w in worlds))
+        self._online = {}
+        for response in responses:
+            if response.data is not None:
+                self.process_world(response.data)
+
+        return len(self.online_names)
+
+    async def watch(self, *, rounds: Optional[int] = None, track_online: bool = True) -> AsyncIterator[CharacterChange]:
+        """Check the characters continuously, yielding changes as they are detected.
+
+        In every round, the checks are started evenly spaced over :attr:`interval`, and performed concurrently, within
+        the client's limit of concurrent requests.
+
+        Errors while checking a character are logged, and the character is checked again in the next round.
+
+        Parameters
+        ----------
+        rounds:
+            The number of rounds to perform. By default, characters are checked until the iterator is closed.
+        track_online:
+            Whether to fetch the worlds of the characters at the start of each round, to check online characters first.
+
+        Yields
+        ------
+        CharacterChange
+            The changes detected.
+
+        """
+        loop = asyncio.get_running_loop()
+        pending: set[asyncio.Future] = set()
+        completed = 0
+        try:
+            while rounds is None or completed < rounds:
+                if track_online and self._seen:
+                    try:
+                        await self.check_online()
+                    except TibiapyError as e:
+                        log.warning("CharacterWatcher | failed to update online characters: %s", e)
+
+                names = self.schedule()
+                spacing = self.interval / max(len(names), 1)
+                next_start = loop.time()
+                for name in [*names, None]:
+                    while (timeout := next_start - loop.time()) > 0 or (name is None and pending):
+                        if not pending:
+                            await asyncio.sleep(timeout)
+                            break
+
+                        done, pending = await asyncio.wait(pending, timeout=max(timeout, 0) or None,
+                                                           return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            for change in task.result():
+                                yield change
+
+                    if name is not None:
+                        pending.add(asyncio.ensure_future(self._safe_check(name)))
+                        next_start += spacing
+
+                completed += 1
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _safe_check(self, name: str) -> list[CharacterChange]:
+        try:
+            return await self.check(name)
+        except TibiapyError as e:
+            log.warning("CharacterWatcher | %s | %s", name, e)
+            return []
+
+
+class CharacterScheduler:
+    """Decides how often each character in a watchlist is checked, based on their recent activity.
+
+    The online status of the characters is obtained from the online lists of their worlds, which are fetched
+    periodically. Characters are checked more often while they are online and shortly after they log out, which is when
+    deaths and level changes happen, and less often the longer they stay offline.
+
+    Characters are kept in a queue ordered by the time their next check is due, see :meth:`pop`. The requests per
+    second each activity level needs, and how the budget is allocated to them, can be obtained with :attr:`allocation`.
+
+    .. versionadded:: 6.4.0
+
+    Attributes
+    ----------
+    client: :class:`Client`
+        The client used to fetch the worlds and characters.
+    intervals: :class:`dict` of :class:`CharacterActivity` to :class:`float`
+        The number of seconds between checks of a character, for each activity level.
+    recent_period: :class:`float`
+        The number of seconds after logging out during which a character is considered recently online.
+    inactive_period: :class:`float`
+        The number of seconds after logging out after which a character is considered inactive.
+    budget: :class:`float`
+        The maximum number of requests per second, including the requests to fetch worlds. Must be greater than zero.
+    world_interval: :class:`float`
+        The number of seconds between fetches of each world's online list.
+    test: :class:`bool`
+        Whether to fetch from the test website or not.
+
+    """
+
+    DEFAULT_INTERVALS = {
+        CharacterActivity.ONLINE: 60.0,
+        CharacterActivity.RECENTLY_ONLINE: 120.0,
+        CharacterActivity.OFFLINE: 1800.0,
+        CharacterActivity.INACTIVE: 21600.0,
+    }
+    """The default number of seconds between checks, for each activity level."""
+
+    def __init__(
+            self,
+            client: Client,
+            names: Iterable[str] = (),
+            *,
+            worlds: Iterable[str] = (),
+            intervals: Optional[dict[CharacterActivity, float]] = None,
+            recent_period: float = 900.0,
+            inactive_period: float = 604800.0,
+            budget: float = 1.0,
+            world_interval: float = 60.0,
+            test: bool = False,
+    ):
+        if budget <= 0:
+            raise ValueError("budget must be greater than zero.")
+
+        self.client = client
+        self.intervals = {**self.DEFAULT_INTERVALS, **(intervals or {})}
+        self.recent_period = recent_period
+        self.inactive_period = inactive_period
+        self.budget = budget
+        self.world_interval = world_interval
+        self.test = test
+        self._names: dict[str, str] = {}
+        self._added: dict[str, float] = {}
+        self._last_online: dict[str, float] = {}
+        self._online: dict[str, set[str]] = {}
+        self._character_worlds: dict[str, str] = {}
+        self._worlds: dict[str, float] = dict.fromkeys(worlds, 0.0)
+        self._due: dict[str, float] = {}
+        self._queue: list[tuple[float, str]] = []
+        self.add(*names)
+
+    @property
+    def names(self) -> list[str]:
+        """The names of the characters being scheduled."""
+        return list(self._names.values())
+
+    @property
+    def worlds(self) -> list[str]:
+        """The worlds whose online lists are being fetched."""
+        return list(self._worlds)
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of characters whose check is currently due."""
+        now = time.time()
+        return sum(1 for due in self._due.values() if due <= now)
+
+    @property
+    def allocation(self) -> dict[CharacterActivity, tuple[float, float]]:
+        """The requests per second needed and allocated for each activity level.
+
+        The budget left after fetching the worlds is allocated to the activity levels in order, starting with online
+        characters. If an activity level gets less than it needs, its characters are checked less often than their
+        interval.
+
+        Returns
+        -------
+            A mapping of each activity level to a tuple with the requests per second it needs and the ones allocated.
+
+        """
+        now = time.time()
+        counts = dict.fromkeys(CharacterActivity, 0)
+        for key in self._names:
+            counts[self._activity(key, now)] += 1
+
+        remaining = max(self.budget - len(self._worlds) / self.world_interval, 0.0)
+        allocation = {}
+        for activity in CharacterActivity:
+            needed = counts[activity] / self.intervals[activity]
+            allocation[activity] = (needed, min(needed, remaining))
+            remaining = max(remaining - needed, 0.0)
+
+        return allocation
+
+    def add(self, *names: str, world: Optional[str] = None) -> None:
+        """Add characters to the schedule. Their first check is due immediately.
+
+        Parameters
+        ----------
+        *names:
+            The names of the characters.
+        world:
+            The world of the characters, if known, so its online list is fetched.
+
+        """
+        now = time.time()
+        for name in names:
+            key = name.strip().lower()
+            if key not in self._names:
+                self._names[key] = name.strip()
+                self._added[key] = now
+                self._schedule(key, now)
+
+            if world is not None:
+                self._set_world(key, world)
+
+    def remove(self, *names: str) -> None:
+        """Remove characters from the schedule.
+
+        Parameters
+        ----------
+        *names:
+            The names of the characters.
+
+        """
+        for name in names:
+            key = name.strip().lower()
+            self._names.pop(key, None)
+            self._added.pop(key, None)
+            self._last_online.pop(key, None)
+            self._character_worlds.pop(key, None)
+            self._due.pop(key, None)
+            for online in self._online.values():
+                online.discard(key)
+
+    def activity(self, name: str) -> CharacterActivity:
+        """Get the current activity level of a character.
+
+        Parameters
+        ----------
+        name:
+            The name of the character.
+
+        Returns
+        -------
+            The activity level of the character.
+
+        """
+        return self._activity(name.strip().lower(), time.time())
+
+    def process_world(self, world: World) -> int:
+        """Update the online status of the scheduled characters, using a world's online list.
+
+        Characters that just logged in have their check rescheduled if it would be due later than their new interval.
+
+        Parameters
+        ----------
+        world:
+            The world, in either its full or compact form.
+
+        Returns
+        -------
+            The number of scheduled characters that are online in the world.
+
+        """
+        now = time.time()
+        online = {p.name.lower() for p in world.online_players} & self._names.keys()
+        previous = self._online.get(world.name, set())
+        self._online[world.name] = online
+        for key in online:
+            self._last_online[key] = now
+            self._set_world(key, world.name)
+
+        for key in online - previous:
+            self._schedule(key, min(self._due[key], now + self.intervals[CharacterActivity.ONLINE]))
+
+        return len(online)
+
+    def process_character(self, character: Character) -> None:
+        """Update the known world and last login of a scheduled character, using their information.
+
+        Parameters
+        ----------
+        character:
+            The character, as currently seen.
+
+        """
+        key = character.name.lower()
+        if key not in self._names:
+            return
+
+        self._set_world(key, character.world)
+        if character.last_login is not None:
+            self._last_online[key] = max(self._last_online.get(key, 0.0), character.last_login.timestamp())
+
+    def pop(self, limit: Optional[int] = None) -> list[str]:
+        """Get the characters whose check is due, rescheduling them according to their activity level.
+
+        Parameters
+        ----------
+        limit:
+            The maximum number of characters to get.
+
+        Returns
+        -------
+            The names of the characters, ordered by the time their check was due.
+
+        """
+        now = time.time()
+        names = []
+        while self._queue and self._queue[0][0] <= now and (limit is None or len(names) < limit):
+            due, key = heapq.heappop(self._queue)
+            if self._due.get(key) != due:
+                continue
+
+            names.append(self._names[key])
+            self._schedule(key, now + self.intervals[self._activity(key, now)])
+
+        return names
+
+    async def run(
+            self,
+            check: Optional[Callable[[str], Awaitable[Any]]] = None,
+            *,
+            watcher: Optional[CharacterWatcher] = None,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Check the characters continuously as they are due, without exceeding the budget.
+
+        The online lists of the worlds are fetched as part of the same budget.
+
+        Parameters
+        ----------
+        check:
+            The coroutine function used to check each character.
+            By default, characters are checked using the watcher if set, or fetched using
+            :meth:`Client.fetch_character`.
+        watcher:
+            A watcher used to check the characters, detecting their changes.
+            The worlds of the characters are taken from the watcher's state after every check.
+
+        Yields
+        ------
+        tuple[str, Any]
+            The name of the character, and either the result of the check or the exception raised while checking it.
+
+        """
+        check = check or (watcher.check if watcher is not None else self._fetch_character)
+        loop = asyncio.get_running_loop()
+        pending: set[asyncio.Future] = set()
+        next_start = loop.time()
+        try:
+            while True:
+                timeout = max(next_start - loop.time(), 0)
+                if pending:
+                    done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        name, result = task.result()
+                        if name is not None:
+                            yield name, result
+                else:
+                    await asyncio.sleep(timeout)
+
+                if loop.time() < next_start:
+                    continue
+
+                next_start = max(next_start, loop.time() - 1 / self.budget) + 1 / self.budget
+                world = self._next_world()
+                if world is not None:
+                    pending.add(asyncio.ensure_future(self._fetch_world(world)))
+                    continue
+
+                names = self.pop(1)
+                if names:
+                    pending.add(asyncio.ensure_future(self._check(check, names[0], watcher)))
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _activity(self, key: str, now: float) -> CharacterActivity:
+        if any(key in online for online in self._online.values()):
+            return CharacterActivity.ONLINE
+
+        last_online = self._last_online.get(key)
+        if last_online is None:
+            # Characters that haven't been seen online can't be recently online.
+            tracked_time = now - self._added[key]
+            return CharacterActivity.INACTIVE if tracked_time >= self.inactive_period else CharacterActivity.OFFLINE
+
+        offline_time = now - last_online
+        if offline_time <= self.recent_period:
+            return CharacterActivity.RECENTLY_ONLINE
+
+        if offline_time >= self.inactive_period:
+            return CharacterActivity.INACTIVE
+
+        return CharacterActivity.OFFLINE
+
+    def _schedule(self, key: str, due: float) -> None:
+        self._due[key] = due
+        heapq.heappush(self._queue, (due, key))
+
+    def _set_world(self, key: str, world: str) -> None:
+        previous = self._character_worlds.get(key)
+        self._character_worlds[key] = world
+        if previous is not None and previous != world:
+            self._online.get(previous, set()).discard(key)
+
+        self._worlds.setdefault(world, 0.0)
+
+    def _next_world(self) -> Optional[str]:
+        now = time.time()
+        for world, last_fetched in self._worlds.items():
+            if now - last_fetched >= self.world_interval:
+                self._worlds[world] = now
+                return world
+
+        return None
+
+    async def _fetch_world(self, world: str) -> tuple[None, None]:
+        try:
+            response = await self.client.fetch_world(world, compact=True, test=self.test)
+            if response.data is not None:
+                self.process_world(response.data)
+        except TibiapyError as e:
+            log.warning("CharacterScheduler | %s | %s", world, e)
+        except Exception:
+            # The characters can still be checked without the world's online list, so the run keeps going.
+            log.exception("CharacterScheduler | %s | Failed to process world", world)
+
+        return None, None
+
+    async def _fetch_character(self, name: str) -> TibiaResponse[Optional[Character]]:
+        response = await self.client.fetch_character(name, test=self.test)
+        if response.data is not None:
+            self.process_character(response.data)
+
+        return response
+
+    async def _check(
+            self,
+            check: Callable[[str], Awaitable[Any]],
+            name: str,
+            watcher: Optional[CharacterWatcher] = None,
+    ) -> tuple[str, Any]:
+        try:
+            result = await check(name)
+        except Exception as e:
+            return name, e
+
+        key = name.strip().lower()
+        if watcher is not None and key in self._names and (world := watcher.last_world(name)) is not None:
+            self._set_world(key, world)
+
+        return name, result